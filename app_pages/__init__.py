@@ -0,0 +1,34 @@
+# app_pages - one module per page of the Streamlit app
+"""Each page lives in its own module with a ``render()`` function.
+
+A page module is imported the first time the page is shown, so a cold
+start only pays for the libraries of the page being viewed (plotly for
+the charts, requests for market data, pdfplumber for PDF uploads). On
+later reruns the module is already in ``sys.modules`` and only
+``render()`` runs. Not named ``pages`` so Streamlit's multipage
+discovery leaves it alone.
+"""
+import importlib
+import time
+
+import streamlit as st
+
+from salary_ai.config import PAGE_MODULES
+
+PAGES = list(PAGE_MODULES)
+
+
+def render_page(page: str):
+    """Import ``page``'s module if needed and render it, timing both steps.
+
+    The last timings are kept in ``st.session_state.page_timings`` as
+    ``(page, import_ms, render_ms)``, also when the page calls ``st.stop()``.
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(PAGE_MODULES[page])
+    imported = time.perf_counter()
+    try:
+        module.render()
+    finally:
+        st.session_state.page_timings = (page, (imported - start) * 1000,
+                                         (time.perf_counter() - imported) * 1000)
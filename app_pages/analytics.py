@@ -0,0 +1,170 @@
+# analytics.py - Data Analytics page
+import plotly.express as px
+import streamlit as st
+
+from salary_ai.charts import box_figure, histogram_figure, scatter_figure, violin_figure
+from salary_ai.config import DATA_PATH
+from salary_ai.cube import SalaryCube, analytics_frame
+from salary_ai.data import load_clean_data
+from salary_ai.errors import SalarySystemError
+from salary_ai.synthetic import generate_sample_data
+
+
+# -------------------------------
+# ANALYTICS DATA & CUBE
+# -------------------------------
+@st.cache_resource
+def load_analytics_data(source, sample_size):
+    # Rows for the charts plus the aggregate cube that answers filters and summaries
+    if source == "Salary_Data.csv":
+        frame = analytics_frame(load_clean_data(DATA_PATH))
+    else:
+        frame = analytics_frame(generate_sample_data(sample_size, seed=42))
+    return frame, SalaryCube.from_frame(frame)
+
+
+# =================================================================
+# PAGE
+# =================================================================
+def render():
+    st.markdown("""
+    <div class="hero-section">
+        <h1 class="hero-title">📊 Salary Analytics Dashboard</h1>
+        <p class="hero-subtitle">Interactive visualizations and market insights</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Controls
+    col_controls1, col_controls2, col_controls3 = st.columns(3)
+
+    with col_controls1:
+        data_source = st.selectbox("Data Source", ["Salary_Data.csv", "Synthetic Sample"])
+        sample_size = st.slider("Sample Size", 100, 5000, 1000, disabled=data_source != "Synthetic Sample")
+        chart_style = st.selectbox("Chart Style", ["Professional", "Colorful", "Minimal"])
+
+    with col_controls2:
+        show_trendline = st.checkbox("Show Trend Lines", True)
+        animate_charts = st.checkbox("Animate Charts", False)
+
+    try:
+        all_data, salary_cube = load_analytics_data(data_source, sample_size)
+    except SalarySystemError as e:
+        st.error(f"❌ Could not load analytics data: {e}")
+        st.stop()
+
+    # Salary_Data.csv has no Industry column; filter and summarise by Education there
+    group_dimension = "Industry" if "Industry" in salary_cube.dimensions else "Education"
+    group_label = group_dimension.replace("_", " ")
+
+    with col_controls3:
+        filter_values = st.multiselect(
+            f"Filter {group_label}",
+            salary_cube.members(group_dimension) + ["All"],
+            default=["All"]
+        )
+
+    # Apply filters: aggregates come from the cube, rows are only kept for the charts
+    if "All" not in filter_values:
+        salary_cube = salary_cube.slice({group_dimension: filter_values})
+        sample_data = all_data[all_data[group_dimension].isin(filter_values)]
+    else:
+        sample_data = all_data
+    overall = salary_cube.rollup().iloc[0]
+
+    # INTERACTIVE DASHBOARD TABS
+    analytics_tab1, analytics_tab2, analytics_tab3, analytics_tab4 = st.tabs(
+        ["📈 Overview", "💼 Job Analysis", "🎓 Education & Experience", "📍 Geographic Insights"]
+    )
+
+    with analytics_tab1:
+        # Key Metrics
+        col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+        with col_m1:
+            st.metric("Avg Salary", f"${overall['mean']:,.0f}")
+        with col_m2:
+            st.metric("Median Salary", f"${overall['median']:,.0f}")
+        with col_m3:
+            st.metric("Records", int(overall['count']))
+        with col_m4:
+            st.metric("Std Deviation", f"${overall['std']:,.0f}")
+
+        # Salary Distribution
+        fig_dist = histogram_figure(
+            sample_data['Salary'], nbins=30,
+            title='Salary Distribution',
+            color='#4CAF50', x_title='Salary'
+        )
+        st.plotly_chart(fig_dist, use_container_width=True)
+
+    with analytics_tab2:
+        col_j1, col_j2 = st.columns(2)
+        with col_j1:
+            # Salary by Job Title
+            fig_job = box_figure(
+                sample_data, x='Job_Title', y='Salary',
+                title='Salary Distribution by Job Title',
+                outliers=True
+            )
+            fig_job.update_layout(xaxis_tickangle=45)
+            st.plotly_chart(fig_job, use_container_width=True)
+
+        with col_j2:
+            # Top Paying Jobs
+            top_jobs = salary_cube.rollup(['Job_Title'])['mean'].nlargest(10)
+            fig_top = px.bar(
+                x=top_jobs.values, y=top_jobs.index,
+                title='Top 10 Highest Paying Jobs',
+                orientation='h',
+                color=top_jobs.values,
+                color_continuous_scale='Viridis'
+            )
+            st.plotly_chart(fig_top, use_container_width=True)
+
+    with analytics_tab3:
+        col_e1, col_e2 = st.columns(2)
+        with col_e1:
+            # Salary by Education
+            fig_edu = violin_figure(
+                sample_data, x='Education', y='Salary',
+                title='Salary Distribution by Education Level',
+                points=True
+            )
+            st.plotly_chart(fig_edu, use_container_width=True)
+
+        with col_e2:
+            # Experience vs Salary
+            fig_exp = scatter_figure(
+                sample_data, x='Experience', y='Salary',
+                color='Education', size='Age',
+                title='Experience vs Salary by Education',
+                trendline=show_trendline
+            )
+            st.plotly_chart(fig_exp, use_container_width=True)
+
+    with analytics_tab4:
+        if "Location" not in salary_cube.dimensions:
+            st.info("📍 This data source has no location data. Switch to the synthetic sample for geographic insights.")
+        else:
+            col_g1, col_g2 = st.columns(2)
+            with col_g1:
+                # Salary by Location
+                fig_loc = box_figure(
+                    sample_data, x='Location', y='Salary',
+                    title='Salary by Location'
+                )
+                st.plotly_chart(fig_loc, use_container_width=True)
+
+            with col_g2:
+                # Heatmap: Industry vs Location, rolled up from the cube
+                heatmap_data = salary_cube.rollup(['Industry', 'Location'])['mean'].unstack('Location')
+                fig_heat = px.imshow(
+                    heatmap_data,
+                    title='Average Salary: Industry vs Location',
+                    color_continuous_scale='RdBu'
+                )
+                st.plotly_chart(fig_heat, use_container_width=True)
+
+    # Summary Statistics Table, rolled up from the cube
+    st.markdown(f"### 📋 Summary Statistics by {group_label}")
+    summary_stats = salary_cube.summary(group_dimension)
+    st.dataframe(summary_stats, use_container_width=True)
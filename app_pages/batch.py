@@ -0,0 +1,480 @@
+# batch.py - Batch Prediction page (CSV/PDF uploads, streaming, exports)
+import os
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import fetch_market_data, get_explainer, get_scorer, load_model_version
+from salary_ai.batch import CsvSink, missing_columns, prepare_batch, probe_chunk_size, score_csv_stream
+from salary_ai.config import BATCH_MEMORY_BUDGET, OPTIONAL_SKILLS, REQUIRED_COLUMNS, STREAM_UPLOAD_THRESHOLD
+from salary_ai.errors import BatchValidationError, SalarySystemError
+from salary_ai.explain import BatchExplainer, ParallelExplainer
+from salary_ai.export import (
+    REPORT_FORMAT,
+    ROW_FORMATS,
+    XLSX_FORMAT,
+    export_rows,
+    frame_chunks,
+    spooled_chunks,
+    summary_report,
+    summary_sheets,
+    write_summary_xlsx,
+)
+from salary_ai.parallel import ParallelBatchScorer
+from salary_ai.pdf_tables import read_pdf_tables
+from salary_ai.schema import apply_schema, csv_dtypes
+from salary_ai.summary import BatchSummary
+from salary_ai.upload_cache import UploadCache, content_hash
+
+
+# -------------------------------
+# UPLOAD CACHE (parsed, prepared and scored uploads across reruns)
+# -------------------------------
+@st.cache_resource
+def get_upload_cache():
+    return UploadCache()
+
+
+def upload_digest(uploaded_file):
+    # Each upload is hashed once per session; reruns reuse the digest
+    digests = st.session_state.setdefault("upload_digests", {})
+    key = upload_key(uploaded_file)
+    if key not in digests:
+        digests[key] = content_hash(uploaded_file)
+    return digests[key]
+
+
+def prepare_upload(parsed, market_index):
+    # apply_schema returns new frames, so the cached parsed frame is not modified
+    ingest = apply_schema(parsed)
+    prepare_batch(ingest.frame, market_index)
+    return ingest
+
+
+def score_prepared(prepared, explain=False):
+    # The prepared frame is cached, so predictions go on a copy
+    scored = prepared.copy()
+    scored["Predicted_Salary"] = get_scorer().predict_batch(prepared)
+    batch_explainer = get_batch_explainer() if explain else None
+    if batch_explainer is not None:
+        scored = scored.join(batch_explainer(scored))
+    return scored, BatchSummary.from_frame(scored)
+
+
+# -------------------------------
+# EXPLANATIONS (top SHAP factors per row)
+# -------------------------------
+def get_batch_explainer(workers=1):
+    # Blocks of rows share one SHAP call; with workers > 1 the blocks go to a process pool
+    if workers > 1:
+        return get_parallel_explainer(workers)
+    explainer, scorer = get_explainer(), get_scorer()
+    return BatchExplainer(explainer, scorer.builder) if explainer is not None else None
+
+
+@st.cache_resource
+def get_parallel_explainer(workers):
+    # One pool per worker count; each worker builds its TreeExplainer once
+    explainer = ParallelExplainer(workers=workers)
+    explainer.warm_up()
+    return explainer
+
+
+def explain_checkbox(key):
+    return st.checkbox("🧠 Explain each prediction (top factors per row)", value=False, key=key,
+                       help="Adds the row's largest SHAP contributions as Top_<i>_Factor / Top_<i>_Impact columns")
+
+
+# -------------------------------
+# PDF PROCESSING FUNCTION (for batch prediction)
+# -------------------------------
+def process_pdf_file(uploaded_file):
+    # Pages are extracted in a process pool (pdfplumber, no Java); cached by content hash by the caller.
+    # Extraction errors are shown and stop the run, so callers always get a frame.
+    try:
+        return read_pdf_tables(uploaded_file)
+    except BatchValidationError as e:
+        st.error(f"❌ {e}")
+        st.info(f"Required columns: {REQUIRED_COLUMNS}")
+    except SalarySystemError as e:
+        st.error(f"❌ {e}")
+        st.info("For now, please use CSV files.")
+    except Exception as e:
+        st.error(f"PDF processing error: {str(e)}")
+    st.stop()
+
+
+# -------------------------------
+# STREAMING BATCH FUNCTION (large CSV uploads)
+# -------------------------------
+@st.cache_resource
+def get_parallel_scorer(workers):
+    # One pool per worker count; each worker loads the model once
+    scorer = ParallelBatchScorer(workers=workers)
+    scorer.warm_up()
+    return scorer
+
+
+def upload_chunk_size(uploaded_file):
+    # Probed once per upload; reruns reuse the estimate
+    sizes = st.session_state.setdefault("upload_chunk_sizes", {})
+    key = upload_key(uploaded_file)
+    if key not in sizes:
+        sizes[key] = probe_chunk_size(uploaded_file)
+    return sizes[key]
+
+
+def render_streaming_batch(uploaded_file):
+    # Only a few rows are parsed up front; scoring reads the upload chunk by chunk
+    header = pd.read_csv(uploaded_file, nrows=5)
+    uploaded_file.seek(0)
+    st.dataframe(header)
+
+    missing_cols = missing_columns(header.columns)
+    if missing_cols:
+        st.error(f"❌ Missing required columns: {missing_cols}")
+        st.info(f"Required columns: {REQUIRED_COLUMNS}")
+        return
+
+    # Sized from the upload's first rows so one chunk's working set fits BATCH_MEMORY_BUDGET
+    budget_rows = min(upload_chunk_size(uploaded_file), 1_000_000)
+    chunk_size = st.number_input("Rows per chunk", min_value=1_000, max_value=1_000_000,
+                                 value=budget_rows, step=1_000,
+                                 help=f"Defaults to what fits {BATCH_MEMORY_BUDGET // 2**20} MB of memory")
+    workers = st.number_input("Worker processes", min_value=1, max_value=os.cpu_count() or 1,
+                              value=1, step=1, help="Shard each chunk across a process pool")
+    explain = explain_checkbox("stream-explain")
+
+    if st.button("🚀 Generate Batch Predictions", use_container_width=True, type="primary"):
+        scorer = get_scorer()
+        if scorer is None:
+            st.error("❌ Model not loaded. Cannot make predictions.")
+            return
+
+        progress_bar = st.progress(0.0, text="Starting...")
+
+        def report(rows, fraction):
+            progress_bar.progress(fraction or 0.0, text=f"Scored {rows:,} records")
+
+        if workers > 1:
+            # Chunks over PREDICTION_CACHE_MAX_ROWS skip the cache but are scored at the bucketed market index
+            parallel = scorer.with_prediction_cache(get_parallel_scorer(int(workers)).predict)
+            predict = lambda frame: parallel.predict(scorer.builder.frame(frame))
+        else:
+            predict = scorer.predict_batch
+        market_index, _ = fetch_market_data()
+        rejects = CsvSink()
+        result = score_csv_stream(uploaded_file, predict, market_index,
+                                  # Left unchanged, the reader sizes its chunks from the budget itself
+                                  chunk_size=None if chunk_size == budget_rows else int(chunk_size),
+                                  progress=report, rejects=rejects,
+                                  explain=get_batch_explainer(int(workers)) if explain else None)
+        progress_bar.progress(1.0, text=f"Scored {result.rows:,} records")
+
+        # Kept across reruns, so preparing an export does not drop the results
+        st.session_state.stream_result = (upload_key(uploaded_file), result, rejects.output)
+
+    stream_result = st.session_state.get("stream_result")
+    if stream_result is None or stream_result[0] != upload_key(uploaded_file):
+        return
+    result, rejects_output = stream_result[1:]
+
+    st.markdown(f"""
+    <div class="result-container">
+        <h2>✅ Batch Processing Complete!</h2>
+        <p>Successfully processed {result.rows:,} employee records in {result.chunks} chunks
+        ({result.rows_per_sec:,.0f} rows/sec)</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.caption(f"🧮 {result.ingest.describe()}")
+    render_rejects(result.ingest.rejected, lambda: download_data(rejects_output))
+    render_summary_metrics(result.summary)
+
+    st.markdown("### 🔍 Preview")
+    st.dataframe(result.preview, use_container_width=True)
+    st.download_button(
+        label="📄 Download as CSV",
+        data=lambda: download_data(result.output),
+        file_name=f"salary_predictions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv",
+        on_click="ignore",
+        use_container_width=True
+    )
+
+    # Other formats are converted from the spooled CSV, one chunk at a time
+    st.markdown("### 📥 Other Formats")
+    render_export_panel(
+        f"stream-{upload_key(uploaded_file)}",
+        lambda: spooled_chunks(result.output),
+        sheets=lambda: summary_sheets(result.summary),
+        report=lambda: summary_report(result.summary),
+        formats=[f for f in ROW_FORMATS if f != "csv"]
+    )
+
+
+def render_rejects(count, data):
+    if count:
+        st.warning(f"⚠️ {count:,} rows failed validation and were not scored")
+        st.download_button(
+            label="📥 Download Rejected Rows",
+            data=data,
+            file_name="rejected_rows.csv",
+            mime="text/csv",
+            on_click="ignore"
+        )
+
+
+def render_summary_metrics(summary):
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Average", f"${summary.mean:,.0f}")
+    with col2:
+        st.metric("Highest", f"${summary.max:,.0f}")
+    with col3:
+        st.metric("Lowest", f"${summary.min:,.0f}")
+    with col4:
+        st.metric("Median", f"${summary.median:,.0f}")
+
+
+# -------------------------------
+# EXPORTS
+# -------------------------------
+def upload_key(uploaded_file):
+    return getattr(uploaded_file, "file_id", None) or f"{uploaded_file.name}-{uploaded_file.size}"
+
+
+def download_data(output):
+    # st.download_button only takes bytes, str or in-memory buffers, not spooled files. Buttons
+    # pass it in a lambda, so the file is only read into memory when the button is clicked
+    if hasattr(output, "read"):
+        output.seek(0)
+        return output.read()
+    return output
+
+
+def render_export_panel(result_key, chunks, sheets=None, report=None, formats=None):
+    # Files are only written when "Prepare Export" is clicked, then kept for this result
+    options = {f: ROW_FORMATS[f] for f in (formats or ROW_FORMATS)}
+    if sheets is not None:
+        options["xlsx"] = XLSX_FORMAT
+    if report is not None:
+        options["txt"] = REPORT_FORMAT
+
+    fmt = st.selectbox("Export format", list(options), format_func=lambda f: options[f].label,
+                       key=f"{result_key}-format")
+    export_format = options[fmt]
+
+    if st.button("📦 Prepare Export", use_container_width=True, key=f"{result_key}-prepare"):
+        with st.spinner(f"Writing {export_format.label}..."):
+            if fmt == "xlsx":
+                output = write_summary_xlsx(sheets())
+            elif fmt == "txt":
+                output = report()
+            else:
+                output = export_rows(chunks(), fmt)
+        st.session_state.prepared_export = ((result_key, fmt), output)
+
+    prepared = st.session_state.get("prepared_export")
+    if prepared is not None and prepared[0] == (result_key, fmt):
+        stem = "salary_report" if fmt in ("xlsx", "txt") else "salary_predictions"
+        st.download_button(
+            label=f"📄 Download {export_format.label}",
+            data=lambda: download_data(prepared[1]),
+            file_name=f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format.extension}",
+            mime=export_format.mime,
+            on_click="ignore",
+            use_container_width=True,
+            key=f"{result_key}-download"
+        )
+
+# =================================================================
+# PAGE
+# =================================================================
+def render():
+    st.markdown("""
+    <div class="hero-section">
+        <h1 class="hero-title">📁 Batch Salary Predictor</h1>
+        <p class="hero-subtitle">Upload CSV or PDF files to process multiple employees</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Upload section
+    st.markdown('<div class="form-container">', unsafe_allow_html=True)
+
+    uploaded_file = st.file_uploader(
+        "Choose your file",
+        type=["csv", "pdf"],
+        help="Upload CSV or PDF files with employee data"
+    )
+
+    # Required columns for your model
+    required_columns = REQUIRED_COLUMNS
+
+    # Optional columns
+    optional_skills = OPTIONAL_SKILLS
+
+    stream_mode = False
+    if uploaded_file is not None and uploaded_file.type != "application/pdf":
+        stream_mode = st.checkbox(
+            "⚡ Stream in chunks (large files)",
+            value=uploaded_file.size > STREAM_UPLOAD_THRESHOLD,
+            help="Score the file chunk by chunk with bounded memory"
+        )
+
+    if uploaded_file is not None and stream_mode:
+        try:
+            render_streaming_batch(uploaded_file)
+        except Exception as e:
+            st.error(f"❌ Error processing file: {str(e)}")
+
+    elif uploaded_file is not None:
+        file_type = uploaded_file.type
+
+        try:
+            # Parsing, preparing and scoring are cached on the upload's content hash
+            digest = upload_digest(uploaded_file)
+            upload_cache = get_upload_cache()
+
+            if file_type == "application/pdf":
+                st.info("📄 Processing PDF file...")
+                batch_data = upload_cache.get_or_compute(("frame", digest),
+                                                         lambda: process_pdf_file(uploaded_file))
+
+                st.success(f"✅ Extracted {len(batch_data)} records from PDF")
+                st.dataframe(batch_data.head())
+
+                # Check columns
+                missing_cols = set(required_columns) - set(batch_data.columns)
+                if missing_cols:
+                    st.warning(f"Missing columns: {missing_cols}")
+                    st.info("Please ensure your PDF table contains all required columns")
+
+                    # Provide template
+                    template_df = pd.DataFrame(columns=required_columns)
+                    csv_template = template_df.to_csv(index=False)
+                    st.download_button(
+                        label="📥 Download CSV Template",
+                        data=csv_template,
+                        file_name="salary_template.csv",
+                        mime="text/csv"
+                    )
+                    st.stop()
+
+            else:  # CSV file
+                batch_data = upload_cache.get_or_compute(("frame", digest),
+                                                         lambda: pd.read_csv(uploaded_file, dtype=csv_dtypes()))
+                st.success(f"✅ Loaded {len(batch_data)} records from CSV")
+                st.dataframe(batch_data.head())
+
+            # Validate columns
+            missing_cols = set(required_columns) - set(batch_data.columns)
+            if missing_cols:
+                st.error(f"❌ Missing required columns: {list(missing_cols)}")
+                st.info(f"Required columns: {required_columns}")
+            else:
+                # Type and validate rows, then add market data (the parsed frame stays as cached)
+                market_index, _ = fetch_market_data()
+                parsed_data = batch_data
+                ingest = upload_cache.get_or_compute(("prepared", digest, market_index),
+                                                     lambda: prepare_upload(parsed_data, market_index))
+                batch_data = ingest.frame
+                st.caption(f"🧮 {ingest.stats.describe()}")
+                render_rejects(ingest.stats.rejected, lambda: ingest.rejects.to_csv(index=False))
+                if batch_data.empty:
+                    st.error("❌ No valid rows to score.")
+                    st.stop()
+
+                # Show preview
+                with st.expander("🔍 Preview Prepared Data"):
+                    st.dataframe(batch_data.head())
+
+                explain = explain_checkbox("batch-explain")
+                if st.button("🚀 Generate Batch Predictions", use_container_width=True, type="primary"):
+                    if get_scorer() is not None:
+                        with st.spinner(f"Processing {len(batch_data)} records..."):
+                            prepared_data = batch_data
+                            scored = upload_cache.get_or_compute(
+                                ("scored", digest, load_model_version(), market_index, explain),
+                                lambda: score_prepared(prepared_data, explain)
+                            )
+                        # Kept across reruns, so preparing an export does not drop the results
+                        st.session_state.batch_results = (digest, *scored)
+                    else:
+                        st.error("❌ Model not loaded. Cannot make predictions.")
+
+                batch_results = st.session_state.get("batch_results")
+                if batch_results is not None and batch_results[0] == digest:
+                    batch_data, summary = batch_results[1:]
+                    # plotly is only imported once there are results to chart
+                    from salary_ai.charts import box_figure, histogram_figure
+
+                    # SUCCESS MESSAGE
+                    st.markdown(f"""
+                    <div class="result-container">
+                        <h2>✅ Batch Processing Complete!</h2>
+                        <p>Successfully processed {len(batch_data)} employee records</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                    # INTERACTIVE RESULTS TABS
+                    result_tab1, result_tab2, result_tab3, result_tab4 = st.tabs(
+                        ["📈 Overview", "📋 Data Table", "📊 Analytics", "📥 Export"]
+                    )
+
+                    with result_tab1:
+                        # Key Metrics
+                        render_summary_metrics(summary)
+
+                        # Distribution Chart
+                        fig_dist = histogram_figure(
+                            batch_data['Predicted_Salary'],
+                            nbins=20,
+                            title='Salary Distribution',
+                            color='#4CAF50' if st.session_state.theme == 'Dark' else '#2E86AB',
+                            x_title='Predicted_Salary'
+                        )
+                        st.plotly_chart(fig_dist, use_container_width=True)
+
+                    with result_tab2:
+                        # Interactive Data Table
+                        st.dataframe(batch_data, use_container_width=True, height=400)
+
+                    with result_tab3:
+                        # Analytics Charts
+                        col_a, col_b = st.columns(2)
+                        with col_a:
+                            if 'Industry' in batch_data.columns:
+                                fig_ind = box_figure(
+                                    batch_data,
+                                    x='Industry',
+                                    y='Predicted_Salary',
+                                    title='Salary by Industry'
+                                )
+                                st.plotly_chart(fig_ind, use_container_width=True)
+
+                        with col_b:
+                            if 'Education Level' in batch_data.columns:
+                                fig_edu = box_figure(
+                                    batch_data,
+                                    x='Education Level',
+                                    y='Predicted_Salary',
+                                    title='Salary by Education'
+                                )
+                                st.plotly_chart(fig_edu, use_container_width=True)
+
+                    with result_tab4:
+                        # Export Options: nothing is written until an export is requested
+                        st.markdown("### 📥 Export Your Results")
+                        render_export_panel(
+                            f"batch-{upload_key(uploaded_file)}",
+                            lambda: frame_chunks(batch_data),
+                            sheets=lambda: summary_sheets(summary),
+                            report=lambda: summary_report(summary)
+                        )
+
+        except Exception as e:
+            st.error(f"❌ Error processing file: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,126 @@
+# common.py - model, prediction cache and market data shared by the app and its pages
+"""Process-wide resources behind ``@st.cache_resource``.
+
+Importing this module only defines functions; the model is loaded the
+first time ``get_scorer`` is called. requests (through the market data
+service) is only imported once a page asks for a quote.
+"""
+import streamlit as st
+
+from salary_ai.compiled_model import compile_pipeline
+from salary_ai.errors import ModelCompileError, SalarySystemError
+from salary_ai.explain import Explainer, FeatureMetadata
+from salary_ai.features import FeatureBuilder
+from salary_ai.lookup_table import load_lookup_table
+from salary_ai.model_store import load_pipeline, model_version
+from salary_ai.prediction_cache import CachedPredictor, PredictionCache
+
+
+# -------------------------------
+# LOAD MODEL
+# -------------------------------
+@st.cache_resource
+def load_model():
+    try:
+        # Try multiple paths for flexibility (see MODEL_PATHS)
+        model = load_pipeline()
+        return model, True
+    except Exception as e:
+        st.error(f"Model loading failed: {e}")
+        return None, False
+
+
+@st.cache_resource
+def load_model_version():
+    return model_version()
+
+
+# -------------------------------
+# PREDICTION CACHE (shared by all sessions in this process)
+# -------------------------------
+@st.cache_resource
+def get_prediction_cache():
+    return PredictionCache()
+
+
+class Scorer:
+    """The loaded pipeline with its compiled engine, feature builder and prediction cache."""
+
+    def __init__(self, model):
+        self.model = model
+        # NumPy-only scorer for single rows; None means fall back to model.predict
+        try:
+            self.compiled = compile_pipeline(model)
+        except (ModelCompileError, AttributeError):
+            self.compiled = None
+        # Single and batch inputs are assembled to the model's own columns and order
+        self.builder = FeatureBuilder.from_model(model)
+        # Display names and raw-field groups of the preprocessed columns, for explanations
+        try:
+            self.metadata = FeatureMetadata.from_pipeline(model)
+        except (AttributeError, KeyError, TypeError):
+            self.metadata = None
+        # Precomputed single predictions (python -m salary_ai.lookup_table); None if absent or stale
+        self.table = load_lookup_table(version=load_model_version())
+        self.cached = self.with_prediction_cache(self.batch_predict, self.score_row)
+
+    def score_row(self, row):
+        # ``row`` is already in model features (see FeatureBuilder.form_row)
+        if self.table is not None:
+            value = self.table.lookup(row)
+            if value is not None:
+                return value
+        if self.compiled is not None:
+            return self.compiled.predict_one(row)
+        return self.model.predict(self.builder.frame(row))[0]
+
+    def batch_predict(self, frame):
+        if self.compiled is not None:
+            return self.compiled.predict(self.builder.build(frame))
+        return self.model.predict(self.builder.frame(frame))
+
+    def with_prediction_cache(self, predict, predict_row=None):
+        # Wraps a batch predict function; keys are read from the feature builder's columns
+        return CachedPredictor(predict, self.builder.columns, load_model_version(), get_prediction_cache(),
+                               predict_row)
+
+    def predict_single(self, row):
+        return self.cached.predict_one(row)
+
+    def predict_batch(self, frame):
+        # Cache keys are read from the model's columns, so assemble them first
+        return self.cached.predict(self.builder.frame(frame))
+
+
+@st.cache_resource
+def get_scorer():
+    """The process-wide Scorer, or None when no model could be loaded."""
+    model, model_loaded = load_model()
+    return Scorer(model) if model_loaded else None
+
+
+@st.cache_resource
+def get_explainer():
+    """The process-wide SHAP explainer, or None without shap or for non-tree models."""
+    scorer = get_scorer()
+    if scorer is None or scorer.metadata is None:
+        return None
+    # shap itself is imported here, on the first explanation, not at app start
+    try:
+        return Explainer(scorer.model, scorer.metadata, scorer.compiled)
+    except SalarySystemError:
+        return None
+
+
+# -------------------------------
+# MARKET DATA FUNCTION
+# -------------------------------
+def fetch_market_quote():
+    # Served from the process-wide cache; the refresher thread does the network I/O
+    from salary_ai.market_data import get_market_service
+    return get_market_service().get()
+
+
+def fetch_market_data():
+    quote = fetch_market_quote()
+    return quote.value, quote.success
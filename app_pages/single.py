@@ -0,0 +1,220 @@
+# single.py - Single Prediction page
+import streamlit as st
+
+from app_pages.common import fetch_market_quote, get_explainer, get_scorer
+from salary_ai.config import (FORM_AGE_RANGE, FORM_COMPANY_SIZES, FORM_EDUCATION_LEVELS, FORM_EXPERIENCE_RANGE,
+                              FORM_GENDERS, FORM_INDUSTRIES, FORM_LOCATIONS, FORM_SKILLS)
+from salary_ai.explain import clean_feature_name
+
+
+def render():
+    scorer = get_scorer()
+
+    # Hero Section
+    st.markdown("""
+    <div class="hero-section">
+        <h1 class="hero-title"> AI Salary Predictor Pro</h1>
+        <p class="hero-subtitle">Professional salary predictions with real-time market intelligence</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Three-column layout
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="info-card">
+            <div class="info-icon">📈</div>
+            <h4>Market Adjusted</h4>
+            <p>Live market data integration</p>
+        </div>
+        <div class="info-card">
+            <div class="info-icon">⚡</div>
+            <h4>Fast Results</h4>
+            <p>Predictions in milliseconds</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown('<div class="form-container">', unsafe_allow_html=True)
+
+        with st.form("single_prediction_form"):
+            st.markdown('<h3 style="text-align: center; color: #4CAF50;">📝 Employee Profile</h3>',
+                        unsafe_allow_html=True)
+
+            col_left, col_right = st.columns(2)
+
+            with col_left:
+                age = st.number_input("Age", min_value=FORM_AGE_RANGE[0], max_value=FORM_AGE_RANGE[1], value=30,
+                                      step=1)
+                gender = st.selectbox("Gender", FORM_GENDERS)
+                education_level = st.selectbox("Education Level", FORM_EDUCATION_LEVELS)
+                job_title = st.text_input("Job Title", "Data Analyst", help="Enter specific job title")
+
+            with col_right:
+                years_exp = st.slider("Years of Experience", *FORM_EXPERIENCE_RANGE, 5)
+                industry = st.selectbox("Industry", FORM_INDUSTRIES)
+                location = st.selectbox("City / Location", FORM_LOCATIONS)
+                company_size = st.selectbox("Company Size", FORM_COMPANY_SIZES)
+
+            # Skills section
+            st.subheader("💼 Skills & Certifications")
+            skills = st.multiselect("Select relevant skills:", FORM_SKILLS)
+
+            # Market data
+            st.subheader("📈 Market Conditions")
+            use_market_data = st.checkbox("Use real-time market data", value=True)
+            market_quote = fetch_market_quote()
+            market_index = market_quote.value
+
+            if use_market_data and market_quote.success:
+                updated = market_quote.fetched_at.strftime('%H:%M:%S')
+                if market_quote.is_stale:
+                    st.warning(f"⚠️ Market Index (SPY): ${market_index:.2f} - stale, last updated {updated}")
+                else:
+                    st.info(f"✅ Current Market Index (SPY): ${market_index:.2f} (updated {updated})")
+            elif use_market_data:
+                st.warning("⚠️ Using fallback market data")
+
+            submitted = st.form_submit_button(
+                "🚀 Predict Salary Now",
+                use_container_width=True,
+                type="primary"
+            )
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="info-card">
+            <div class="info-icon">🔒</div>
+            <h4>Secure & Private</h4>
+            <p>Your data is protected</p>
+        </div>
+        <div class="info-card">
+            <div class="info-icon">📊</div>
+            <h4>Detailed Insights</h4>
+            <p>Comprehensive analysis</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # PREDICTION LOGIC
+    if submitted and scorer is not None:
+        # Same feature assembly as batch scoring: the model's columns, in its order
+        user_input = scorer.builder.form_row(
+            {
+                "Age": age,
+                "Gender": gender,
+                "Education Level": education_level,
+                "Job Title": job_title,
+                "Years of Experience": years_exp,
+                "Industry": industry,
+                "Location": location,
+                "Company Size": company_size
+            },
+            skills,
+            market_index if use_market_data else 0
+        )
+
+        # Make prediction
+        with st.spinner("AI is analyzing your profile..."):
+            predicted_salary = scorer.predict_single(user_input)
+
+        # RESULT DISPLAY
+        st.markdown(f"""
+        <div class="result-container">
+            <h2>Prediction Complete!</h2>
+            <div class="salary-amount">${predicted_salary:,.2f}</div>
+            <p>Estimated Annual Salary</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # VISUALIZATIONS
+        viz_col1, viz_col2 = st.columns(2)
+
+        with viz_col1:
+            # Interactive Gauge Chart (plotly is only imported once there is a prediction to show)
+            import plotly.graph_objects as go
+            fig_gauge = go.Figure(go.Indicator(
+                mode="gauge+number+delta",
+                value=predicted_salary,
+                domain={'x': [0, 1], 'y': [0, 1]},
+                title={'text': "Salary Range", 'font': {'size': 24}},
+                delta={'reference': predicted_salary * 0.8, 'relative': True},
+                gauge={
+                    'axis': {'range': [None, predicted_salary * 1.8]},
+                    'bar': {'color': "#4CAF50"},
+                    'steps': [
+                        {'range': [0, predicted_salary * 0.7], 'color': "#f8f9fa"},
+                        {'range': [predicted_salary * 0.7, predicted_salary * 1.3], 'color': "#e9ecef"},
+                        {'range': [predicted_salary * 1.3, predicted_salary * 1.8], 'color': "#dee2e6"}
+                    ],
+                    'threshold': {
+                        'line': {'color': "red", 'width': 4},
+                        'thickness': 0.75,
+                        'value': predicted_salary * 1.5
+                    }
+                }
+            ))
+
+            if st.session_state.theme == "Dark":
+                fig_gauge.update_layout(
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font_color='#ffffff'
+                )
+            st.plotly_chart(fig_gauge, use_container_width=True)
+
+        with viz_col2:
+            # Salary Breakdown
+            st.markdown("### 📊 Salary Breakdown")
+
+            breakdown_data = {
+                "Monthly": predicted_salary / 12,
+                "Weekly": predicted_salary / 52,
+                "Daily": predicted_salary / 260,
+                "Hourly": predicted_salary / 2080
+            }
+
+            for period, amount in breakdown_data.items():
+                col_a, col_b = st.columns([1, 2])
+                with col_a:
+                    st.metric(period, f"${amount:,.0f}")
+                with col_b:
+                    st.progress(min(1.0, amount / (predicted_salary / 12)))
+
+            # Confidence score
+            confidence = min(95, max(70, 75 + (years_exp * 1.5)))
+            st.progress(confidence / 100, text=f"Prediction Confidence: {confidence}%")
+
+        # Top factors behind this prediction (SHAP, per input field); model-wide importances otherwise
+        explainer = get_explainer()
+        explanation = None
+        if explainer is not None:
+            # The prediction is already shown; a failed explanation must not take the page down
+            try:
+                explanation = explainer.explain(user_input)
+            except Exception:
+                explanation = None
+        if explanation is not None:
+            st.markdown("### 🔍 Top Influencing Factors")
+            for field, contribution in explanation.contributions:
+                st.caption(f"{clean_feature_name(field)}: {contribution:+,.0f}")
+            if explainer.approximate:
+                st.caption("Approximate attributions (exact SHAP exceeds the latency budget)")
+        elif scorer.metadata is not None and scorer.metadata.global_factors:
+            st.markdown("### 🔍 Top Influencing Factors")
+            for label, importance in scorer.metadata.global_factors:
+                st.caption(f"{label}: {importance:.1%}")
+        elif explainer is not None:
+            st.info("Factor explanations are not available for this prediction.")
+
+    # RESET BUTTON - Clear form for another prediction
+    st.markdown("---")
+    reset_col1, reset_col2, reset_col3 = st.columns([1, 3, 1])
+    with reset_col2:
+        if st.button("🔄 New Prediction",
+                    use_container_width=True,
+                    type="secondary",
+                    help="Clear all inputs and start a new prediction"):
+            st.rerun()
@@ -0,0 +1,2 @@
+# salary_ai - shared engine code for the Salary Prediction System
+"""Reusable building blocks behind ``main_salary_app.py``."""
@@ -0,0 +1,328 @@
+# batch.py - column preparation and chunked streaming batch scoring
+import gzip
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.config import (
+    BATCH_MEMORY_BUDGET,
+    DEFAULT_CHUNK_SIZE,
+    OPTIONAL_SKILLS,
+    REQUIRED_COLUMNS,
+    SPOOL_MAX_SIZE,
+)
+from salary_ai.errors import SalarySystemError
+from salary_ai.schema import IngestStats, apply_schema, csv_dtypes
+from salary_ai.summary import BatchSummary
+
+# Rough ratio of a chunk's peak working set to its parsed size: the raw
+# frame, the prepared copy, predictions and the encoded CSV text
+_CHUNK_OVERHEAD = 4
+_PROBE_ROWS = 1_000
+
+
+# -------------------------------
+# COLUMN PREPARATION
+# -------------------------------
+def missing_columns(columns) -> List[str]:
+    return [c for c in REQUIRED_COLUMNS if c not in set(columns)]
+
+
+def prepare_batch(batch_data: pd.DataFrame, market_index: float) -> pd.DataFrame:
+    """Add missing optional skill columns and the market index, in place."""
+    for col in OPTIONAL_SKILLS:
+        if col not in batch_data.columns:
+            batch_data[col] = 0
+    batch_data["Market_Index"] = market_index
+    return batch_data
+
+
+def rows_for_budget(sample: pd.DataFrame, memory_budget: int = BATCH_MEMORY_BUDGET) -> int:
+    """Chunk size whose working set fits ``memory_budget``, estimated from a sample."""
+    if len(sample) == 0:
+        return DEFAULT_CHUNK_SIZE
+    bytes_per_row = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+    return max(1_000, int(memory_budget / (bytes_per_row * _CHUNK_OVERHEAD)))
+
+
+def probe_chunk_size(source, memory_budget: int = BATCH_MEMORY_BUDGET, dtype: Optional[dict] = None) -> int:
+    """``rows_for_budget`` from a CSV's first rows, parsed as CsvChunkReader would; ``source`` is rewound."""
+    sample = pd.read_csv(source, nrows=_PROBE_ROWS, dtype=csv_dtypes() if dtype is None else dtype)
+    source.seek(0)
+    return rows_for_budget(sample, memory_budget)
+
+
+# -------------------------------
+# CHUNK READERS
+# -------------------------------
+class CsvChunkReader:
+    """Yields a CSV as DataFrame chunks.
+
+    When ``chunk_size`` is None the first chunk is a small probe and the
+    rest are sized from ``memory_budget`` (see ``rows_for_budget``).
+    ``dtype`` is passed to ``read_csv``; by default the schema's text
+    columns are parsed as categories (see ``csv_dtypes``).
+    """
+
+    def __init__(self, source, chunk_size: Optional[int] = None,
+                 memory_budget: int = BATCH_MEMORY_BUDGET, dtype: Optional[dict] = None):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.memory_budget = memory_budget
+        self.dtype = csv_dtypes() if dtype is None else dtype
+        self._total_bytes = None
+        if hasattr(source, "seek") and hasattr(source, "tell"):
+            source.seek(0, 2)
+            self._total_bytes = source.tell()
+            source.seek(0)
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        size = self.chunk_size or _PROBE_ROWS
+        with pd.read_csv(self.source, chunksize=size, dtype=self.dtype) as reader:
+            while True:
+                try:
+                    chunk = reader.get_chunk(size)
+                except StopIteration:
+                    return
+                if self.chunk_size is None:
+                    self.chunk_size = size = rows_for_budget(chunk, self.memory_budget)
+                yield chunk
+
+    def fraction(self) -> Optional[float]:
+        if not self._total_bytes:
+            return None
+        return min(1.0, self.source.tell() / self._total_bytes)
+
+
+class ParquetChunkReader:
+    """Yields a Parquet file as DataFrame chunks of ``chunk_size`` rows."""
+
+    def __init__(self, source, chunk_size: Optional[int] = None):
+        pa = _require_pyarrow()
+        self.file = pa.parquet.ParquetFile(source)
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self._rows_read = 0
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for batch in self.file.iter_batches(batch_size=self.chunk_size):
+            self._rows_read += batch.num_rows
+            yield batch.to_pandas()
+
+    def fraction(self) -> Optional[float]:
+        total = self.file.metadata.num_rows
+        return min(1.0, self._rows_read / total) if total else None
+
+
+# -------------------------------
+# OUTPUT SINKS
+# -------------------------------
+class CsvSink:
+    """Appends scored chunks as CSV to a (by default spooled) binary file."""
+
+    def __init__(self, output=None):
+        if output is None:
+            output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+b")
+        self.output = output
+        self._header = True
+
+    def write(self, chunk: pd.DataFrame):
+        self.output.write(chunk.to_csv(index=False, header=self._header).encode("utf-8"))
+        self._header = False
+
+    def finish(self):
+        self.output.flush()
+        if self.output.seekable():
+            self.output.seek(0)
+
+
+class GzipCsvSink(CsvSink):
+    """CsvSink that gzips chunks as they are written."""
+
+    def __init__(self, output=None, compresslevel: int = 6):
+        super().__init__(output)
+        self._gzip = gzip.GzipFile(fileobj=self.output, mode="wb", compresslevel=compresslevel)
+
+    def write(self, chunk: pd.DataFrame):
+        self._gzip.write(chunk.to_csv(index=False, header=self._header).encode("utf-8"))
+        self._header = False
+
+    def finish(self):
+        self._gzip.close()  # writes the gzip trailer; leaves self.output open
+        super().finish()
+
+
+class ParquetSink:
+    """Appends scored chunks as row groups of one Parquet file."""
+
+    def __init__(self, output=None):
+        if output is None:
+            output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+b")
+        self.output = output
+        self._pa = _require_pyarrow()
+        self._writer = None
+
+    def write(self, chunk: pd.DataFrame):
+        pa = self._pa
+        chunk = _decategorize(chunk)
+        if self._writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            self._writer = pa.parquet.ParquetWriter(self.output, table.schema)
+        else:
+            table = pa.Table.from_pandas(chunk, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def finish(self):
+        if self._writer is not None:
+            self._writer.close()
+        _rewind(self.output)
+
+
+class ArrowSink:
+    """Appends scored chunks as record batches of one Arrow IPC file."""
+
+    def __init__(self, output=None):
+        if output is None:
+            output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+b")
+        self.output = output
+        self._pa = _require_pyarrow()
+        self._writer = None
+        self._schema = None
+
+    def write(self, chunk: pd.DataFrame):
+        pa = self._pa
+        chunk = _decategorize(chunk)
+        if self._writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            self._schema = table.schema
+            self._writer = pa.ipc.new_file(self.output, self._schema)
+        else:
+            table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def finish(self):
+        if self._writer is not None:
+            self._writer.close()
+        _rewind(self.output)
+
+
+def _decategorize(chunk: pd.DataFrame) -> pd.DataFrame:
+    # Each chunk has its own categories, so Arrow dictionaries would differ between batches
+    categorical = [c for c in chunk.columns if isinstance(chunk[c].dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return chunk
+    return chunk.astype({c: chunk[c].cat.categories.dtype for c in categorical})
+
+
+def _rewind(output):
+    # Sinks given a path have nothing to rewind
+    if hasattr(output, "seekable") and output.seekable():
+        output.flush()
+        output.seek(0)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise SalarySystemError("Parquet support requires pyarrow. Please install: `pip install pyarrow`")
+    return pyarrow
+
+
+# -------------------------------
+# STREAMING SCORER
+# -------------------------------
+@dataclass
+class StreamingBatchResult:
+    """Where the scored output went, plus a bounded preview, the batch summary
+    and the ingest report (rows read and rejected, memory before and after typing)."""
+    output: object
+    rows: int
+    chunks: int
+    chunk_size: int
+    preview: pd.DataFrame
+    elapsed: float
+    summary: BatchSummary
+    ingest: IngestStats
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def score_stream(reader, predict: Callable[[pd.DataFrame], np.ndarray], market_index: float,
+                 sink, progress: Optional[Callable[[int, Optional[float]], None]] = None,
+                 preview_rows: int = 100, rejects=None,
+                 explain: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None) -> StreamingBatchResult:
+    """Score ``reader``'s chunks one at a time and hand each one to ``sink``.
+
+    Each chunk is typed and validated with ``apply_schema`` first; rejected
+    rows go to the ``rejects`` sink when one is given. Only one chunk is
+    alive at a time; its predictions are folded into a BatchSummary before
+    it is dropped. ``progress`` is called after every chunk with the rows
+    read so far and, when the reader can tell, the fraction of the input
+    consumed. ``explain`` (e.g. a BatchExplainer) returns extra columns
+    that are added to each scored chunk, such as its top SHAP factors.
+    """
+    start = time.perf_counter()
+    rows = chunks = 0
+    preview = None
+    summary = BatchSummary()
+    ingest = IngestStats()
+    for chunk in reader:
+        typed = apply_schema(chunk)
+        ingest += typed.stats
+        if rejects is not None and len(typed.rejects):
+            rejects.write(typed.rejects)
+        chunk = typed.frame
+        del typed
+        chunks += 1
+
+        if len(chunk):
+            prepare_batch(chunk, market_index)
+            chunk["Predicted_Salary"] = predict(chunk)
+            if explain is not None:
+                chunk = chunk.join(explain(chunk))
+            sink.write(chunk)
+            summary = summary.update(chunk)
+
+            if preview is None or len(preview) < preview_rows:
+                head = chunk.head(preview_rows)
+                preview = head if preview is None else pd.concat([preview, head]).head(preview_rows)
+            rows += len(chunk)
+        del chunk
+
+        if progress is not None:
+            progress(ingest.rows, reader.fraction())
+
+    sink.finish()
+    if rejects is not None:
+        rejects.finish()
+    return StreamingBatchResult(
+        output=getattr(sink, "output", None),
+        rows=rows,
+        chunks=chunks,
+        chunk_size=reader.chunk_size,
+        preview=preview if preview is not None else pd.DataFrame(),
+        elapsed=time.perf_counter() - start,
+        summary=summary,
+        ingest=ingest
+    )
+
+
+def score_csv_stream(source, predict: Callable[[pd.DataFrame], np.ndarray], market_index: float,
+                     chunk_size: Optional[int] = None, memory_budget: int = BATCH_MEMORY_BUDGET,
+                     output=None, progress: Optional[Callable[[int, Optional[float]], None]] = None,
+                     preview_rows: int = 100, rejects=None,
+                     explain: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+                     dtype: Optional[dict] = None) -> StreamingBatchResult:
+    """Score a CSV upload chunk by chunk into a spooled CSV (see ``score_stream``).
+
+    ``dtype`` goes to ``read_csv``; the default is ``csv_dtypes()``.
+    """
+    return score_stream(CsvChunkReader(source, chunk_size, memory_budget, dtype), predict, market_index,
+                        CsvSink(output), progress, preview_rows, rejects, explain)
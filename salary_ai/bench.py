@@ -0,0 +1,330 @@
+# bench.py - headless benchmark suite with a stored baseline
+"""Measure what the app promises, and fail when it gets slower.
+
+    python -m salary_ai.bench -o bench_results.json            # run, compare with bench_baseline.json
+    python -m salary_ai.bench --only predict batch --update-baseline
+
+Suites:
+- ``load``: ``load_model()`` in a fresh interpreter (cold import and unpickle).
+- ``predict``: single-row latency percentiles, for ``pipeline.predict`` and
+  for the app's ``Scorer.score_row`` (lookup table or compiled model,
+  without the prediction cache).
+- ``batch``: rows/sec through the compiled batch predictor at each of
+  BENCH_BATCH_SIZES.
+- ``analytics``: the Data Analytics page run headless with Streamlit's
+  AppTest, per synthetic ``sample_size``. Cold (data cache cleared) and
+  warm runs.
+- ``figures``: time to build each Plotly chart of the page, per sample
+  size.
+
+Results are JSON: one entry per metric with its unit and whether lower or
+higher is better. Metrics present in both the results and the baseline
+count as regressions when they are worse by more than ``--threshold``
+(a fraction; BENCH_REGRESSION_THRESHOLD). A baseline metric of a suite
+that ran but is missing from the results fails as well, and so does any
+skipped suite (e.g. no model file) once a baseline exists. The exit status
+is then 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.config import (BENCH_BASELINE_PATH, BENCH_BATCH_SIZES, BENCH_PREDICT_ROWS,
+                              BENCH_REGRESSION_THRESHOLD, BENCH_REPEAT, BENCH_SAMPLE_SIZES, FALLBACK_MARKET_INDEX,
+                              FORM_AGE_RANGE, FORM_COMPANY_SIZES, FORM_EDUCATION_LEVELS, FORM_EXPERIENCE_RANGE,
+                              FORM_GENDERS, FORM_INDUSTRIES, FORM_LOCATIONS, OPTIONAL_SKILLS)
+from salary_ai.errors import SalarySystemError
+from salary_ai.synthetic import job_titles_list
+
+SUITES = ("load", "predict", "batch", "analytics", "figures")
+# Metric name prefix of each suite, to tell which baseline metrics a run should reproduce
+SUITE_PREFIXES = {"load": "load_model.", "predict": "predict.", "batch": "batch.", "analytics": "analytics.",
+                  "figures": "figure."}
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main_salary_app.py")
+
+
+def metric(value: float, unit: str, better: str = "lower") -> dict:
+    return {"value": float(value), "unit": unit, "better": better}
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    # Minimum wall seconds over ``repeat`` calls: the least noisy estimate of the cost itself
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def form_frame(n: int, seed: int = 42) -> pd.DataFrame:
+    """``n`` random Single Prediction form inputs, drawn column-wise."""
+    rng = np.random.default_rng(seed)
+    choices = {
+        "Gender": FORM_GENDERS,
+        "Education Level": FORM_EDUCATION_LEVELS,
+        "Job Title": job_titles_list,
+        "Industry": FORM_INDUSTRIES,
+        "Location": FORM_LOCATIONS,
+        "Company Size": FORM_COMPANY_SIZES
+    }
+    frame = pd.DataFrame({name: rng.choice(np.array(values, dtype=object), n) for name, values in choices.items()})
+    frame["Age"] = rng.integers(FORM_AGE_RANGE[0], FORM_AGE_RANGE[1] + 1, n)
+    frame["Years of Experience"] = rng.integers(FORM_EXPERIENCE_RANGE[0], FORM_EXPERIENCE_RANGE[1] + 1, n)
+    for skill in OPTIONAL_SKILLS:
+        frame[skill] = rng.integers(0, 2, n)
+    frame["Market_Index"] = FALLBACK_MARKET_INDEX
+    return frame
+
+
+# -------------------------------
+# SUITES
+# -------------------------------
+_COLD_LOAD = """
+import json, time
+start = time.perf_counter()
+from app_pages.common import load_model
+model, loaded = load_model()
+print(json.dumps({"ms": (time.perf_counter() - start) * 1000, "loaded": loaded}))
+"""
+
+
+def bench_load(repeat: int = BENCH_REPEAT, **_) -> Dict[str, dict]:
+    """``load_model()`` in a new interpreter each time, so neither imports nor the resource cache are warm."""
+    root = os.path.dirname(APP_FILE)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _COLD_LOAD], capture_output=True, text=True, cwd=root, env=env)
+        if out.returncode != 0:
+            raise SalarySystemError(f"load_model() crashed in a fresh interpreter: {out.stderr.strip()[-300:]}")
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        if not result["loaded"]:
+            raise SalarySystemError("load_model() could not load a model (see MODEL_PATHS)")
+        times.append(result["ms"])
+    return {"load_model.cold_ms": metric(min(times), "ms")}
+
+
+def _percentiles(name: str, seconds: List[float]) -> Dict[str, dict]:
+    ms = np.asarray(seconds) * 1000
+    return {f"{name}.p{q}_ms": metric(np.percentile(ms, q), "ms") for q in (50, 95, 99)}
+
+
+def bench_predict(rows: int = BENCH_PREDICT_ROWS, **_) -> Dict[str, dict]:
+    """Single-row latency percentiles over ``rows`` random form inputs."""
+    from app_pages.common import Scorer
+    from salary_ai.model_store import load_pipeline
+
+    pipeline = load_pipeline()
+    scorer = Scorer(pipeline)
+    frame = scorer.builder.frame(form_frame(rows, seed=7))
+    records = frame.to_dict("records")
+
+    pipeline_s, scorer_s = [], []
+    for i, record in enumerate(records):
+        single = frame.iloc[i:i + 1]
+        start = time.perf_counter()
+        pipeline.predict(single)
+        pipeline_s.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        scorer.score_row(record)
+        scorer_s.append(time.perf_counter() - start)
+    return {**_percentiles("predict.pipeline", pipeline_s), **_percentiles("predict.scorer", scorer_s)}
+
+
+def bench_batch(sizes: Sequence[int] = BENCH_BATCH_SIZES, repeat: int = BENCH_REPEAT, **_) -> Dict[str, dict]:
+    """Rows/sec of the compiled batch predictor (what ``salary_ai.score`` runs per chunk)."""
+    from salary_ai.model_store import load_predictor
+
+    predictor = load_predictor()
+    results = {}
+    for n in sizes:
+        frame = form_frame(n)
+        seconds = _best_of(lambda: predictor(frame), repeat if n <= 100_000 else 1)
+        results[f"batch.rows_per_s[{n}]"] = metric(n / seconds, "rows/s", "higher")
+    return results
+
+
+def bench_analytics(sample_sizes: Sequence[int] = BENCH_SAMPLE_SIZES, repeat: int = BENCH_REPEAT,
+                    **_) -> Dict[str, dict]:
+    """The Data Analytics page per synthetic sample size, run headless through AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    from app_pages.analytics import load_analytics_data
+    from salary_ai.synthetic import generate_sample_data
+
+    at = AppTest.from_file(APP_FILE, default_timeout=600).run()
+    at.sidebar.radio(key="nav_radio").set_value("Data Analytics").run()
+    next(w for w in at.selectbox if w.label == "Data Source").set_value("Synthetic Sample").run()
+
+    def cold_run():
+        # The sample and its cube are generated inside the timed run
+        load_analytics_data.clear()
+        generate_sample_data.cache_clear()
+        at.run()
+
+    results = {}
+    for n in sample_sizes:
+        next(w for w in at.slider if w.label == "Sample Size").set_value(n).run()
+        if at.exception:
+            raise SalarySystemError(f"Data Analytics page failed: {at.exception[0].value}")
+        results[f"analytics.cold_ms[{n}]"] = metric(_best_of(cold_run, repeat) * 1000, "ms")
+        results[f"analytics.warm_ms[{n}]"] = metric(_best_of(at.run, repeat) * 1000, "ms")
+    return results
+
+
+def bench_figures(sample_sizes: Sequence[int] = BENCH_SAMPLE_SIZES, repeat: int = BENCH_REPEAT,
+                  **_) -> Dict[str, dict]:
+    """Build time of each Data Analytics chart, without rendering or serialising it."""
+    from salary_ai.charts import box_figure, histogram_figure, scatter_figure, violin_figure
+    from salary_ai.cube import analytics_frame
+    from salary_ai.synthetic import generate_sample_data
+
+    results = {}
+    for n in sample_sizes:
+        data = analytics_frame(generate_sample_data(n, seed=42))
+        figures = {
+            "histogram": lambda: histogram_figure(data["Salary"], nbins=30),
+            "box": lambda: box_figure(data, x="Job_Title", y="Salary", outliers=True),
+            "violin": lambda: violin_figure(data, x="Education", y="Salary", points=True),
+            "scatter": lambda: scatter_figure(data, x="Experience", y="Salary", color="Education", size="Age",
+                                              trendline=True)
+        }
+        for name, build in figures.items():
+            results[f"figure.{name}_ms[{n}]"] = metric(_best_of(build, repeat) * 1000, "ms")
+    return results
+
+
+_SUITE_FUNCTIONS = {
+    "load": bench_load,
+    "predict": bench_predict,
+    "batch": bench_batch,
+    "analytics": bench_analytics,
+    "figures": bench_figures
+}
+
+
+def run_suites(suites: Sequence[str] = SUITES, log=None, **options) -> dict:
+    """Run the named suites; a suite that cannot run (e.g. no model) is recorded under ``skipped``."""
+    log = log or (lambda message: None)
+    metrics, skipped = {}, {}
+    for suite in suites:
+        log(f"Running {suite} ...")
+        start = time.perf_counter()
+        try:
+            metrics.update(_SUITE_FUNCTIONS[suite](**options))
+        except SalarySystemError as e:
+            skipped[suite] = str(e)
+            log(f"  skipped: {e}")
+            continue
+        log(f"  done in {time.perf_counter() - start:.1f}s")
+    return {
+        "meta": {
+            "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "suites": list(suites)
+        },
+        "metrics": metrics,
+        "skipped": skipped
+    }
+
+
+# -------------------------------
+# BASELINE
+# -------------------------------
+def compare(results: dict, baseline: dict, threshold: float = BENCH_REGRESSION_THRESHOLD) -> pd.DataFrame:
+    """One row per metric found in both; ``regressed`` when worse than the baseline by more than ``threshold``.
+
+    Baseline metrics of the suites that ran but are not in the results get a
+    row with ``missing`` set; they count as regressed too.
+    """
+    rows = []
+    base_metrics = baseline.get("metrics", {})
+    for name, current in results["metrics"].items():
+        base = base_metrics.get(name)
+        if base is None or base["value"] == 0:
+            continue
+        change = current["value"] / base["value"] - 1
+        worse = change if current["better"] == "lower" else -change
+        rows.append({"metric": name, "baseline": base["value"], "current": current["value"],
+                     "unit": current["unit"], "change": change, "regressed": worse > threshold, "missing": False})
+    prefixes = tuple(SUITE_PREFIXES[s] for s in results.get("meta", {}).get("suites", SUITES))
+    for name, base in base_metrics.items():
+        if name.startswith(prefixes) and name not in results["metrics"]:
+            rows.append({"metric": name, "baseline": base["value"], "current": np.nan, "unit": base["unit"],
+                         "change": np.nan, "regressed": True, "missing": True})
+    return pd.DataFrame(rows, columns=["metric", "baseline", "current", "unit", "change", "regressed", "missing"])
+
+
+def _write_json(report: dict, path: str):
+    tmp = path + ".part"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp, path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m salary_ai.bench",
+                                     description="Benchmark the model, batch scoring and the analytics page.")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES), help="Suites to run")
+    parser.add_argument("-o", "--output", help="Write the results JSON here")
+    parser.add_argument("--baseline", default=BENCH_BASELINE_PATH, help="Baseline JSON (default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=BENCH_REGRESSION_THRESHOLD,
+                        help="Allowed relative slowdown before a metric counts as a regression")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(BENCH_BATCH_SIZES))
+    parser.add_argument("--sample-sizes", type=int, nargs="+", default=list(BENCH_SAMPLE_SIZES))
+    parser.add_argument("--predict-rows", type=int, default=BENCH_PREDICT_ROWS)
+    parser.add_argument("--repeat", type=int, default=BENCH_REPEAT)
+    args = parser.parse_args(argv)
+
+    def log(message):
+        print(message, file=sys.stderr)
+
+    results = run_suites(args.only, log, sizes=args.batch_sizes, sample_sizes=args.sample_sizes,
+                         rows=args.predict_rows, repeat=args.repeat)
+    if args.output:
+        _write_json(results, args.output)
+    if args.update_baseline:
+        _write_json(results, args.baseline)
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(results["metrics"], indent=2))
+        print(f"No baseline at {args.baseline}; run with --update-baseline to store one", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        table = compare(results, json.load(f), args.threshold)
+    with pd.option_context("display.max_rows", None, "display.width", 120):
+        print(table.to_string(index=False, float_format=lambda v: f"{v:,.3f}"))
+    failed = False
+    for suite, reason in results["skipped"].items():
+        print(f"Suite {suite} did not run: {reason}", file=sys.stderr)
+        failed = True
+    missing = table[table["missing"]]
+    if len(missing):
+        print(f"{len(missing)} baseline metric(s) missing from the results: {', '.join(missing['metric'])}",
+              file=sys.stderr)
+        failed = True
+    regressions = table[table["regressed"] & ~table["missing"]]
+    if len(regressions):
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions['metric'])}", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+# charts.py - pre-binned chart payloads for large frames
+"""Plotly figures whose size does not grow with the row count.
+
+Bins, quantiles and densities are computed here with NumPy, and only
+those summaries go into the figure. Point traces carry at most
+CHART_POINT_LIMIT rows, as a sample stratified by group, and switch to
+WebGL above WEBGL_THRESHOLD points.
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from salary_ai.config import CHART_POINT_LIMIT, DENSITY_GRID_SIZE, WEBGL_THRESHOLD
+
+_COLORS = px.colors.qualitative.Plotly
+_SEED = 42
+
+
+# -------------------------------
+# SUMMARIES
+# -------------------------------
+def _finite(values) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    return values[np.isfinite(values)]
+
+
+def histogram_bins(values, nbins: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """``(counts, edges)`` of the finite values."""
+    values = _finite(values)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(1)
+    return np.histogram(values, bins=nbins)
+
+
+def _group_codes(groups: pd.Series) -> Tuple[np.ndarray, List]:
+    if isinstance(groups.dtype, pd.CategoricalDtype):
+        groups = groups.cat.remove_unused_categories()
+        return groups.cat.codes.to_numpy(), list(groups.cat.categories)
+    codes, uniques = pd.factorize(groups, sort=True)
+    return codes, list(uniques)
+
+
+def _grouped_values(values, groups: pd.Series):
+    """Yield ``(label, sorted finite values)`` per group, in group order."""
+    values = np.asarray(values, dtype=np.float64)
+    codes, labels = _group_codes(pd.Series(groups).reset_index(drop=True))
+    keep = (codes >= 0) & np.isfinite(values)
+    codes, values = codes[keep], values[keep]
+    order = np.lexsort((values, codes))
+    values, codes = values[order], codes[order]
+    bounds = np.searchsorted(codes, np.arange(len(labels) + 1))
+    for g, label in enumerate(labels):
+        segment = values[bounds[g]:bounds[g + 1]]
+        if len(segment):
+            yield label, segment
+
+
+def box_stats(values, groups: pd.Series) -> pd.DataFrame:
+    """Per-group quartiles and Tukey fences, the way Plotly's box trace draws them."""
+    rows = []
+    for label, v in _grouped_values(values, groups):
+        q1, median, q3 = np.percentile(v, [25, 50, 75])
+        iqr = q3 - q1
+        lower = v[np.searchsorted(v, q1 - 1.5 * iqr)]
+        upper = v[np.searchsorted(v, q3 + 1.5 * iqr, side="right") - 1]
+        rows.append({"group": label, "count": len(v), "q1": q1, "median": median, "q3": q3,
+                     "lowerfence": lower, "upperfence": upper, "mean": v.mean()})
+    return pd.DataFrame(rows)
+
+
+def stratified_sample(strata, limit: int = CHART_POINT_LIMIT, seed: int = _SEED) -> np.ndarray:
+    """Row positions of at most ``limit`` rows, keeping every stratum's share (and at least one row)."""
+    strata = pd.Series(strata).reset_index(drop=True)
+    n = len(strata)
+    if n <= limit:
+        return np.arange(n)
+    rng = np.random.default_rng(seed)
+    codes, _ = _group_codes(strata)
+    picked = []
+    for code in np.unique(codes):
+        members = np.flatnonzero(codes == code)
+        quota = max(1, int(round(limit * len(members) / n)))
+        picked.append(members if quota >= len(members) else rng.choice(members, quota, replace=False))
+    return np.sort(np.concatenate(picked))
+
+
+def density_curve(values: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    """Gaussian KDE on an even ``grid``, from a histogram on that grid (linear in rows)."""
+    if len(values) < 2 or values.std() == 0:
+        density = np.zeros(len(grid))
+        density[np.abs(grid - values.mean()).argmin()] = 1.0
+        return density
+    step = grid[1] - grid[0]
+    edges = np.append(grid - step / 2, grid[-1] + step / 2)
+    counts, _ = np.histogram(values, bins=edges)
+    bandwidth = max(1.06 * values.std() * len(values) ** -0.2 / step, 0.5)  # Scott's rule, in bins
+    offsets = np.arange(-int(4 * bandwidth) - 1, int(4 * bandwidth) + 2)
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    return np.convolve(counts, kernel / kernel.sum(), mode="same")
+
+
+def density_grid(x, y, bins: int = DENSITY_GRID_SIZE // 2):
+    """2D counts on a ``bins`` x ``bins`` grid: ``(counts, x_centers, y_centers)``."""
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    keep = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[keep], y[keep], bins=bins)
+    return counts.T, (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2
+
+
+# -------------------------------
+# FIGURES
+# -------------------------------
+def _points_trace(x, y, n_points: int, **kwargs):
+    trace = go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
+    return trace(x=x, y=y, mode="markers", **kwargs)
+
+
+def histogram_figure(values, nbins: int = 30, title: str = "", color: str = _COLORS[0],
+                     x_title: str = "") -> go.Figure:
+    counts, edges = histogram_bins(values, nbins)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+        marker_color=color, name=x_title
+    ))
+    fig.update_layout(title=title, bargap=0, xaxis_title=x_title, yaxis_title="count")
+    return fig
+
+
+def box_figure(frame: pd.DataFrame, x: str, y: str, title: str = "", outliers: bool = True,
+               limit: int = CHART_POINT_LIMIT) -> go.Figure:
+    """Box plot from precomputed quartiles, plus at most ``limit`` sampled outliers."""
+    stats = box_stats(frame[y], frame[x])
+    fig = go.Figure(go.Box(
+        x=stats["group"], q1=stats["q1"], median=stats["median"], q3=stats["q3"],
+        lowerfence=stats["lowerfence"], upperfence=stats["upperfence"], mean=stats["mean"],
+        name=y, marker_color=_COLORS[0], boxpoints=False
+    ))
+    if outliers and len(stats):
+        fences = stats.set_index("group")
+        group = frame[x].astype(object)
+        values = frame[y].to_numpy(dtype=np.float64)
+        low = group.map(fences["lowerfence"]).to_numpy(dtype=np.float64)
+        high = group.map(fences["upperfence"]).to_numpy(dtype=np.float64)
+        outside = np.flatnonzero((values < low) | (values > high))
+        if len(outside):
+            outside = outside[stratified_sample(group.iloc[outside], limit)]
+            fig.add_trace(_points_trace(group.iloc[outside], values[outside], len(outside),
+                                        marker=dict(color=_COLORS[0], size=4), name="outliers",
+                                        showlegend=False))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y, showlegend=False)
+    return fig
+
+
+def violin_figure(frame: pd.DataFrame, x: str, y: str, title: str = "", points: bool = True,
+                  limit: int = CHART_POINT_LIMIT, grid_size: int = DENSITY_GRID_SIZE) -> go.Figure:
+    """Violins drawn from server-side densities on a shared grid, with an inner box."""
+    values = _finite(frame[y])
+    fig = go.Figure()
+    if len(values) == 0:
+        return fig.update_layout(title=title)
+    grid = np.linspace(values.min(), values.max(), grid_size)
+    step = grid[1] - grid[0] if grid_size > 1 else 0.0
+    labels = []
+    for pos, (label, v) in enumerate(_grouped_values(frame[y], frame[x])):
+        color = _COLORS[pos % len(_COLORS)]
+        # Outline only over the group's own range (padded by a grid step for single values)
+        inside = (grid >= v[0] - step) & (grid <= v[-1] + step)
+        density = density_curve(v, grid)[inside]
+        width = 0.4 * density / density.max() if density.max() > 0 else density
+        ys = grid[inside]
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([pos + width, pos - width[::-1]]), y=np.concatenate([ys, ys[::-1]]),
+            fill="toself", mode="lines", line=dict(color=color, width=1), name=str(label),
+            hoverinfo="name"
+        ))
+        q1, median, q3 = np.percentile(v, [25, 50, 75])
+        fig.add_trace(go.Box(
+            x=[pos], q1=[q1], median=[median], q3=[q3], lowerfence=[v[0]], upperfence=[v[-1]],
+            width=0.1, marker_color=color, name=str(label), showlegend=False, boxpoints=False
+        ))
+        labels.append(label)
+
+    if points:
+        sample = stratified_sample(frame[x], limit)
+        codes = pd.Categorical(frame[x].iloc[sample].astype(object), categories=labels).codes
+        jitter = np.random.default_rng(_SEED).uniform(-0.3, 0.3, len(sample))
+        fig.add_trace(_points_trace(codes + jitter, frame[y].iloc[sample], len(sample),
+                                    marker=dict(color="rgba(80, 80, 80, 0.35)", size=3),
+                                    name="points", showlegend=False, hoverinfo="y"))
+    fig.update_layout(
+        title=title, xaxis=dict(tickvals=list(range(len(labels))), ticktext=[str(label) for label in labels], title=x),
+        yaxis_title=y, legend_title=x
+    )
+    return fig
+
+
+def scatter_figure(frame: pd.DataFrame, x: str, y: str, color: Optional[str] = None,
+                   size: Optional[str] = None, title: str = "", trendline: bool = False,
+                   limit: int = CHART_POINT_LIMIT) -> go.Figure:
+    """Stratified scatter sample; above ``limit`` rows a density grid of all rows sits behind it.
+
+    Trend lines are ordinary least squares fits over every row, per color group.
+    """
+    fig = go.Figure()
+    n = len(frame)
+    if n > limit:
+        counts, xs, ys = density_grid(frame[x], frame[y])
+        fig.add_trace(go.Heatmap(x=xs, y=ys, z=np.where(counts > 0, counts, np.nan),
+                                 colorscale="Greys", showscale=False, opacity=0.5, name="density",
+                                 hovertemplate=f"{x}=%{{x}}<br>{y}=%{{y}}<br>rows=%{{z}}<extra></extra>"))
+
+    strata = frame[color] if color else pd.Series(np.zeros(n))
+    sample = frame.iloc[stratified_sample(strata, limit)]
+    if size:
+        # Same area scaling as px.scatter(size=..., size_max=20)
+        size_max = np.nanmax(frame[size].to_numpy(dtype=np.float64)) if n else 1.0
+        marker = dict(sizemode="area", sizeref=2.0 * size_max / 20 ** 2, sizemin=1)
+    else:
+        marker = dict(size=6)
+
+    groups = _grouped_frames(frame, color)
+    sample_groups = dict(_grouped_frames(sample, color))
+    for i, (label, rows) in enumerate(groups):
+        group_color = _COLORS[i % len(_COLORS)]
+        points = sample_groups.get(label)
+        if points is not None and len(points):
+            group_marker = dict(marker, color=group_color)
+            if size:
+                group_marker["size"] = np.nan_to_num(points[size].to_numpy(dtype=np.float64))
+            fig.add_trace(_points_trace(points[x], points[y], len(sample), marker=group_marker,
+                                        name=str(label) if color else y, legendgroup=str(label)))
+        if trendline and len(rows) > 1:
+            xv, yv = rows[x].to_numpy(dtype=np.float64), rows[y].to_numpy(dtype=np.float64)
+            keep = np.isfinite(xv) & np.isfinite(yv)
+            if keep.sum() > 1 and np.ptp(xv[keep]) > 0:
+                slope, intercept = np.polyfit(xv[keep], yv[keep], 1)
+                ends = np.array([xv[keep].min(), xv[keep].max()])
+                fig.add_trace(go.Scatter(x=ends, y=slope * ends + intercept, mode="lines",
+                                         line=dict(color=group_color), legendgroup=str(label),
+                                         showlegend=False, name=f"{label} trend"))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y, legend_title=color or "")
+    return fig
+
+
+def _grouped_frames(frame: pd.DataFrame, column: Optional[str]):
+    if not column:
+        return [(None, frame)]
+    return [(label, rows) for label, rows in frame.groupby(column, observed=True, sort=True)]
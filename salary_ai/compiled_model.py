@@ -0,0 +1,345 @@
+# compiled_model.py - NumPy-only inference for the fitted salary Pipeline
+"""Compile ``best_salary_model.pkl`` into plain NumPy arrays.
+
+The fitted ``ColumnTransformer`` is reduced to imputation fill values,
+scaler constants and category -> one-hot column lookups, and the
+estimator is flattened into contiguous node arrays. Scoring a dict or a
+structured array then skips pandas and sklearn input validation entirely.
+"""
+import json
+from typing import List, Mapping
+
+import numpy as np
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from salary_ai.errors import ModelCompileError
+
+# Rows scored per block; bounds the (rows x trees) node-index matrix
+BLOCK_SIZE = 4096
+
+
+# -------------------------------
+# PREPROCESSING
+# -------------------------------
+class _NumericBlock:
+    def __init__(self, columns, fill, mean, scale, offset):
+        self.columns = list(columns)
+        self.fill = np.asarray(fill, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.offset = offset
+
+    def write(self, records, X):
+        values = np.column_stack([np.asarray(records[c], dtype=np.float64).ravel() for c in self.columns])
+        missing = np.isnan(values)
+        if missing.any():
+            values = np.where(missing, self.fill, values)
+        X[:, self.offset:self.offset + len(self.columns)] = (values - self.mean) / self.scale
+
+
+class _CategoricalBlock:
+    def __init__(self, columns, fill, categories, offset):
+        self.columns = list(columns)
+        self.lookups = []
+        self.fill_index = []
+        for col_fill, cats in zip(fill, categories):
+            lookup = {cat: offset + k for k, cat in enumerate(cats)}
+            self.lookups.append(lookup)
+            self.fill_index.append(lookup.get(col_fill, -1))
+            offset += len(cats)
+
+    def write(self, records, X):
+        n = X.shape[0]
+        rows = np.arange(n)
+        for col, lookup, fill_index in zip(self.columns, self.lookups, self.fill_index):
+            values = np.asarray(records[col], dtype=object).ravel()
+            get = lookup.get
+            # v != v catches NaN; unknown categories map to -1 (handle_unknown="ignore")
+            index = np.fromiter(
+                (fill_index if v is None or v != v else get(v, -1) for v in values),
+                dtype=np.intp, count=n
+            )
+            known = index >= 0
+            X[rows[known], index[known]] = 1.0
+
+
+def _compile_preprocessor(prep):
+    blocks = []
+    offset = 0
+    for name, transformer, columns in prep.transformers_:
+        if transformer == "drop" or len(columns) == 0:
+            continue
+        if transformer == "passthrough":
+            raise ModelCompileError(f"Passthrough columns in '{name}' are not supported")
+
+        steps = transformer.steps if isinstance(transformer, Pipeline) else [(name, transformer)]
+        fill = np.full(len(columns), np.nan, dtype=object)
+        mean = np.zeros(len(columns))
+        scale = np.ones(len(columns))
+        encoder = None
+
+        for _, step in steps:
+            if isinstance(step, SimpleImputer):
+                missing_values = step.missing_values
+                if not (isinstance(missing_values, float) and np.isnan(missing_values)):
+                    raise ModelCompileError("Only NaN imputation is supported")
+                fill = step.statistics_
+            elif isinstance(step, StandardScaler):
+                if step.mean_ is not None:
+                    mean = step.mean_
+                if step.scale_ is not None:
+                    scale = step.scale_
+            elif isinstance(step, OneHotEncoder):
+                if step.drop_idx_ is not None or getattr(step, "_infrequent_enabled", False):
+                    raise ModelCompileError("OneHotEncoder with drop/infrequent categories is not supported")
+                encoder = step
+            else:
+                raise ModelCompileError(f"Unsupported preprocessing step: {type(step).__name__}")
+
+        if encoder is not None:
+            blocks.append(_CategoricalBlock(columns, fill, encoder.categories_, offset))
+            offset += sum(len(c) for c in encoder.categories_)
+        else:
+            blocks.append(_NumericBlock(columns, fill.astype(np.float64), mean, scale, offset))
+            offset += len(columns)
+    return blocks, offset
+
+
+# -------------------------------
+# ESTIMATORS
+# -------------------------------
+def _tree_depth(left, right, root=0):
+    depth, frontier = 0, [root]
+    while frontier:
+        nxt = [c for n in frontier for c in (left[n], right[n]) if c >= 0]
+        if not nxt:
+            break
+        depth += 1
+        frontier = nxt
+    return depth
+
+
+class _TreeEnsemble:
+    """All trees concatenated into flat arrays.
+
+    Leaves point back at themselves, so every row can walk ``depth``
+    steps without branching on whether it already reached a leaf.
+    """
+
+    def __init__(self, trees, base, scale, strict, zero_is_missing=False):
+        feature, threshold, left, right, value, missing_left, roots = [], [], [], [], [], [], []
+        depth = 0
+        offset = 0
+        for t in trees:
+            n = len(t["feature"])
+            idx = np.arange(n)
+            leaf = t["left"] < 0
+            feature.append(np.where(leaf, 0, t["feature"]))
+            threshold.append(t["threshold"])
+            left.append(np.where(leaf, idx, t["left"]) + offset)
+            right.append(np.where(leaf, idx, t["right"]) + offset)
+            value.append(t["value"])
+            missing_left.append(t["missing_left"])
+            roots.append(offset)
+            depth = max(depth, t["depth"])
+            offset += n
+
+        self.feature = np.concatenate(feature).astype(np.intp)
+        self.threshold = np.concatenate(threshold)
+        self.left = np.concatenate(left).astype(np.intp)
+        self.right = np.concatenate(right).astype(np.intp)
+        self.value = np.concatenate(value).astype(np.float64)
+        self.missing_left = np.concatenate(missing_left).astype(bool)
+        self.roots = np.asarray(roots, dtype=np.intp)
+        self.depth = depth
+        self.base = float(base)
+        self.scale = float(scale)
+        self.strict = strict
+        self.zero_is_missing = zero_is_missing
+
+    def predict(self, X):
+        # Both sklearn and XGBoost compare float32 features against their thresholds
+        X = X.astype(np.float32)
+        if self.zero_is_missing:
+            # XGBoost reads the implicit zeros of a CSR matrix as missing values
+            X[X == 0] = np.nan
+        has_nan = np.isnan(X).any()
+        rows = np.arange(X.shape[0])[:, None]
+        node = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+        for _ in range(self.depth):
+            x = X[rows, self.feature[node]]
+            go_left = x < self.threshold[node] if self.strict else x <= self.threshold[node]
+            if has_nan:
+                go_left |= np.isnan(x) & self.missing_left[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.base + self.scale * self.value[node].sum(axis=1)
+
+
+class _LinearModel:
+    def __init__(self, coef, intercept):
+        self.coef = np.asarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(np.ravel(intercept)[0]) if np.ndim(intercept) else float(intercept)
+
+    def predict(self, X):
+        return X @ self.coef + self.intercept
+
+
+def _sklearn_tree(estimator):
+    t = estimator.tree_
+    missing = getattr(t, "missing_go_to_left", None)
+    return {
+        "feature": t.feature,
+        "threshold": t.threshold,
+        "left": t.children_left,
+        "right": t.children_right,
+        "value": t.value[:, 0, 0],
+        "missing_left": np.zeros(t.node_count, dtype=bool) if missing is None else missing,
+        "depth": t.max_depth,
+    }
+
+
+def _xgboost_trees(estimator):
+    booster = estimator.get_booster()
+    learner = json.loads(booster.save_raw("json"))["learner"]
+    if learner["objective"]["name"] != "reg:squarederror":
+        raise ModelCompileError(f"Unsupported XGBoost objective: {learner['objective']['name']}")
+    base_score = float(learner["learner_model_param"]["base_score"].strip("[]"))
+
+    model = learner["gradient_booster"]["model"]
+    trees = model["trees"]
+    best_iteration = getattr(estimator, "best_iteration", None)
+    if best_iteration is not None:
+        per_round = int(model["gbtree_model_param"].get("num_parallel_tree", 1))
+        trees = trees[:(best_iteration + 1) * per_round]
+
+    flat = []
+    for tree in trees:
+        if any(tree["split_type"]):
+            raise ModelCompileError("Categorical XGBoost splits are not supported")
+        left = np.asarray(tree["left_children"], dtype=np.intp)
+        right = np.asarray(tree["right_children"], dtype=np.intp)
+        conditions = np.asarray(tree["split_conditions"], dtype=np.float32)
+        flat.append({
+            "feature": np.asarray(tree["split_indices"], dtype=np.intp),
+            "threshold": conditions,
+            "left": left,
+            "right": right,
+            # Leaf weights are stored in split_conditions, already shrunk by eta
+            "value": conditions.astype(np.float64),
+            "missing_left": np.asarray(tree["default_left"], dtype=bool),
+            "depth": _tree_depth(left, right),
+        })
+    return flat, base_score
+
+
+def zero_is_missing(prep, estimator) -> bool:
+    """True when ``estimator`` sees ``prep``'s zeros as missing values.
+
+    A ColumnTransformer with ``sparse_output_`` hands XGBoost a CSR
+    matrix, and XGBoost reads its implicit zeros as missing. Anything that
+    replays the model on a dense matrix has to set those zeros to NaN.
+    """
+    return type(estimator).__name__ == "XGBRegressor" and bool(getattr(prep, "sparse_output_", False))
+
+
+def _compile_estimator(estimator, zero_missing=False):
+    kind = type(estimator).__name__
+    if kind == "RandomForestRegressor" or kind == "ExtraTreesRegressor":
+        trees = [_sklearn_tree(e) for e in estimator.estimators_]
+        return _TreeEnsemble(trees, 0.0, 1.0 / len(trees), strict=False)
+    if kind == "GradientBoostingRegressor":
+        if estimator.init_ == "zero":
+            base = 0.0
+        elif hasattr(estimator.init_, "constant_"):
+            base = np.ravel(estimator.init_.constant_)[0]
+        else:
+            raise ModelCompileError("Only constant GradientBoosting initial estimators are supported")
+        trees = [_sklearn_tree(e) for e in estimator.estimators_[:, 0]]
+        return _TreeEnsemble(trees, base, estimator.learning_rate, strict=False)
+    if kind == "DecisionTreeRegressor":
+        return _TreeEnsemble([_sklearn_tree(estimator)], 0.0, 1.0, strict=False)
+    if kind == "XGBRegressor":
+        trees, base_score = _xgboost_trees(estimator)
+        return _TreeEnsemble(trees, base_score, 1.0, strict=True, zero_is_missing=zero_missing)
+    if isinstance(estimator, (LinearRegression, Ridge)):
+        return _LinearModel(estimator.coef_, estimator.intercept_)
+    raise ModelCompileError(f"Unsupported estimator: {kind}")
+
+
+# -------------------------------
+# PUBLIC API
+# -------------------------------
+class CompiledPredictor:
+    """Array-only replacement for ``pipeline.predict``.
+
+    Accepts anything indexable by column name: a dict of scalars (one row),
+    a dict of arrays, a structured NumPy array or a DataFrame.
+    """
+
+    def __init__(self, blocks, n_features: int, estimator):
+        self.blocks = blocks
+        self.n_features = n_features
+        self.estimator = estimator
+        self.input_columns: List[str] = [c for b in blocks for c in b.columns]
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "CompiledPredictor":
+        try:
+            prep = pipeline.named_steps["prep"]
+            estimator = pipeline.named_steps["model"]
+        except (AttributeError, KeyError):
+            raise ModelCompileError("Expected a Pipeline with 'prep' and 'model' steps")
+        blocks, n_features = _compile_preprocessor(prep)
+        return cls(blocks, n_features, _compile_estimator(estimator, zero_is_missing(prep, estimator)))
+
+    def _n_rows(self, records) -> int:
+        if isinstance(records, np.ndarray):
+            return len(records)
+        return np.asarray(records[self.input_columns[0]]).size
+
+    def transform(self, records) -> np.ndarray:
+        """Dense equivalent of ``pipeline.named_steps['prep'].transform``."""
+        missing = [c for c in self.input_columns if c not in _field_names(records)]
+        if missing:
+            raise ValueError(f"columns are missing: {set(missing)}")
+        X = np.zeros((self._n_rows(records), self.n_features), dtype=np.float64)
+        for block in self.blocks:
+            block.write(records, X)
+        return X
+
+    def predict(self, records) -> np.ndarray:
+        n = self._n_rows(records)
+        if n <= BLOCK_SIZE:
+            return self.estimator.predict(self.transform(records))
+        if isinstance(records, Mapping):
+            # Convert each column once; converting a pandas (e.g. Arrow-backed) column per block is quadratic
+            records = {k: np.asarray(v) for k, v in records.items()}
+        # Transform block by block so the dense feature matrix stays bounded
+        return np.concatenate([
+            self.estimator.predict(self.transform(_slice_rows(records, start, start + BLOCK_SIZE)))
+            for start in range(0, n, BLOCK_SIZE)
+        ])
+
+    def predict_one(self, row: Mapping) -> float:
+        return float(self.predict(row)[0])
+
+
+def _field_names(records):
+    if isinstance(records, np.ndarray):
+        return records.dtype.names or ()
+    return records.keys() if isinstance(records, Mapping) else records.columns
+
+
+def _slice_rows(records, start, stop):
+    if isinstance(records, np.ndarray):
+        return records[start:stop]
+    if isinstance(records, Mapping):
+        return {k: np.asarray(v)[start:stop] for k, v in records.items()}
+    return records.iloc[start:stop]
+
+
+def compile_pipeline(pipeline) -> CompiledPredictor:
+    return CompiledPredictor.from_pipeline(pipeline)
@@ -0,0 +1,176 @@
+# config.py - shared constants for the Salary Prediction System
+
+# -------------------------------
+# MARKET DATA
+# -------------------------------
+ALPHA_VANTAGE_API = "BU3EDDWZ30K6YMPF"
+ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+MARKET_SYMBOL = "SPY"
+FALLBACK_MARKET_INDEX = 400.0
+
+# Seconds between background refreshes, and age after which a quote is stale
+MARKET_REFRESH_INTERVAL = 300
+MARKET_TTL = 900
+MARKET_TIMEOUT = 10
+
+# -------------------------------
+# BATCH PREDICTION
+# -------------------------------
+# Required columns for your model
+REQUIRED_COLUMNS = [
+    "Age", "Gender", "Education Level", "Job Title",
+    "Years of Experience", "Industry", "Location", "Company Size"
+]
+
+# Optional columns
+OPTIONAL_SKILLS = [
+    "Skill_Python", "Skill_SQL", "Skill_Machine_Learning",
+    "Skill_Data_Visualization", "Skill_Project_Management"
+]
+
+# Streaming batch scoring: rows per chunk, working-set budget for one chunk,
+# and how much scored output stays in RAM before spilling to disk
+DEFAULT_CHUNK_SIZE = 50_000
+BATCH_MEMORY_BUDGET = 256 * 1024 * 1024
+SPOOL_MAX_SIZE = 32 * 1024 * 1024
+# Uploads larger than this default to streaming mode on the Batch page
+STREAM_UPLOAD_THRESHOLD = 50 * 1024 * 1024
+# PDF uploads: pages per extraction task, and the page count below which
+# extraction stays in-process instead of starting a pool
+PDF_PAGES_PER_TASK = 8
+PDF_PARALLEL_MIN_PAGES = 32
+# Parsed, prepared and scored uploads kept across reruns (LRU beyond this many bytes)
+UPLOAD_CACHE_BUDGET = 512 * 1024 * 1024
+
+# -------------------------------
+# MODEL
+# -------------------------------
+# Tried in order, mirroring where the training notebook may have saved it
+MODEL_PATHS = ["best_salary_model.pkl", "models/best_salary_model.pkl", "best_model.pkl"]
+
+# -------------------------------
+# SINGLE PREDICTION FORM
+# -------------------------------
+# The form's bounded inputs; the prediction lookup table covers exactly these
+FORM_AGE_RANGE = (18, 65)
+FORM_EXPERIENCE_RANGE = (0, 40)
+FORM_GENDERS = ["Male", "Female", "Other"]
+FORM_EDUCATION_LEVELS = ["High School", "Bachelor's", "Master's", "PhD"]
+FORM_INDUSTRIES = ["Technology", "Finance", "Healthcare", "Education", "Manufacturing", "Retail", "Consulting",
+                   "Other"]
+FORM_LOCATIONS = ["Enugu", "Lagos", "Abuja", "Port Harcourt", "Kano", "Ibadan", "Kaduna", "Other"]
+FORM_COMPANY_SIZES = ["Small (1-50)", "Medium (51-250)", "Large (251+)"]
+FORM_SKILLS = ["Python", "SQL", "Machine Learning", "Data Visualization",
+               "Project Management", "AWS/Azure", "Excel", "Power BI", "Tableau"]
+
+# Precomputed single predictions (salary_ai/lookup_table.py): largest table built,
+# random rows checked against model.predict, and the largest difference allowed ($)
+LOOKUP_MAX_CELLS = 100_000_000
+LOOKUP_VERIFY_SAMPLES = 10_000
+LOOKUP_TOLERANCE = 0.5
+
+# -------------------------------
+# EXPLANATIONS
+# -------------------------------
+# Time allowed for one single-prediction explanation; slower exact SHAP falls back to approximate
+EXPLAIN_LATENCY_BUDGET_MS = 50.0
+EXPLAIN_TOP_K = 5
+# Rows per SHAP call in batch explanations; bounds the (rows x preprocessed columns) matrices
+EXPLAIN_BLOCK_ROWS = 2_048
+
+# -------------------------------
+# TRAINING
+# -------------------------------
+RANDOM_STATE = 42
+TEST_SIZE = 0.2
+# Fitted preprocessors and their transformed matrices, one folder per (data, split, preprocessor)
+TRAINING_CACHE_DIR = ".training_cache"
+# Cores each candidate model may use (BLAS/OpenMP threads and n_jobs)
+CORES_PER_MODEL = 1
+# Labelled rows appended by salary_ai.incremental, one CSV part per upload
+TRAINING_STORE_DIR = ".training_store"
+# Share of each labelled upload held back, and how many of the newest held-back rows validate an update
+INCREMENTAL_HOLDOUT_FRACTION = 0.2
+INCREMENTAL_HOLDOUT_ROWS = 5_000
+# Trees (or boosting rounds) added per incremental update
+INCREMENTAL_ROUNDS = 50
+# An update is published only if its window RMSE is at most this much (relative) above the current model's
+INCREMENTAL_TOLERANCE = 0.0
+
+# -------------------------------
+# SCORING SERVICE
+# -------------------------------
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8000
+MAX_BATCH_SIZE = 64
+MAX_BATCH_WAIT_MS = 5.0
+MAX_REQUEST_BYTES = 1024 * 1024
+
+# -------------------------------
+# BENCHMARKS
+# -------------------------------
+# python -m salary_ai.bench: suite sizes, the stored baseline and the allowed slowdown
+BENCH_BATCH_SIZES = (1_000, 100_000, 1_000_000)
+BENCH_SAMPLE_SIZES = (100, 1_000, 5_000)
+BENCH_PREDICT_ROWS = 500
+BENCH_REPEAT = 3
+BENCH_BASELINE_PATH = "bench_baseline.json"
+BENCH_REGRESSION_THRESHOLD = 0.25
+
+# -------------------------------
+# PREDICTION CACHE
+# -------------------------------
+PREDICTION_CACHE_SIZE = 50_000
+# Market index values within the same bucket share cache entries (and are scored at the bucket)
+MARKET_INDEX_BUCKET = 1.0
+# Larger batches (streaming and parallel chunks) are scored without the cache
+PREDICTION_CACHE_MAX_ROWS = 1_000
+
+# -------------------------------
+# DATA & ANALYTICS
+# -------------------------------
+DATA_PATH = "Salary_Data.csv"
+TARGET = "Salary"
+
+# Experience buckets used by the aggregate cube: [lower, upper) in years
+EXPERIENCE_BUCKETS = [0, 3, 6, 11, 16, 21, 100]
+EXPERIENCE_LABELS = ["0-2", "3-5", "6-10", "11-15", "16-20", "21+"]
+
+# Fixed histogram bins for the cube's quantile sketches, so cubes stay mergeable
+CUBE_BIN_WIDTH = 1000
+CUBE_MAX_VALUE = 250_000
+
+# -------------------------------
+# CHARTS
+# -------------------------------
+# Point traces never carry more than this many rows; above it they are stratified samples
+CHART_POINT_LIMIT = 5_000
+# Point traces with more points than this are drawn with WebGL (Scattergl)
+WEBGL_THRESHOLD = 1_000
+# Grid resolution for violin densities and the 2D density background
+DENSITY_GRID_SIZE = 100
+
+# -------------------------------
+# THEME & STATIC ASSETS
+# -------------------------------
+THEMES = ("Light", "Dark")
+HOME_PAGE = "Single Prediction"
+# Served by Streamlit from ./static (server.enableStaticServing) under app/static
+STATIC_DIR = "static"
+STATIC_URL = "app/static"
+BACKGROUND_IMAGE = "blockchain-bg.jpg.webp"
+# Narrower variants of the background for small viewports (the original is always served too)
+BACKGROUND_WIDTHS = (480, 960, 1920)
+
+# -------------------------------
+# APP PAGES
+# -------------------------------
+# Page name -> module with its render(), imported the first time the page is shown
+PAGE_MODULES = {
+    "Single Prediction": "app_pages.single",
+    "Batch Prediction": "app_pages.batch",
+    "Data Analytics": "app_pages.analytics",
+    "About": "app_pages.about",
+}
+# What main_salary_app.py imports before any page (the import-time report's baseline)
+APP_SHELL_MODULES = ("streamlit", "app_pages", "app_pages.common", "salary_ai.theme")
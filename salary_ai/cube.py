@@ -0,0 +1,221 @@
+# cube.py - precomputed aggregate cube for the Data Analytics page
+"""Salary aggregates per cell of Industry x Location x Education x Job_Title
+x Experience_Bucket.
+
+Every cell keeps a row count, sum, sum of squares, min, max, per-measure
+sums and a fixed-bin salary histogram as its quantile sketch. Because
+all of these add up, a filter or a group-by is answered by summing cells
+instead of rescanning rows, and two cubes over the same bins can be merged.
+Dimensions a source does not have are left out of its cube.
+"""
+from typing import List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.config import (
+    CUBE_BIN_WIDTH,
+    CUBE_MAX_VALUE,
+    EXPERIENCE_BUCKETS,
+    EXPERIENCE_LABELS,
+    TARGET,
+)
+
+CUBE_DIMENSIONS = ["Industry", "Location", "Education", "Job_Title", "Experience_Bucket"]
+CUBE_MEASURES = ["Experience", "Age"]
+
+# Salary_Data.csv names -> the analytics names used by the dashboard
+_ANALYTICS_COLUMNS = {
+    "Job Title": "Job_Title",
+    "Education Level": "Education",
+    "Years of Experience": "Experience"
+}
+
+_N_BINS = CUBE_MAX_VALUE // CUBE_BIN_WIDTH + 1  # last bin takes everything above CUBE_MAX_VALUE
+
+
+# -------------------------------
+# INPUT FRAMES
+# -------------------------------
+def experience_bucket(years: pd.Series) -> pd.Series:
+    return pd.cut(years, EXPERIENCE_BUCKETS, right=False, labels=EXPERIENCE_LABELS)
+
+
+def analytics_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Cleaned Salary_Data.csv (or a synthetic sample) in the dashboard's column names."""
+    frame = df.rename(columns=_ANALYTICS_COLUMNS)
+    for col in ("Job_Title", "Education", "Industry", "Location"):
+        if col in frame.columns and frame[col].dtype == object:
+            frame[col] = frame[col].astype("category")
+    frame["Experience_Bucket"] = experience_bucket(frame["Experience"])
+    return frame
+
+
+def _salary_bins(values: np.ndarray) -> np.ndarray:
+    return np.clip(values // CUBE_BIN_WIDTH, 0, _N_BINS - 1).astype(np.intp)
+
+
+# -------------------------------
+# CUBE
+# -------------------------------
+class SalaryCube:
+    """Additive salary aggregates per dimension cell (see module docstring)."""
+
+    def __init__(self, cells: pd.DataFrame, hist: np.ndarray, dimensions: Sequence[str],
+                 measures: Sequence[str]):
+        self.cells = cells
+        self.hist = hist
+        self.dimensions = list(dimensions)
+        self.measures = list(measures)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, dimensions: Optional[Sequence[str]] = None,
+                   value: str = TARGET, measures: Sequence[str] = CUBE_MEASURES) -> "SalaryCube":
+        dimensions = [d for d in (dimensions or CUBE_DIMENSIONS) if d in frame.columns]
+        measures = [m for m in measures if m in frame.columns]
+        frame = frame[frame[value].notna()]
+
+        grouped = frame.groupby(dimensions, observed=True, sort=True, dropna=False)
+        codes = grouped.ngroup().to_numpy()
+        n_cells = grouped.ngroups
+        salary = frame[value].to_numpy(dtype=np.float64)
+
+        cells = grouped.size().rename("count").reset_index()
+        cells["sum"] = np.bincount(codes, weights=salary, minlength=n_cells)
+        cells["sumsq"] = np.bincount(codes, weights=salary * salary, minlength=n_cells)
+        cells["min"] = grouped[value].min().to_numpy()
+        cells["max"] = grouped[value].max().to_numpy()
+        for m in measures:
+            values = frame[m].to_numpy(dtype=np.float64)
+            present = ~np.isnan(values)
+            cells[f"{m}_sum"] = np.bincount(codes[present], weights=values[present], minlength=n_cells)
+            cells[f"{m}_count"] = np.bincount(codes[present], minlength=n_cells)
+
+        flat = codes * _N_BINS + _salary_bins(salary)
+        hist = np.bincount(flat, minlength=n_cells * _N_BINS).reshape(n_cells, _N_BINS).astype(np.int32)
+        return cls(cells, hist, dimensions, measures)
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.cells["count"].sum())
+
+    def members(self, dimension: str) -> List:
+        column = self.cells[dimension].dropna()
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            present = set(column)
+            return [c for c in column.cat.categories if c in present]
+        return sorted(column.unique().tolist())
+
+    def slice(self, filters: Mapping[str, Sequence]) -> "SalaryCube":
+        """Cells whose members are in ``filters[dim]``; dimensions not in the cube are ignored."""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for dim, members in filters.items():
+            if dim in self.dimensions and members is not None:
+                mask &= self.cells[dim].isin(list(members)).to_numpy()
+        return SalaryCube(self.cells[mask].reset_index(drop=True), self.hist[mask],
+                          self.dimensions, self.measures)
+
+    def merge(self, other: "SalaryCube") -> "SalaryCube":
+        """Cube over both sources; dimensions missing from either side are dropped."""
+        dimensions = [d for d in self.dimensions if d in other.dimensions]
+        measures = [m for m in self.measures if m in other.measures]
+        cube = SalaryCube(pd.concat([self.cells, other.cells], ignore_index=True),
+                          np.concatenate([self.hist, other.hist]), dimensions, measures)
+        return cube._reduce(dimensions)
+
+    def _reduce(self, by: Sequence[str], dropna: bool = False) -> "SalaryCube":
+        by = list(by)
+        source = self
+        if by and dropna:
+            # Like groupby's default: cells with a missing key are left out of the groups
+            keep = self.cells[by].notna().all(axis=1).to_numpy()
+            source = SalaryCube(self.cells[keep].reset_index(drop=True), self.hist[keep],
+                                self.dimensions, self.measures)
+        if by:
+            grouped = source.cells.groupby(by, observed=True, sort=True, dropna=False)
+            codes = grouped.ngroup().to_numpy()
+            cells = grouped.size().reset_index()[by]
+            n_groups = grouped.ngroups
+        else:
+            grouped = None
+            codes = np.zeros(len(source.cells), dtype=np.intp)
+            cells = pd.DataFrame(index=range(1))
+            n_groups = 1
+
+        additive = ["count", "sum", "sumsq"] + [
+            f"{m}_{s}" for m in self.measures for s in ("sum", "count")
+        ]
+        for col in additive:
+            cells[col] = np.bincount(codes, weights=source.cells[col].to_numpy(dtype=np.float64),
+                                     minlength=n_groups)
+        if grouped is not None:
+            cells["min"] = grouped["min"].min().to_numpy()
+            cells["max"] = grouped["max"].max().to_numpy()
+        else:
+            cells["min"] = source.cells["min"].min()
+            cells["max"] = source.cells["max"].max()
+
+        # Sum histogram rows per group: sort by group, then one reduceat over the runs
+        if len(codes):
+            order = np.argsort(codes, kind="stable")
+            starts = np.searchsorted(codes[order], np.arange(n_groups))
+            hist = np.add.reduceat(source.hist[order].astype(np.int64), starts, axis=0)
+        else:
+            hist = np.zeros((n_groups, _N_BINS), dtype=np.int64)
+        return SalaryCube(cells, hist, by, self.measures)
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Per-cell quantiles from the histogram sketch, shape ``(cells, len(qs))``.
+
+        Accurate to one bin (CUBE_BIN_WIDTH), and clamped to the exact min/max.
+        """
+        cum = np.cumsum(self.hist, axis=1)
+        counts = cum[:, -1]
+        result = np.full((len(cum), len(qs)), np.nan)
+        rows = np.arange(len(cum))
+        for j, q in enumerate(qs):
+            target = q * counts
+            idx = np.minimum((cum < target[:, None]).sum(axis=1), _N_BINS - 1)
+            before = np.where(idx > 0, cum[rows, idx - 1], 0)
+            in_bin = self.hist[rows, idx]
+            within = np.divide(target - before, in_bin, out=np.zeros(len(cum)), where=in_bin > 0)
+            result[:, j] = (idx + within) * CUBE_BIN_WIDTH
+        result = np.clip(result, self.cells["min"].to_numpy()[:, None], self.cells["max"].to_numpy()[:, None])
+        result[counts == 0] = np.nan
+        return result
+
+    def rollup(self, by: Sequence[str] = (), quantiles: Sequence[float] = (0.5,)) -> pd.DataFrame:
+        """Salary statistics per group of ``by`` (overall when empty)."""
+        reduced = self._reduce(by, dropna=True)
+        cells = reduced.cells
+        n = cells["count"].to_numpy()
+        total = cells["sum"].to_numpy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / n
+            var = np.maximum(cells["sumsq"].to_numpy() - total * mean, 0) / (n - 1)
+        stats = pd.DataFrame({
+            "count": n.astype(np.int64),
+            "mean": mean,
+            "std": np.where(n > 1, np.sqrt(var), np.nan),
+            "min": cells["min"].to_numpy(),
+            "max": cells["max"].to_numpy()
+        })
+        for q, values in zip(quantiles, reduced.quantiles(quantiles).T):
+            stats["median" if q == 0.5 else f"q{round(q * 100):g}"] = values
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for m in self.measures:
+                stats[f"{m}_mean"] = cells[f"{m}_sum"].to_numpy() / cells[f"{m}_count"].to_numpy()
+        if by:
+            stats.index = pd.MultiIndex.from_frame(cells[list(by)]) if len(by) > 1 else pd.Index(
+                cells[by[0]], name=by[0])
+        return stats
+
+    def summary(self, by: str) -> pd.DataFrame:
+        """The dashboard's summary table: salary stats plus mean of each measure per ``by``."""
+        stats = self.rollup([by])
+        table = pd.concat(
+            {TARGET: stats[["count", "mean", "median", "std", "min", "max"]]}
+            | {m: stats[[f"{m}_mean"]].set_axis(["mean"], axis=1) for m in self.measures},
+            axis=1
+        )
+        return table.round(0)
@@ -0,0 +1,64 @@
+# data.py - loading and cleaning Salary_Data.csv (ported from the training notebook)
+import os
+
+import pandas as pd
+
+from salary_ai.config import DATA_PATH
+from salary_ai.errors import SalarySystemError
+
+
+class SalaryDataLoader:
+    def __init__(self, path: str = DATA_PATH):
+        self.path = path
+        self.df = None
+
+    def load(self) -> pd.DataFrame:
+        try:
+            if not os.path.exists(self.path):
+                raise SalarySystemError("Dataset path no dey exist")
+
+            self.df = pd.read_csv(self.path)
+            return self.df
+
+        except Exception as e:
+            raise SalarySystemError(f"Data loading failed: {e}")
+
+
+class SalaryDataCleaner:
+    def __init__(self, df: pd.DataFrame):
+        self.df = df.copy()
+
+    def normalize_education(self):
+        edu_map = {
+            "Masters": "Master's",
+            "Master": "Master's",
+            "HighSchool": "High School",
+            "Highschool": "High School",
+            # Spellings found in Salary_Data.csv; the app offers the four short forms
+            "Bachelor's Degree": "Bachelor's",
+            "Master's Degree": "Master's",
+            "phD": "PhD"
+        }
+        self.df["Education Level"] = self.df["Education Level"].replace(edu_map)
+        return self
+
+    def strip_strings(self):
+        for col in self.df.select_dtypes(include="object").columns:
+            self.df[col] = self.df[col].str.strip()
+        return self
+
+    def handle_missing(self):
+        self.df = self.df.dropna(subset=["Salary"])
+        return self
+
+    def clean(self) -> pd.DataFrame:
+        return (
+            self.strip_strings()
+            .normalize_education()
+            .handle_missing()
+            .df
+        )
+
+
+def load_clean_data(path: str = DATA_PATH) -> pd.DataFrame:
+    return SalaryDataCleaner(SalaryDataLoader(path).load()).clean()
@@ -0,0 +1,16 @@
+# errors.py - exception hierarchy shared with the training notebook
+
+
+class SalarySystemError(Exception):
+    """Base exception for Salary AI system"""
+    pass
+
+
+class ModelCompileError(SalarySystemError):
+    """Raised when a fitted pipeline cannot be compiled to NumPy arrays"""
+    pass
+
+
+class BatchValidationError(SalarySystemError):
+    """Raised when an uploaded batch is missing required columns"""
+    pass
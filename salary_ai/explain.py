@@ -0,0 +1,350 @@
+# explain.py - per-prediction explanations for the fitted salary Pipeline
+"""Feature-name metadata and a cached SHAP TreeExplainer.
+
+``FeatureMetadata`` is computed once per model. It holds the
+preprocessor's output columns, their display labels, and the raw input
+field each column came from (every one-hot column of "Job Title" maps
+back to "Job Title"). ``Explainer`` wraps one ``shap.TreeExplainer`` for
+the pipeline's estimator. SHAP values are summed per raw field, so each
+prediction is explained in terms of the fields the user entered.
+
+Exact tree SHAP costs O(trees x leaves x depth^2) per row. If SHAP on
+one row takes longer than EXPLAIN_LATENCY_BUDGET_MS, the explainer
+switches to shap's approximate (Saabas) attributions, which follow a
+single root-to-leaf path per tree. When a CompiledPredictor is given, a
+row is preprocessed with its NumPy transform instead of through pandas
+and the sklearn ColumnTransformer. Either way SHAP sees the same missing
+values the model scores on: an XGBoost model fed CSR by its preprocessor
+reads zeros as missing, so they are set to NaN (see ``zero_is_missing``).
+
+For batches, ``BatchExplainer`` explains prepared chunks in blocks of
+EXPLAIN_BLOCK_ROWS rows. ``ParallelExplainer`` spreads those blocks over
+a spawn process pool. Both return the top-k raw fields per row as
+category columns plus float32 impact columns.
+"""
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.compiled_model import compile_pipeline, zero_is_missing
+from salary_ai.config import EXPLAIN_BLOCK_ROWS, EXPLAIN_LATENCY_BUDGET_MS, EXPLAIN_TOP_K
+from salary_ai.errors import ModelCompileError, SalarySystemError
+from salary_ai.features import FeatureBuilder, model_feature_columns
+from salary_ai.model_store import find_model_path, load_pipeline
+
+
+def clean_feature_name(name: str) -> str:
+    """"cat__Education Level_Master's" -> "Education Master's", for display."""
+    clean = name.replace('num__', '').replace('cat__', '')
+    clean = clean.replace('_', ' ')
+    clean = clean.replace('Education Level', 'Education')
+    clean = clean.replace('Job Title', 'Job')
+    return clean.replace('  ', ' ').strip()
+
+
+def _source_field(name: str, fields: Sequence[str]) -> str:
+    bare = name.split("__", 1)[-1]
+    if bare in fields:
+        return bare
+    # One-hot columns are "<field>_<category>"; the longest matching field wins
+    matches = [f for f in fields if bare.startswith(f + "_")]
+    return max(matches, key=len) if matches else bare
+
+
+def _as_frame(records) -> pd.DataFrame:
+    if isinstance(records, pd.DataFrame):
+        return records
+    first = next(iter(records.values()))
+    return pd.DataFrame(records, index=[0] if np.ndim(first) == 0 else None)
+
+
+def _require_shap():
+    try:
+        import shap
+    except ImportError:
+        raise SalarySystemError("Explanations require shap. Please install: `pip install shap`")
+    return shap
+
+
+# -------------------------------
+# FEATURE METADATA
+# -------------------------------
+@dataclass
+class FeatureMetadata:
+    """Names of the preprocessor's output columns and the raw field behind each one."""
+    names: List[str]
+    labels: List[str]
+    fields: List[str]
+    # (columns, fields) 0/1 matrix: per-column values @ group_matrix = per-field sums
+    group_matrix: np.ndarray
+    # Model-wide (label, importance), largest first, when the estimator has feature_importances_
+    global_factors: List[Tuple[str, float]] = field(default_factory=list)
+
+    @classmethod
+    def from_pipeline(cls, model, top_k: int = EXPLAIN_TOP_K) -> "FeatureMetadata":
+        names = [str(n) for n in model.named_steps["prep"].get_feature_names_out()]
+        labels = [clean_feature_name(n) for n in names]
+        fields = list(model_feature_columns(model))
+        sources = [_source_field(n, fields) for n in names]
+        # Output columns that match no input field (e.g. a remainder) are fields of their own
+        fields += [s for s in dict.fromkeys(sources) if s not in fields]
+
+        group_matrix = np.zeros((len(names), len(fields)), dtype=np.float64)
+        group_matrix[np.arange(len(names)), [fields.index(s) for s in sources]] = 1.0
+
+        global_factors = []
+        importances = getattr(model.named_steps["model"], "feature_importances_", None)
+        if importances is not None:
+            order = np.argsort(-np.asarray(importances))[:top_k]
+            global_factors = [(labels[i], float(importances[i])) for i in order]
+        return cls(names, labels, fields, group_matrix, global_factors)
+
+    def group(self, values: np.ndarray) -> np.ndarray:
+        """``(rows, columns)`` per-column values summed into ``(rows, fields)``."""
+        return values @ self.group_matrix.astype(values.dtype, copy=False)
+
+
+# -------------------------------
+# SHAP EXPLAINER
+# -------------------------------
+@dataclass
+class Explanation:
+    base_value: float
+    prediction: float
+    # (raw field, contribution in salary units), largest magnitude first
+    contributions: List[Tuple[str, float]]
+
+
+class Explainer:
+    """One shap.TreeExplainer per model, with contributions reported per raw input field."""
+
+    def __init__(self, model, metadata: Optional[FeatureMetadata] = None, compiled=None,
+                 budget_ms: float = EXPLAIN_LATENCY_BUDGET_MS):
+        shap = _require_shap()
+        estimator = model.named_steps["model"]
+        try:
+            self._tree = shap.TreeExplainer(estimator)
+        except Exception as e:  # shap raises a bare Exception for models it does not support
+            raise SalarySystemError(f"No SHAP tree explainer for {type(estimator).__name__}: {e}")
+        self.prep = model.named_steps["prep"]
+        self.zero_is_missing = zero_is_missing(self.prep, estimator)
+        self.compiled = compiled
+        self.metadata = metadata or FeatureMetadata.from_pipeline(model)
+        self.budget_ms = budget_ms
+        self.approximate = False
+        self.latency_ms = self._calibrate()
+        # Read after the first shap_values call: for XGBoost, shap replaces its initial
+        # estimate (the trees' cover-weighted mean) with the booster's own bias term then
+        self.base_value = float(np.ravel(self._tree.expected_value)[0])
+
+    def _time_one(self, X) -> float:
+        start = time.perf_counter()
+        self._shap_values(X)
+        return (time.perf_counter() - start) * 1000
+
+    def _calibrate(self) -> float:
+        probe = np.zeros((1, len(self.metadata.names)))
+        self._shap_values(probe)  # the first call pays shap's one-off setup
+        latency = self._time_one(probe)
+        if latency > self.budget_ms:
+            self.approximate = True
+            latency = self._time_one(probe)
+        return latency
+
+    def _shap_values(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(self._tree.shap_values(X, approximate=self.approximate, check_additivity=False))
+
+    def transform(self, records) -> np.ndarray:
+        """Model features (a row, a mapping of columns or a DataFrame) -> dense preprocessed matrix."""
+        if self.compiled is not None:
+            X = self.compiled.transform(records)
+        else:
+            X = self.prep.transform(_as_frame(records))
+            if hasattr(X, "toarray"):
+                X = X.toarray()
+            X = np.asarray(X, dtype=np.float64)
+        if self.zero_is_missing:
+            X[X == 0] = np.nan
+        return X
+
+    def field_contributions(self, records) -> np.ndarray:
+        """``(rows, fields)`` SHAP values in salary units, one column per raw input field."""
+        return self.metadata.group(self._shap_values(self.transform(records)))
+
+    def explain(self, records, top_k: int = EXPLAIN_TOP_K) -> Explanation:
+        """The first row of ``records`` explained by its ``top_k`` largest contributions."""
+        contributions = self.field_contributions(records)[0]
+        order = np.argsort(-np.abs(contributions))[:top_k]
+        return Explanation(
+            base_value=self.base_value,
+            prediction=self.base_value + float(contributions.sum()),
+            contributions=[(self.metadata.fields[i], float(contributions[i])) for i in order]
+        )
+
+
+# -------------------------------
+# BATCH EXPLANATIONS
+# -------------------------------
+def top_contributors(contributions: np.ndarray, fields: Sequence[str], top_k: int = EXPLAIN_TOP_K,
+                     index=None) -> pd.DataFrame:
+    """``(rows, fields)`` contributions -> ``Top_<i>_Factor`` (category) and ``Top_<i>_Impact`` (float32)."""
+    k = min(top_k, contributions.shape[1])
+    order = np.argsort(-np.abs(contributions), axis=1, kind="stable")[:, :k]
+    impacts = np.take_along_axis(contributions, order, axis=1).astype(np.float32, copy=False)
+    columns = {}
+    for i in range(k):
+        columns[f"Top_{i + 1}_Factor"] = pd.Categorical.from_codes(order[:, i], categories=list(fields))
+        columns[f"Top_{i + 1}_Impact"] = impacts[:, i]
+    return pd.DataFrame(columns, index=index)
+
+
+class BatchExplainer:
+    """Top-k SHAP contributors for prepared batch chunks.
+
+    SHAP runs on ``block_rows`` rows per call. The whole block is
+    preprocessed and explained as one matrix rather than row by row.
+    """
+
+    def __init__(self, explainer: Explainer, builder, top_k: int = EXPLAIN_TOP_K,
+                 block_rows: int = EXPLAIN_BLOCK_ROWS):
+        self.explainer = explainer
+        self.builder = builder
+        self.top_k = top_k
+        self.block_rows = block_rows
+
+    @property
+    def fields(self) -> List[str]:
+        return self.explainer.metadata.fields
+
+    def contributions(self, frame: pd.DataFrame) -> np.ndarray:
+        """``(rows, fields)`` float32 SHAP values for a prepared frame."""
+        out = np.empty((len(frame), len(self.fields)), dtype=np.float32)
+        for start in range(0, len(frame), self.block_rows):
+            block = frame.iloc[start:start + self.block_rows]
+            out[start:start + len(block)] = self.explainer.field_contributions(self.builder.build(block))
+        return out
+
+    def __call__(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return top_contributors(self.contributions(frame), self.fields, self.top_k, frame.index)
+
+
+def load_batch_explainer(model_path: Optional[str] = None, top_k: int = EXPLAIN_TOP_K,
+                         block_rows: int = EXPLAIN_BLOCK_ROWS) -> BatchExplainer:
+    model = load_pipeline(model_path)
+    try:
+        compiled = compile_pipeline(model)
+    except (ModelCompileError, AttributeError):
+        compiled = None
+    return BatchExplainer(Explainer(model, compiled=compiled), FeatureBuilder.from_model(model), top_k, block_rows)
+
+
+_worker_explainer = None
+
+
+def _init_worker(model_path: str, block_rows: int):
+    # Runs once per worker process: each worker builds its own TreeExplainer
+    global _worker_explainer
+    _worker_explainer = load_batch_explainer(model_path, block_rows=block_rows)
+
+
+def _explain_shard(shard: pd.DataFrame) -> np.ndarray:
+    return _worker_explainer.contributions(shard)
+
+
+def _fields(_) -> List[str]:
+    return _worker_explainer.fields
+
+
+class ParallelExplainer:
+    """BatchExplainer whose blocks are spread over a spawn process pool, merged in order."""
+
+    def __init__(self, model_path: Optional[str] = None, workers: Optional[int] = None,
+                 top_k: int = EXPLAIN_TOP_K, block_rows: int = EXPLAIN_BLOCK_ROWS):
+        self.model_path = os.path.abspath(find_model_path(model_path))
+        self.workers = workers or os.cpu_count() or 1
+        self.top_k = top_k
+        self.block_rows = block_rows
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model_path, block_rows)
+        )
+        self._fields = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def warm_up(self):
+        """Start every worker (and build its explainer) ahead of the first chunk."""
+        self._fields = list(self._pool.map(_fields, range(self.workers)))[0]
+
+    def contributions(self, frame: pd.DataFrame) -> np.ndarray:
+        if self._fields is None:
+            self.warm_up()
+        if len(frame) == 0:
+            return np.empty((0, len(self._fields)), dtype=np.float32)
+        # A few shards per worker, each a whole number of blocks
+        per_shard = math.ceil(len(frame) / (self.workers * 2) / self.block_rows) * self.block_rows
+        shards = (frame.iloc[start:start + per_shard] for start in range(0, len(frame), per_shard))
+        return np.concatenate(list(self._pool.map(_explain_shard, shards)))
+
+    def __call__(self, frame: pd.DataFrame) -> pd.DataFrame:
+        contributions = self.contributions(frame)
+        return top_contributors(contributions, self._fields, self.top_k, frame.index)
+
+
+# Salary units; XGBoost sums its leaves in float32
+_ADDITIVITY_ATOL = 0.5
+
+
+def _additive(explainer: Explainer, contributions: np.ndarray, predicted: np.ndarray) -> bool:
+    # base + per-field contributions must reproduce the model's own prediction (float32 storage)
+    total = explainer.base_value + contributions.sum(axis=1, dtype=np.float64)
+    return bool(np.allclose(total, predicted, rtol=1e-5, atol=_ADDITIVITY_ATOL))
+
+
+def benchmark_explain(frame: pd.DataFrame, block_sizes: Iterable[int] = (256, 1_024, 4_096),
+                      worker_counts: Iterable[int] = (1, 2, 4),
+                      model_path: Optional[str] = None) -> pd.DataFrame:
+    """Explanation throughput per block size and worker count (0 = in-process).
+
+    ``frame`` is a prepared batch (schema-typed, with the market index).
+    Every run is checked against the in-process contributions for the same
+    block size (``matches``) and against ``model.predict`` (``additive``).
+    """
+    model = load_pipeline(model_path)
+    predicted = model.predict(FeatureBuilder.from_model(model).frame(frame))
+    results = []
+    for block_rows in block_sizes:
+        serial = load_batch_explainer(model_path, block_rows=block_rows)
+        start = time.perf_counter()
+        expected = serial.contributions(frame)
+        seconds = time.perf_counter() - start
+        results.append({"workers": 0, "block_rows": block_rows, "rows": len(frame), "seconds": seconds,
+                        "rows_per_sec": len(frame) / seconds, "matches": True,
+                        "additive": _additive(serial.explainer, expected, predicted)})
+        for workers in worker_counts:
+            with ParallelExplainer(model_path, workers, block_rows=block_rows) as explainer:
+                explainer.warm_up()
+                start = time.perf_counter()
+                contributions = explainer.contributions(frame)
+                seconds = time.perf_counter() - start
+            results.append({"workers": workers, "block_rows": block_rows, "rows": len(frame),
+                            "seconds": seconds, "rows_per_sec": len(frame) / seconds,
+                            "matches": bool(np.allclose(contributions, expected, rtol=1e-5, atol=1e-2)),
+                            "additive": _additive(serial.explainer, contributions, predicted)})
+    return pd.DataFrame(results)
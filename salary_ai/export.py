@@ -0,0 +1,141 @@
+# export.py - on-demand exports of batch results
+"""Write scored rows (or their BatchSummary) to a file only when asked to.
+
+Rows are written chunk by chunk through the batch sinks, from a frame in
+slices or from the streaming scorer's spooled output. Export memory is
+one chunk plus the compressor, whatever the batch size. Outputs are
+SpooledTemporaryFiles, so large exports go to disk.
+"""
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Mapping
+
+import pandas as pd
+
+from salary_ai.batch import ArrowSink, CsvChunkReader, CsvSink, GzipCsvSink, ParquetSink
+from salary_ai.config import DEFAULT_CHUNK_SIZE, SPOOL_MAX_SIZE
+from salary_ai.errors import SalarySystemError
+from salary_ai.summary import BatchSummary
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    label: str
+    extension: str
+    mime: str
+    sink: Callable
+
+
+ROW_FORMATS = {
+    "csv": ExportFormat("CSV", "csv", "text/csv", CsvSink),
+    "csv.gz": ExportFormat("CSV (gzip)", "csv.gz", "application/gzip", GzipCsvSink),
+    "parquet": ExportFormat("Parquet", "parquet", "application/vnd.apache.parquet", ParquetSink),
+    "arrow": ExportFormat("Arrow IPC", "arrow", "application/vnd.apache.arrow.file", ArrowSink)
+}
+
+XLSX_FORMAT = ExportFormat(
+    "Excel summary (XLSX)", "xlsx",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", None
+)
+
+REPORT_FORMAT = ExportFormat("Summary report (TXT)", "txt", "text/plain", None)
+
+# Sheet names are capped at 31 characters by Excel
+_SHEET_NAME_LIMIT = 31
+
+
+# -------------------------------
+# ROW EXPORTS
+# -------------------------------
+def frame_chunks(frame: pd.DataFrame, chunk_rows: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(frame), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def spooled_chunks(output, chunk_rows: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Re-read a streaming scorer's CSV output in chunks, without loading all of it."""
+    output.seek(0)
+    yield from CsvChunkReader(output, chunk_rows)
+
+
+def export_rows(chunks: Iterable[pd.DataFrame], fmt: str, output=None):
+    """Write ``chunks`` in ``fmt`` (a ROW_FORMATS key) and return the rewound output."""
+    if fmt not in ROW_FORMATS:
+        raise SalarySystemError(f"Unknown export format: {fmt}")
+    sink = ROW_FORMATS[fmt].sink(output)
+    for chunk in chunks:
+        sink.write(chunk)
+    sink.finish()
+    return sink.output
+
+
+# -------------------------------
+# XLSX SUMMARY
+# -------------------------------
+def _require_openpyxl():
+    try:
+        import openpyxl
+    except ImportError:
+        raise SalarySystemError("Excel export requires openpyxl. Please install: `pip install openpyxl`")
+    return openpyxl
+
+
+def _cell(value):
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def write_summary_xlsx(sheets: Mapping[str, pd.DataFrame], output=None):
+    """One sheet per table, written row by row by a write-only workbook."""
+    openpyxl = _require_openpyxl()
+    if output is None:
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode="w+b")
+
+    workbook = openpyxl.Workbook(write_only=True)
+    for name, table in sheets.items():
+        sheet = workbook.create_sheet(title=name[:_SHEET_NAME_LIMIT])
+        table = table.reset_index() if table.index.name or isinstance(table.index, pd.MultiIndex) else table
+        sheet.append([str(c) for c in table.columns])
+        for row in table.itertuples(index=False):
+            sheet.append([_cell(v) for v in row])
+    workbook.save(output)
+    output.seek(0)
+    return output
+
+
+def summary_sheets(summary: BatchSummary) -> dict:
+    """Tables for the XLSX summary: overall statistics, top job titles and per-group stats."""
+    sheets = {
+        "Summary": pd.DataFrame({
+            "Statistic": ["Records", "Average", "Median", "Highest", "Lowest", "Standard Deviation"],
+            "Value": [summary.rows, summary.mean, summary.median, summary.max, summary.min, summary.std]
+        }),
+        "Top Job Titles": summary.top("Job Title", 10).rename("Average Predicted_Salary").to_frame()
+    }
+    for column, name in (("Industry", "By Industry"), ("Education Level", "By Education")):
+        sheets[name] = summary.by(column)
+    return sheets
+
+
+# -------------------------------
+# TEXT REPORT
+# -------------------------------
+def summary_report(summary: BatchSummary) -> str:
+    report = f"""Salary Prediction Report
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Records Processed: {summary.rows}
+
+Summary Statistics:
+- Average Salary: ${summary.mean:,.0f}
+- Median Salary: ${summary.median:,.0f}
+- Highest Salary: ${summary.max:,.0f}
+- Lowest Salary: ${summary.min:,.0f}
+- Standard Deviation: ${summary.std:,.0f}
+
+Top 5 Job Titles by Average Salary:
+"""
+    for job, salary in summary.top("Job Title", 5).items():
+        report += f"\n- {job}: ${salary:,.0f}"
+    return report
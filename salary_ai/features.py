@@ -0,0 +1,159 @@
+# features.py - model input assembly shared by single and batch prediction
+"""One FeatureBuilder per model, driven by the pipeline's own input columns.
+
+Records come in as a DataFrame, a mapping of columns, or a single record
+(a mapping of scalars, i.e. N=1). The builder returns exactly the
+pipeline's columns in the pipeline's order:
+- Skill columns the records lack are zero-filled.
+- The market index goes into whichever column name the model was trained
+  with ("Market Index" or "Market_Index"), whichever name the caller used.
+- Extra columns are dropped.
+Every column is handled as a whole array, so N=1 and N=1,000,000 take the
+same code path.
+"""
+import time
+from typing import Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.config import OPTIONAL_SKILLS, REQUIRED_COLUMNS
+from salary_ai.errors import BatchValidationError
+
+MARKET_COLUMNS = ("Market_Index", "Market Index")
+SKILL_PREFIX = "Skill_"
+
+# Used when a model does not record its input columns
+DEFAULT_FEATURES = [*REQUIRED_COLUMNS, *OPTIONAL_SKILLS, "Market_Index"]
+
+
+def model_feature_columns(model) -> List[str]:
+    """Input columns the fitted pipeline reads, in its own order."""
+    prep = model.named_steps["prep"]
+    if hasattr(prep, "feature_names_in_"):
+        return list(prep.feature_names_in_)
+    return [c for _, _, cols in prep.transformers_ if not isinstance(cols, str) for c in cols]
+
+
+def skill_column(skill: str) -> str:
+    """"Data Visualization" -> "Skill_Data_Visualization", "AWS/Azure" -> "Skill_AWS_Azure"."""
+    return SKILL_PREFIX + skill.replace(" ", "_").replace("/", "_")
+
+
+def _n_rows(records) -> int:
+    if isinstance(records, pd.DataFrame):
+        return len(records)
+    for value in records.values():
+        return np.size(value) if not isinstance(value, str) else 1
+    return 0
+
+
+def _column(records, name: str, n: int):
+    if isinstance(records, pd.DataFrame):
+        return records[name]
+    value = records[name]
+    if isinstance(value, str) or np.ndim(value) == 0:
+        return np.full(n, value, dtype=object if isinstance(value, str) else None)
+    return np.asarray(value)
+
+
+class FeatureBuilder:
+    """Assembles the model's input columns from raw records (see module docstring)."""
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns: List[str] = list(columns)
+        self.market_column = next((c for c in self.columns if c in MARKET_COLUMNS), None)
+        self.skill_columns = [c for c in self.columns if c.startswith(SKILL_PREFIX)]
+
+    @classmethod
+    def from_model(cls, model) -> "FeatureBuilder":
+        try:
+            return cls(model_feature_columns(model))
+        except (AttributeError, KeyError, TypeError):
+            return cls(DEFAULT_FEATURES)
+
+    def _market(self, records, n: int, market_index: Optional[float]):
+        if market_index is not None:
+            return np.full(n, float(market_index))
+        for name in MARKET_COLUMNS:
+            if name in records:
+                return _column(records, name, n)
+        raise BatchValidationError("No market index given and none in the records")
+
+    def build(self, records, market_index: Optional[float] = None) -> dict:
+        """``{column: values}`` in model order, one value per record."""
+        n = _n_rows(records)
+        missing = [c for c in self.columns
+                   if c not in records and c != self.market_column and c not in self.skill_columns]
+        if missing:
+            raise BatchValidationError(f"Missing required columns: {missing}")
+
+        built = {}
+        for name in self.columns:
+            if name == self.market_column:
+                built[name] = self._market(records, n, market_index)
+            elif name in records:
+                built[name] = _column(records, name, n)
+            else:  # a skill the records do not mention
+                built[name] = np.zeros(n, dtype=np.int8)
+        return built
+
+    def frame(self, records, market_index: Optional[float] = None) -> pd.DataFrame:
+        """``build`` as a DataFrame, for estimators that select columns by name."""
+        index = records.index if isinstance(records, pd.DataFrame) else None
+        return pd.DataFrame(self.build(records, market_index), index=index)
+
+    def form_row(self, values: Mapping, skills: Iterable[str] = (),
+                 market_index: Optional[float] = None) -> dict:
+        """One record from the Single Prediction form: field values plus the selected skill names."""
+        record = dict(values)
+        for skill in skills:
+            record[skill_column(skill)] = 1
+        return {name: column[0] for name, column in self.build(record, market_index).items()}
+
+
+class FeaturePredictor:
+    """A predict function that assembles its model's features first.
+
+    ``columnar`` predictors (the compiled engine) get the built columns
+    directly; others get them as a DataFrame.
+    """
+
+    def __init__(self, predict, builder: FeatureBuilder, columnar: bool = False):
+        self.predict_fn = predict
+        self.builder = builder
+        self.columnar = columnar
+
+    def __call__(self, records, market_index: Optional[float] = None) -> np.ndarray:
+        if self.columnar:
+            return self.predict_fn(self.builder.build(records, market_index))
+        return self.predict_fn(self.builder.frame(records, market_index))
+
+
+def benchmark_features(builder: FeatureBuilder, frame: pd.DataFrame, market_index: float = 400.0,
+                       single_rows: int = 1_000, predict=None) -> pd.DataFrame:
+    """Per-row cost of the form path (N=1, one call per row) and the batch path.
+
+    Times feature assembly alone, or assembly plus ``predict`` (which takes
+    built columns, e.g. ``CompiledPredictor.predict``) when one is given.
+    """
+    records = frame.head(single_rows).to_dict("records")
+    start = time.perf_counter()
+    for record in records:
+        row = builder.form_row(record, market_index=market_index)
+        if predict is not None:
+            predict(row)
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = builder.build(frame, market_index)
+    if predict is not None:
+        predict(columns)
+    batch_seconds = time.perf_counter() - start
+
+    return pd.DataFrame([
+        {"path": "single", "rows": len(records), "seconds": single_seconds,
+         "us_per_row": single_seconds / max(len(records), 1) * 1e6},
+        {"path": "batch", "rows": len(frame), "seconds": batch_seconds,
+         "us_per_row": batch_seconds / max(len(frame), 1) * 1e6}
+    ])
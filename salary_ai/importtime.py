@@ -0,0 +1,138 @@
+# importtime.py - per-page import-time report for the Streamlit app
+"""Cold-start import cost of the app shell and each page, read from ``python -X importtime``.
+
+    python -m salary_ai.importtime
+    python -m salary_ai.importtime --page "Data Analytics" --top 15 --repeat 3 --json
+
+Each page is measured in a fresh interpreter. The shell modules
+(APP_SHELL_MODULES, which main_salary_app.py imports before any page) are
+imported first, then the page's module. The page's cost is what its
+import adds on top of the shell, which is what the first visit to that
+page pays. On later reruns the module is already in ``sys.modules``.
+The app's sidebar shows the import and render time of the last rerun.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from salary_ai.config import APP_SHELL_MODULES, PAGE_MODULES
+from salary_ai.errors import SalarySystemError
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_MARKER = "salary_ai.importtime: page"
+_PREFIX = "import time:"
+
+
+@dataclass
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class PageImportReport:
+    page: str
+    module: str
+    shell_ms: float
+    page_ms: float
+    # Top-level package -> self time (ms) spent importing it for this page
+    packages: Dict[str, float]
+
+
+def parse_importtime(text: str) -> Tuple[List[ImportEntry], List[ImportEntry]]:
+    """``-X importtime`` output split into the entries before and after the page marker."""
+    before, after = [], []
+    current = before
+    for line in text.splitlines():
+        if line == _MARKER:
+            current = after
+            continue
+        if not line.startswith(_PREFIX) or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len(_PREFIX):].split("|", 2)
+        name = name[1:]  # one space after the bar, then two per nesting level
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        current.append(ImportEntry(name.strip(), int(self_us), int(cumulative_us), depth))
+    return before, after
+
+
+def _top_level_ms(entries: Sequence[ImportEntry]) -> float:
+    return sum(e.cumulative_us for e in entries if e.depth == 0) / 1000
+
+
+def _run(page_module: str, shell: Sequence[str], cwd: str) -> str:
+    code = "; ".join([
+        *(f"import {module}" for module in shell),
+        f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); sys.stderr.flush()",
+        f"import {page_module}"
+    ])
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=cwd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        last = (proc.stderr.strip().splitlines() or ["no output"])[-1]
+        raise SalarySystemError(f"Importing {page_module} failed: {last}")
+    return proc.stderr
+
+
+def page_import_report(page: str, repeat: int = 1, shell: Sequence[str] = APP_SHELL_MODULES,
+                       cwd: str = _APP_ROOT) -> PageImportReport:
+    """Import cost of ``page`` over a cold interpreter; the fastest of ``repeat`` runs."""
+    module = PAGE_MODULES[page]
+    best = None
+    for _ in range(max(1, repeat)):
+        before, after = parse_importtime(_run(module, shell, cwd))
+        if best is None or _top_level_ms(after) < _top_level_ms(best[1]):
+            best = (before, after)
+    before, after = best
+
+    packages = defaultdict(float)
+    for entry in after:
+        packages[entry.module.split(".")[0]] += entry.self_us / 1000
+    return PageImportReport(page, module, _top_level_ms(before), _top_level_ms(after),
+                            dict(sorted(packages.items(), key=lambda item: -item[1])))
+
+
+def import_report(pages: Optional[Sequence[str]] = None, repeat: int = 1,
+                  cwd: str = _APP_ROOT) -> List[PageImportReport]:
+    return [page_import_report(page, repeat, cwd=cwd) for page in (pages or PAGE_MODULES)]
+
+
+def format_report(reports: Sequence[PageImportReport], top: int = 5) -> str:
+    lines = [f"{'page':<20} {'shell ms':>10} {'page ms':>10}  heaviest packages (self ms)"]
+    for report in reports:
+        heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in list(report.packages.items())[:top])
+        lines.append(f"{report.page:<20} {report.shell_ms:>10.1f} {report.page_ms:>10.1f}  {heaviest or '-'}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m salary_ai.importtime",
+                                     description="Report the cold-start import cost of each app page.")
+    parser.add_argument("--page", action="append", choices=list(PAGE_MODULES),
+                        help="Page to measure (repeatable; default: every page)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per page; the fastest is reported")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest packages listed per page")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        reports = import_report(args.page, args.repeat)
+    except SalarySystemError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], indent=2))
+    else:
+        print(format_report(reports, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+# incremental.py - warm-start model updates from newly labelled uploads
+"""Update the published model from newly labelled rows without a full retrain.
+
+    python -m salary_ai.incremental labelled_march.csv --model best_salary_model.pkl
+
+Labelled uploads use the model's input columns plus ``Salary``, so the
+Salary_Data.csv layout works for a model trained on it. They are cleaned
+like Salary_Data.csv, validated against the batch schema fields the model
+uses and assembled into the model's features. A share of each upload is
+held back. The newest held-back rows, this upload's included and at most
+INCREMENTAL_HOLDOUT_ROWS of them, form the validation window. The upload
+is written to the TrainingStore as one CSV part only once its update is
+published, so a failed or rejected update leaves nothing behind: the same
+file can be retried, and its rows never reach later validation windows. The store also keeps a fixed base holdout: the test
+split of the original training data (TEST_SIZE, RANDOM_STATE, as in
+salary_ai.training), copied in on the first update and never changed.
+
+The candidate is a copy of the published pipeline. Its fitted
+preprocessor is kept and the estimator continues on the new rows only:
+``xgb_model`` continuation for XGBoost, ``warm_start`` with more trees or
+iterations for the sklearn ensembles. Only the current model and the
+candidate are scored on the window and the base holdout. Neither step
+reads the full history, so an update costs time in proportion to the
+upload. The candidate is published (atomic replace of the model file) only
+if neither RMSE regresses beyond INCREMENTAL_TOLERANCE, so a run of uploads
+cannot drift the model away from the data it was built on without the
+gate seeing it. The replaced version is kept in
+the store, and every update is appended to ``updates.jsonl``.
+
+Categories the preprocessor has never seen are encoded as all zeros
+(``handle_unknown="ignore"``). A full ``python -m salary_ai.train`` run is
+still how new job titles or locations get their own columns.
+"""
+import argparse
+import copy
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from salary_ai.config import (DATA_PATH, FALLBACK_MARKET_INDEX, INCREMENTAL_HOLDOUT_FRACTION,
+                              INCREMENTAL_HOLDOUT_ROWS, INCREMENTAL_ROUNDS, INCREMENTAL_TOLERANCE, RANDOM_STATE,
+                              TARGET, TEST_SIZE, TRAINING_STORE_DIR)
+from salary_ai.data import SalaryDataCleaner, load_clean_data
+from salary_ai.errors import BatchValidationError, SalarySystemError
+from salary_ai.features import FeatureBuilder
+from salary_ai.model_store import find_model_path, load_pipeline, model_version
+from salary_ai.schema import INPUT_SCHEMA, apply_schema
+from salary_ai.upload_cache import content_hash
+
+
+# -------------------------------
+# TRAINING STORE
+# -------------------------------
+@dataclass
+class StoreDelta:
+    """The rows one upload adds to the store, once appended."""
+    part: str
+    train: pd.DataFrame
+    holdout: pd.DataFrame
+    duplicate: bool = False
+
+
+class TrainingStore:
+    """Append-only labelled rows in model features (``train/`` and ``holdout/`` CSV parts),
+    plus the fixed base holdout in ``base/``."""
+
+    def __init__(self, root: str = TRAINING_STORE_DIR):
+        self.root = root
+
+    def _dir(self, kind: str) -> str:
+        return os.path.join(self.root, kind)
+
+    def _parts(self, kind: str) -> List[str]:
+        folder = self._dir(kind)
+        return sorted(f for f in os.listdir(folder) if f.endswith(".csv")) if os.path.isdir(folder) else []
+
+    def _write(self, kind: str, name: str, frame: pd.DataFrame):
+        folder = self._dir(kind)
+        os.makedirs(folder, exist_ok=True)
+        tmp = os.path.join(folder, name + ".part")
+        frame.to_csv(tmp, index=False)
+        os.replace(tmp, os.path.join(folder, name))
+
+    def stage(self, frame: pd.DataFrame, holdout_fraction: float = INCREMENTAL_HOLDOUT_FRACTION,
+              random_state: int = RANDOM_STATE) -> StoreDelta:
+        """Split ``frame`` into training and held-out rows for a new part; nothing is written yet.
+
+        An upload whose rows are already stored comes back as a duplicate and is not
+        trained on again.
+        """
+        digest = content_hash(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+        existing = self._parts("train") + self._parts("holdout")
+        known = next((name for name in existing if name.endswith(f"-{digest}.csv")), None)
+        if known:
+            return StoreDelta(known, frame.iloc[:0], frame.iloc[:0], duplicate=True)
+
+        if len(frame) * holdout_fraction >= 1:
+            train, holdout = train_test_split(frame, test_size=holdout_fraction, random_state=random_state)
+        else:  # too few rows to hold any back
+            train, holdout = frame, frame.iloc[:0]
+        sequence = max((int(name.split("-")[0]) for name in existing), default=0) + 1
+        return StoreDelta(f"{sequence:06d}-{digest}.csv", train, holdout)
+
+    def append(self, delta: StoreDelta):
+        """Store a staged part; only for uploads whose update was published."""
+        self._write("train", delta.part, delta.train)
+        if len(delta.holdout):
+            self._write("holdout", delta.part, delta.holdout)
+
+    def holdout_window(self, rows: int = INCREMENTAL_HOLDOUT_ROWS) -> pd.DataFrame:
+        """The newest held-out rows, at most ``rows``; only the parts needed are read."""
+        if rows <= 0:
+            return pd.DataFrame()
+        frames, total = [], 0
+        for name in reversed(self._parts("holdout")):
+            frames.append(pd.read_csv(os.path.join(self._dir("holdout"), name)))
+            total += len(frames[-1])
+            if total >= rows:
+                break
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames[::-1], ignore_index=True).tail(rows).reset_index(drop=True)
+
+    def base_holdout(self, data_path: str = DATA_PATH) -> pd.DataFrame:
+        """The original training data's test split, as cleaned rows plus TARGET.
+
+        Copied from ``data_path`` on first use and read from the store after
+        that, so the gate keeps comparing against the same rows even if the
+        data file changes or is removed.
+        """
+        path = os.path.join(self._dir("base"), "holdout.csv")
+        if not os.path.exists(path):
+            if not os.path.exists(data_path):
+                raise SalarySystemError(f"No base holdout in {self.root} and no training data at {data_path}")
+            df = load_clean_data(data_path)
+            _, holdout = train_test_split(df, test_size=TEST_SIZE, random_state=RANDOM_STATE)
+            self._write("base", "holdout.csv", holdout)
+        return pd.read_csv(path)
+
+    def archive_model(self, path: str, version: str) -> str:
+        """Keep a copy of a model about to be replaced, for rollback."""
+        folder = self._dir("models")
+        os.makedirs(folder, exist_ok=True)
+        target = os.path.join(folder, f"{version}.pkl")
+        if not os.path.exists(target):
+            shutil.copy2(path, target)
+        return target
+
+    def log(self, entry: dict):
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, "updates.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+
+# -------------------------------
+# LABELLED UPLOADS
+# -------------------------------
+def read_labelled(path: str) -> pd.DataFrame:
+    try:
+        if path.lower().endswith((".parquet", ".pq")):
+            return pd.read_parquet(path)
+        return pd.read_csv(path)
+    except Exception as e:
+        raise SalarySystemError(f"Could not read {path}: {e}")
+
+
+def prepare_labelled(df: pd.DataFrame, builder: FeatureBuilder, market_index: Optional[float] = None):
+    """Clean and validate labelled rows; model features plus TARGET, and the rejected row count.
+
+    Only the schema fields among ``builder.columns`` are checked; columns the
+    model does not use need not be in the upload.
+    """
+    if TARGET not in df.columns:
+        raise BatchValidationError(f"Labelled uploads need a {TARGET} column")
+    df = SalaryDataCleaner(df).clean()
+    salary = pd.to_numeric(df[TARGET], errors="coerce")
+    df = df[salary.notna() & (salary > 0)]
+    ingest = apply_schema(df, [f for f in INPUT_SCHEMA if f.name in builder.columns])
+    features = builder.frame(ingest.frame, market_index)
+    features[TARGET] = pd.to_numeric(ingest.frame[TARGET]).to_numpy(dtype=np.float64)
+    return features.reset_index(drop=True), int(len(df) - len(features))
+
+
+# -------------------------------
+# WARM START
+# -------------------------------
+def warm_start(pipeline, X: pd.DataFrame, y, rounds: int = INCREMENTAL_ROUNDS):
+    """A copy of ``pipeline`` whose estimator has continued training on ``X`` only.
+
+    The fitted preprocessor is reused as is, so the new rows are encoded
+    exactly like the ones the model was trained on.
+    """
+    candidate = copy.deepcopy(pipeline)
+    prep, model = candidate.steps[0][1], candidate.steps[-1][1]
+    Xt = prep.transform(X)
+    params = model.get_params()
+    try:
+        if type(model).__module__.startswith("xgboost"):
+            booster = model.get_booster()
+            model.set_params(n_estimators=rounds)
+            model.fit(Xt, y, xgb_model=booster)
+        elif "warm_start" in params:
+            size = "n_estimators" if "n_estimators" in params else "max_iter"
+            model.set_params(warm_start=True, **{size: params[size] + rounds})
+            model.fit(Xt, y)
+        else:
+            raise SalarySystemError(f"{type(model).__name__} cannot be updated incrementally; "
+                                    f"retrain with `python -m salary_ai.train`")
+    except SalarySystemError:
+        raise
+    except Exception as e:
+        raise SalarySystemError(f"Incremental fit failed: {e}")
+    return candidate
+
+
+def _metrics(y_true, y_pred) -> dict:
+    return {"RMSE": float(np.sqrt(mean_squared_error(y_true, y_pred))),
+            "MAE": float(mean_absolute_error(y_true, y_pred)),
+            "R2": float(r2_score(y_true, y_pred)) if len(y_true) > 1 else None}
+
+
+@dataclass
+class UpdateResult:
+    part: str
+    train_rows: int
+    holdout_rows: int
+    rejected_rows: int
+    window_rows: int
+    current: Optional[dict]
+    candidate: Optional[dict]
+    base_rows: int
+    base_current: Optional[dict]
+    base_candidate: Optional[dict]
+    published: bool
+    reason: str
+    old_version: str
+    new_version: str
+    fit_seconds: float
+    wall_seconds: float
+
+
+def update_model(labelled: pd.DataFrame, model_path: Optional[str] = None, store: Optional[TrainingStore] = None,
+                 market_index: Optional[float] = None, rounds: int = INCREMENTAL_ROUNDS,
+                 tolerance: float = INCREMENTAL_TOLERANCE, window_rows: int = INCREMENTAL_HOLDOUT_ROWS,
+                 dry_run: bool = False, base_data: str = DATA_PATH) -> UpdateResult:
+    """Warm-start a candidate on the labelled rows and publish it if it regresses neither on the
+    held-out window nor on the base holdout (seeded from ``base_data``).
+
+    The rows are appended to ``store`` only when the candidate is published.
+    """
+    start = time.perf_counter()
+    store = store or TrainingStore()
+    model_path = find_model_path(model_path)
+    old_version = model_version(model_path)
+    pipeline = load_pipeline(model_path)
+    builder = FeatureBuilder.from_model(pipeline)
+
+    features, rejected = prepare_labelled(labelled, builder, market_index)
+    if features.empty:
+        raise BatchValidationError("No valid labelled rows in the upload")
+    # Salary_Data.csv has no market column; its rows are scored at the fallback quote unless one is given
+    base_market = FALLBACK_MARKET_INDEX if market_index is None else market_index
+    base, _ = prepare_labelled(store.base_holdout(base_data), builder, base_market)
+    delta = store.stage(features)
+
+    def finish(published, reason, current=None, candidate=None, fit_seconds=0.0, window=0, new_version=None,
+               base_current=None, base_candidate=None):
+        result = UpdateResult(delta.part, len(delta.train), len(delta.holdout), rejected, window,
+                              current, candidate, len(base), base_current, base_candidate, published, reason,
+                              old_version, new_version or old_version, fit_seconds, time.perf_counter() - start)
+        store.log({"at": datetime.now(timezone.utc).isoformat(timespec="seconds"), "dry_run": dry_run,
+                   **asdict(result)})
+        return result
+
+    if delta.duplicate:
+        return finish(False, "upload already in the training store")
+    if delta.train.empty:
+        return finish(False, "no training rows in the upload")
+
+    fit_start = time.perf_counter()
+    candidate = warm_start(pipeline, delta.train[builder.columns], delta.train[TARGET], rounds)
+    fit_seconds = time.perf_counter() - fit_start
+
+    # Stored windows hold only published uploads; this upload's held-back rows are the newest
+    window = pd.concat([store.holdout_window(window_rows - len(delta.holdout)), delta.holdout],
+                       ignore_index=True).tail(window_rows)
+    if window.empty:
+        return finish(False, "no held-out rows to validate against", fit_seconds=fit_seconds)
+    X_window, y_window = window[builder.columns], window[TARGET]
+    current = _metrics(y_window, pipeline.predict(X_window))
+    proposed = _metrics(y_window, candidate.predict(X_window))
+    X_base, y_base = base[builder.columns], base[TARGET]
+    base_current = _metrics(y_base, pipeline.predict(X_base))
+    base_proposed = _metrics(y_base, candidate.predict(X_base))
+    scored = (current, proposed, fit_seconds, len(window))
+
+    if proposed["RMSE"] > current["RMSE"] * (1 + tolerance):
+        return finish(False, "window RMSE regressed", *scored, base_current=base_current,
+                      base_candidate=base_proposed)
+    if base_proposed["RMSE"] > base_current["RMSE"] * (1 + tolerance):
+        return finish(False, "base holdout RMSE regressed", *scored, base_current=base_current,
+                      base_candidate=base_proposed)
+    if dry_run:
+        return finish(False, "dry run", *scored, base_current=base_current, base_candidate=base_proposed)
+
+    store.archive_model(model_path, old_version)
+    tmp = model_path + ".part"
+    try:
+        joblib.dump(candidate, tmp)
+        os.replace(tmp, model_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    store.append(delta)
+    return finish(True, "published", *scored, model_version(model_path), base_current, base_proposed)
+
+
+# -------------------------------
+# CLI
+# -------------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m salary_ai.incremental",
+                                     description="Warm-start the published model on newly labelled rows.")
+    parser.add_argument("input", help="Labelled CSV or Parquet (the model's input columns plus Salary)")
+    parser.add_argument("--model", help="Model to update (default: first of MODEL_PATHS)")
+    parser.add_argument("--store", default=TRAINING_STORE_DIR, help="Training store (default: %(default)s)")
+    parser.add_argument("--market-index", type=float,
+                        help="Market index for rows without a Market_Index column")
+    parser.add_argument("--rounds", type=int, default=INCREMENTAL_ROUNDS, help="Trees/boosting rounds to add")
+    parser.add_argument("--tolerance", type=float, default=INCREMENTAL_TOLERANCE,
+                        help="Allowed relative RMSE regression on the held-out window")
+    parser.add_argument("--window", type=int, default=INCREMENTAL_HOLDOUT_ROWS, help="Held-out rows to validate on")
+    parser.add_argument("--base-data", default=DATA_PATH,
+                        help="Training data whose test split seeds the store's base holdout (default: %(default)s)")
+    parser.add_argument("--dry-run", action="store_true", help="Validate, but do not store or publish")
+    args = parser.parse_args(argv)
+
+    try:
+        result = update_model(read_labelled(args.input), args.model, TrainingStore(args.store), args.market_index,
+                              args.rounds, args.tolerance, args.window, args.dry_run, args.base_data)
+    except SalarySystemError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{result.train_rows:,} rows trained, {result.holdout_rows:,} held out, "
+          f"{result.rejected_rows:,} rejected (fit {result.fit_seconds:.2f}s, total {result.wall_seconds:.2f}s)",
+          file=sys.stderr)
+    if result.candidate:
+        print(f"Window RMSE over {result.window_rows:,} rows: {result.current['RMSE']:,.0f} -> "
+              f"{result.candidate['RMSE']:,.0f}", file=sys.stderr)
+    if result.base_candidate:
+        print(f"Base holdout RMSE over {result.base_rows:,} rows: {result.base_current['RMSE']:,.0f} -> "
+              f"{result.base_candidate['RMSE']:,.0f}", file=sys.stderr)
+    print(f"{result.reason}: {result.old_version} -> {result.new_version}")
+    return 0 if result.published or result.reason in ("dry run", "upload already in the training store") else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# loadtest.py - local load generator for the scoring service
+"""Hammer a running ``salary_ai.serve`` instance and report throughput.
+
+    python -m salary_ai.serve --port 8000 &
+    python -m salary_ai.loadtest http://127.0.0.1:8000 --concurrency 64 --requests 5000
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import List, Optional
+
+import httpx
+import numpy as np
+
+from salary_ai.config import OPTIONAL_SKILLS
+
+_PROFILE_CHOICES = {
+    "Gender": ["Male", "Female", "Other"],
+    "Education Level": ["High School", "Bachelor's", "Master's", "PhD"],
+    "Job Title": ["Data Analyst", "Software Engineer", "Data Scientist", "Product Manager", "HR Manager"],
+    "Industry": ["Technology", "Finance", "Healthcare", "Education", "Manufacturing", "Retail", "Consulting"],
+    "Location": ["Enugu", "Lagos", "Abuja", "Port Harcourt", "Kano", "Ibadan", "Kaduna"],
+    "Company Size": ["Small (1-50)", "Medium (51-250)", "Large (251+)"],
+}
+
+
+def random_record(rng: random.Random) -> dict:
+    record = {name: rng.choice(values) for name, values in _PROFILE_CHOICES.items()}
+    record["Age"] = rng.randint(18, 65)
+    record["Years of Experience"] = rng.randint(0, min(40, record["Age"] - 18))
+    for skill in OPTIONAL_SKILLS:
+        record[skill] = rng.randint(0, 1)
+    return record
+
+
+async def run_load(url: str, concurrency: int, requests: int, seed: int = 42) -> dict:
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                body = random_record(rng)
+                start = time.perf_counter()
+                response = await client.post("/predict", json=body)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        server_metrics = (await client.get("/metrics")).json()
+
+    client_ms = np.asarray(latencies) * 1000
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "client_latency_ms": {
+            "p50": round(float(np.percentile(client_ms, 50)), 3),
+            "p99": round(float(np.percentile(client_ms, 99)), 3)
+        },
+        "server": server_metrics
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m salary_ai.loadtest",
+                                     description="Load-test a running scoring service.")
+    parser.add_argument("url", help="Base URL, e.g. http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_load(args.url, args.concurrency, args.requests, args.seed))
+    print(json.dumps(report, indent=2))
+    return 0 if report["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,466 @@
+# lookup_table.py - precomputed single predictions over the form's bounded inputs
+"""Dense, memory-mapped table of the model's predictions for the single form.
+
+    python -m salary_ai.lookup_table --model best_salary_model.pkl --verify 10000
+
+Apart from Job Title and the market index, every input on the Single
+Prediction form is bounded. A tree ensemble only ever compares a
+preprocessed column with its split thresholds, so the table gives each
+input one axis with one slot per distinct outcome:
+
+- Age, Years of Experience and the skill bits: the values in the form's
+  range, grouped by the split interval their scaled value falls in.
+- Categorical fields: one slot per category whose one-hot column is split
+  on. One shared slot covers every other category, including titles the
+  model has never seen, because all of them encode to the same zeros.
+- The market index: one bucket per interval between its thresholds. The
+  bucket is found with a binary search on the scaled quote, so any market
+  value is covered exactly.
+
+The table is built from the compiled ensemble (see compiled_model.py),
+stored as float32 ``<model>.lookup.npy`` with a ``.lookup.json`` describing
+its axes, and checked against ``model.predict`` on random form inputs
+before it replaces the previous table. ``load_lookup_table`` maps it
+read-only. ``LookupTable.lookup`` is one index per axis and returns None
+when a row is outside the table (missing values, out-of-range or infinite
+numbers).
+The caller then scores that row with the live model. A table built for
+another model version is never loaded.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from salary_ai.compiled_model import BLOCK_SIZE, _CategoricalBlock, _TreeEnsemble, compile_pipeline
+from salary_ai.config import (FALLBACK_MARKET_INDEX, FORM_AGE_RANGE, FORM_COMPANY_SIZES, FORM_EDUCATION_LEVELS,
+                              FORM_EXPERIENCE_RANGE, FORM_GENDERS, FORM_INDUSTRIES, FORM_LOCATIONS,
+                              LOOKUP_MAX_CELLS, LOOKUP_TOLERANCE, LOOKUP_VERIFY_SAMPLES)
+from salary_ai.errors import ModelCompileError, SalarySystemError
+from salary_ai.features import MARKET_COLUMNS, SKILL_PREFIX, FeatureBuilder
+from salary_ai.model_store import find_model_path, load_pipeline, model_version
+
+# Inclusive value range of each bounded numeric input
+NUMERIC_RANGES = {"Age": FORM_AGE_RANGE, "Years of Experience": FORM_EXPERIENCE_RANGE}
+# Form choices, used to draw verification rows alongside the model's own categories
+FORM_CHOICES = {
+    "Gender": FORM_GENDERS,
+    "Education Level": FORM_EDUCATION_LEVELS,
+    "Industry": FORM_INDUSTRIES,
+    "Location": FORM_LOCATIONS,
+    "Company Size": FORM_COMPANY_SIZES
+}
+_UNSEEN = "\0unseen"
+
+
+def lookup_paths(model_path: Optional[str] = None):
+    """``(<model>.lookup.npy, <model>.lookup.json)`` next to the model pickle."""
+    stem = os.path.splitext(find_model_path(model_path))[0]
+    return stem + ".lookup.npy", stem + ".lookup.json"
+
+
+def _bins(x32: np.ndarray, thresholds: np.ndarray, strict: bool) -> np.ndarray:
+    # sklearn goes left on x <= t, XGBoost on x < t; the bin is the number of thresholds passed
+    return np.searchsorted(thresholds, x32, side="right" if strict else "left")
+
+
+# -------------------------------
+# AXES
+# -------------------------------
+class _IntegerAxis:
+    """Whole numbers in [lo, hi]; ``groups[v - lo]`` is the slot of ``v``."""
+
+    def __init__(self, column: str, lo: int, groups):
+        self.column = column
+        self.lo = lo
+        self.groups = np.asarray(groups, dtype=np.intp)
+
+    @property
+    def size(self) -> int:
+        return int(self.groups.max()) + 1
+
+    def index(self, value) -> Optional[int]:
+        try:
+            v = float(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        # inf would overflow int(); NaN and inf rows are scored by the live model
+        k = int(v) - self.lo if np.isfinite(v) and v == int(v) else -1
+        return int(self.groups[k]) if 0 <= k < len(self.groups) else None
+
+    def to_json(self) -> dict:
+        return {"kind": "integer", "column": self.column, "lo": self.lo, "groups": self.groups.tolist()}
+
+
+class _CategoryAxis:
+    """Categories with a split on their one-hot column get a slot each; all others share ``other``."""
+
+    def __init__(self, column: str, slots: Dict[str, int], other: int):
+        self.column = column
+        self.slots = slots
+        self.other = other
+
+    @property
+    def size(self) -> int:
+        return self.other + 1
+
+    def index(self, value) -> Optional[int]:
+        if value is None or value != value:  # missing values are imputed by the live model
+            return None
+        return self.slots.get(value, self.other)
+
+    def to_json(self) -> dict:
+        return {"kind": "category", "column": self.column, "slots": self.slots, "other": self.other}
+
+
+class _ContinuousAxis:
+    """Real values in [lo, hi] (unbounded when None), bucketed by the ensemble's thresholds on its scaled column."""
+
+    def __init__(self, column: str, mean: float, scale: float, thresholds, strict: bool, zero_is_missing: bool,
+                 lo: Optional[float] = None, hi: Optional[float] = None):
+        self.column = column
+        self.mean = float(mean)
+        self.scale = float(scale)
+        self.strict = strict
+        self.zero_is_missing = zero_is_missing
+        self.lo, self.hi = lo, hi
+        self.x_lo = self._scaled(lo) if lo is not None else np.float32(-np.inf)
+        self.x_hi = self._scaled(hi) if hi is not None else np.float32(np.inf)
+        # Thresholds outside the window compare the same way for every value inside it
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        self.thresholds = thresholds[(thresholds >= self.x_lo) & (thresholds <= self.x_hi)]
+
+    def _scaled(self, value: float) -> np.float32:
+        # The same arithmetic as the compiled preprocessor, then the ensemble's float32 cast
+        return np.float32((float(value) - self.mean) / self.scale)
+
+    @property
+    def size(self) -> int:
+        return len(self.thresholds) + 1
+
+    def index(self, value) -> Optional[int]:
+        try:
+            with np.errstate(over="ignore"):  # huge quotes become inf in float32 and fall back below
+                x = self._scaled(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if not np.isfinite(x) or x < self.x_lo or x > self.x_hi or (self.zero_is_missing and x == 0):
+            return None
+        return int(_bins(x, self.thresholds, self.strict))
+
+    def representatives(self) -> np.ndarray:
+        """One float32 scaled value inside each bucket."""
+        t = self.thresholds
+        if not len(t):
+            return np.clip(np.ones(1, dtype=np.float32), self.x_lo, self.x_hi)
+        reps = np.empty(len(t) + 1, dtype=np.float32)
+        if self.strict:  # bucket k is [t[k-1], t[k]): smallest float32 >= t[k-1]
+            reps[0] = np.nextafter(np.float32(t[0]), np.float32(-np.inf))
+            lower = t.astype(np.float32)
+            reps[1:] = np.where(lower < t, np.nextafter(lower, np.float32(np.inf)), lower)
+        else:  # bucket k is (t[k-1], t[k]]: largest float32 <= t[k]
+            upper = t.astype(np.float32)
+            reps[:-1] = np.where(upper > t, np.nextafter(upper, np.float32(-np.inf)), upper)
+            reps[-1] = np.nextafter(np.float32(t[-1]), np.float32(np.inf))
+        reps = np.clip(reps, self.x_lo, self.x_hi)
+        if self.zero_is_missing:
+            away = np.float32(np.inf) if self.strict else np.float32(-np.inf)
+            reps = np.where(reps == 0, np.nextafter(np.float32(0), away), reps)
+        return reps
+
+    def to_json(self) -> dict:
+        return {"kind": "continuous", "column": self.column, "mean": self.mean, "scale": self.scale,
+                "thresholds": self.thresholds.tolist(), "strict": self.strict,
+                "zero_is_missing": self.zero_is_missing, "lo": self.lo, "hi": self.hi}
+
+
+def _axis_from_json(spec: dict):
+    kind = spec.pop("kind")
+    if kind == "integer":
+        return _IntegerAxis(**spec)
+    if kind == "category":
+        return _CategoryAxis(**spec)
+    return _ContinuousAxis(**spec)
+
+
+# -------------------------------
+# TABLE
+# -------------------------------
+class LookupTable:
+    """Read-only predictions indexed by the model's input columns."""
+
+    def __init__(self, values: np.ndarray, axes: list, version: str):
+        self.values = values
+        self.axes = axes
+        self.version = version
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes)
+
+    def lookup(self, row: Mapping) -> Optional[float]:
+        """The prediction for one row of model features, or None if the row is outside the table."""
+        index = []
+        for axis in self.axes:
+            i = axis.index(row.get(axis.column))
+            if i is None:
+                return None
+            index.append(i)
+        return float(self.values[tuple(index)])
+
+    def meta(self) -> dict:
+        return {"model_version": self.version, "shape": list(self.values.shape),
+                "axes": [axis.to_json() for axis in self.axes]}
+
+
+def load_lookup_table(model_path: Optional[str] = None, version: Optional[str] = None) -> Optional[LookupTable]:
+    """The model's table, memory-mapped; None when there is none or it belongs to another model version."""
+    try:
+        npy_path, json_path = lookup_paths(model_path)
+        with open(json_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["model_version"] != (version or model_version(model_path)):
+            return None
+        values = np.load(npy_path, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError, KeyError, SalarySystemError):
+        return None
+    if list(values.shape) != meta["shape"]:
+        return None
+    return LookupTable(values, [_axis_from_json(spec) for spec in meta["axes"]], meta["model_version"])
+
+
+# -------------------------------
+# BUILD
+# -------------------------------
+@dataclass
+class _AxisPlan:
+    """How to write one axis's representative value into the preprocessed matrix."""
+    axis: object
+    feature: int  # column of the preprocessed matrix (numeric axes)
+    values: np.ndarray  # scaled representative per slot (numeric) or one-hot column per slot, -1 for none
+
+
+def _tree_thresholds(ensemble: _TreeEnsemble) -> Dict[int, np.ndarray]:
+    internal = ensemble.left != np.arange(len(ensemble.left))
+    features, thresholds = ensemble.feature[internal], ensemble.threshold[internal]
+    return {int(f): np.unique(thresholds[features == f]) for f in np.unique(features)}
+
+
+def _integer_plan(column, lo, hi, feature, mean, scale, thresholds, ensemble) -> _AxisPlan:
+    values = np.arange(lo, hi + 1)
+    scaled = (values - mean) / scale
+    x32 = scaled.astype(np.float32)
+    bins = _bins(x32, thresholds, ensemble.strict)
+    if ensemble.zero_is_missing:
+        bins = np.where(x32 == 0, -1, bins)
+    # Slots in order of first appearance; the first value of each slot represents it
+    _, first, groups = np.unique(bins, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return _AxisPlan(_IntegerAxis(column, lo, rank[groups]), feature, scaled[np.sort(first)])
+
+
+def plan_axes(pipeline, builder: FeatureBuilder, market_range: Optional[Tuple[float, float]] = None
+              ) -> List[_AxisPlan]:
+    """One axis per model input column, sized by the compiled ensemble's splits.
+
+    ``market_range`` limits the market axis to quotes in [lo, hi], which
+    keeps only the thresholds inside it; other quotes fall back to the model.
+    """
+    compiled = compile_pipeline(pipeline)
+    ensemble = compiled.estimator
+    if not isinstance(ensemble, _TreeEnsemble):
+        raise ModelCompileError("Lookup tables are only built for tree ensembles")
+    thresholds = _tree_thresholds(ensemble)
+    empty = np.zeros(0)
+
+    plans = {}
+    for block in compiled.blocks:
+        if isinstance(block, _CategoricalBlock):
+            for column, lookup in zip(block.columns, block.lookups):
+                split = [(cat, col) for cat, col in lookup.items() if col in thresholds]
+                slots = {cat: k for k, (cat, _) in enumerate(split)}
+                one_hot = np.array([col for _, col in split] + [-1], dtype=np.intp)
+                plans[column] = _AxisPlan(_CategoryAxis(column, slots, len(split)), -1, one_hot)
+            continue
+        for i, column in enumerate(block.columns):
+            feature = block.offset + i
+            mean, scale = block.mean[i], block.scale[i]
+            cuts = thresholds.get(feature, empty)
+            if column in MARKET_COLUMNS:
+                axis = _ContinuousAxis(column, mean, scale, cuts, ensemble.strict, ensemble.zero_is_missing,
+                                       *(market_range or (None, None)))
+                plans[column] = _AxisPlan(axis, feature, axis.representatives().astype(np.float64))
+            elif column in NUMERIC_RANGES or column.startswith(SKILL_PREFIX):
+                lo, hi = NUMERIC_RANGES.get(column, (0, 1))
+                plans[column] = _integer_plan(column, lo, hi, feature, mean, scale, cuts, ensemble)
+            else:
+                raise ModelCompileError(f"No bounded range for the numeric input {column!r}")
+    return [plans[column] for column in builder.columns]
+
+
+def build_lookup_table(pipeline, version: str, out_path: Optional[str] = None,
+                       max_cells: int = LOOKUP_MAX_CELLS,
+                       market_range: Optional[Tuple[float, float]] = None) -> LookupTable:
+    """Evaluate the compiled ensemble once per cell; written to ``out_path`` (a .npy memmap) if given."""
+    plans = plan_axes(pipeline, FeatureBuilder.from_model(pipeline), market_range)
+    shape = tuple(plan.axis.size for plan in plans)
+    cells = int(np.prod(shape, dtype=np.int64))
+    if cells > max_cells:
+        sizes = ", ".join(f"{plan.axis.column}={plan.axis.size}" for plan in plans)
+        raise SalarySystemError(f"Lookup table would have {cells:,} cells (over {max_cells:,}): {sizes}. "
+                                f"A narrower --market-range keeps fewer market buckets")
+
+    compiled = compile_pipeline(pipeline)
+    if out_path:
+        values = np.lib.format.open_memmap(out_path, mode="w+", dtype=np.float32, shape=shape)
+    else:
+        values = np.empty(shape, dtype=np.float32)
+    flat = values.reshape(-1)
+    for start in range(0, cells, BLOCK_SIZE):
+        stop = min(start + BLOCK_SIZE, cells)
+        index = np.unravel_index(np.arange(start, stop), shape)
+        X = np.zeros((stop - start, compiled.n_features))
+        rows = np.arange(stop - start)
+        for plan, slot in zip(plans, index):
+            if isinstance(plan.axis, _CategoryAxis):
+                col = plan.values[slot]
+                hot = col >= 0
+                X[rows[hot], col[hot]] = 1.0
+            else:
+                X[:, plan.feature] = plan.values[slot]
+        flat[start:stop] = compiled.estimator.predict(X)
+    if out_path:
+        values.flush()
+    return LookupTable(values, [plan.axis for plan in plans], version)
+
+
+def publish_lookup_table(table: LookupTable, build_path: str, model_path: Optional[str] = None):
+    """Move a verified table built at ``build_path`` into place, the JSON (what loading starts from) last."""
+    npy_path, json_path = lookup_paths(model_path)
+    if isinstance(table.values, np.memmap):
+        table.values.flush()
+    os.replace(build_path, npy_path)
+    with open(json_path + ".part", "w", encoding="utf-8") as f:
+        json.dump(table.meta(), f)
+    os.replace(json_path + ".part", json_path)
+
+
+# -------------------------------
+# VERIFY
+# -------------------------------
+@dataclass
+class VerifyReport:
+    samples: int
+    fallbacks: int
+    max_abs_error: float
+    table_us: float
+    model_us: float
+
+    def ok(self, tolerance: float = LOOKUP_TOLERANCE) -> bool:
+        return self.max_abs_error <= tolerance
+
+    def describe(self) -> str:
+        return (f"{self.samples:,} random rows: max |table - model.predict| = {self.max_abs_error:.4f}, "
+                f"{self.fallbacks:,} outside the table; {self.table_us:.1f} us/lookup vs "
+                f"{self.model_us:.1f} us for a single-row model.predict")
+
+
+def sample_form_rows(pipeline, n: int, seed: int = 0, market_range: Optional[Tuple[float, float]] = None):
+    """Random form inputs in model features: form and model categories, an unseen title, 5% market off."""
+    rng = np.random.default_rng(seed)
+    builder = FeatureBuilder.from_model(pipeline)
+    categories = {}
+    for block in compile_pipeline(pipeline).blocks:
+        if isinstance(block, _CategoricalBlock):
+            for column, lookup in zip(block.columns, block.lookups):
+                categories[column] = list(dict.fromkeys([*FORM_CHOICES.get(column, []), *lookup, _UNSEEN]))
+
+    records = {}
+    for column in builder.columns:
+        if column in categories:
+            records[column] = rng.choice(np.array(categories[column], dtype=object), n)
+        elif column in MARKET_COLUMNS:
+            lo, hi = market_range or (FALLBACK_MARKET_INDEX * 0.5, FALLBACK_MARKET_INDEX * 1.5)
+            market = rng.uniform(lo, hi, n)
+            records[column] = np.where(rng.random(n) < 0.05, 0.0, market)
+        else:
+            lo, hi = NUMERIC_RANGES.get(column, (0, 1))
+            records[column] = rng.integers(lo, hi + 1, n)
+    return builder.frame(records)
+
+
+def verify_lookup_table(table: LookupTable, pipeline, samples: int = LOOKUP_VERIFY_SAMPLES,
+                        seed: int = 0) -> VerifyReport:
+    """Compare table lookups with ``pipeline.predict`` on random form rows."""
+    market = next(((a.lo, a.hi) for a in table.axes if isinstance(a, _ContinuousAxis) and a.lo is not None), None)
+    frame = sample_form_rows(pipeline, samples, seed, market)
+    rows = frame.to_dict("records")
+
+    start = time.perf_counter()
+    looked_up = [table.lookup(row) for row in rows]
+    table_us = (time.perf_counter() - start) / samples * 1e6
+    expected = pipeline.predict(frame)
+    # What the form would pay without the table: one pipeline.predict per submitted row
+    timed = min(samples, 200)
+    start = time.perf_counter()
+    for i in range(timed):
+        pipeline.predict(frame.iloc[i:i + 1])
+    model_us = (time.perf_counter() - start) / timed * 1e6
+
+    found = np.array([v is not None for v in looked_up])
+    got = np.array([v for v in looked_up if v is not None], dtype=np.float64)
+    error = float(np.abs(got - expected[found]).max()) if found.any() else 0.0
+    return VerifyReport(samples, int((~found).sum()), error, table_us, model_us)
+
+
+# -------------------------------
+# CLI
+# -------------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m salary_ai.lookup_table",
+                                     description="Precompute single-form predictions into a lookup table.")
+    parser.add_argument("--model", help="Model pickle (default: first of MODEL_PATHS)")
+    parser.add_argument("--max-cells", type=int, default=LOOKUP_MAX_CELLS)
+    parser.add_argument("--market-range", type=float, nargs=2, metavar=("LO", "HI"),
+                        help="Only tabulate market index quotes in [LO, HI]; others use the live model")
+    parser.add_argument("--verify", type=int, default=LOOKUP_VERIFY_SAMPLES, metavar="N",
+                        help="Random form rows to check against model.predict")
+    parser.add_argument("--tolerance", type=float, default=LOOKUP_TOLERANCE, help="Largest allowed difference ($)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        model_path = find_model_path(args.model)
+        pipeline = load_pipeline(model_path)
+        npy_path, json_path = lookup_paths(model_path)
+        start = time.perf_counter()
+        table = build_lookup_table(pipeline, model_version(model_path), npy_path + ".build",
+                                   args.max_cells, args.market_range)
+    except SalarySystemError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    axes = " x ".join(f"{axis.column}[{axis.size}]" for axis in table.axes)
+    print(f"{table.values.size:,} cells ({table.nbytes / 1024 / 1024:,.1f} MB) in "
+          f"{time.perf_counter() - start:.1f}s: {axes}", file=sys.stderr)
+    report = verify_lookup_table(table, pipeline, args.verify, args.seed)
+    print(report.describe(), file=sys.stderr)
+    if not report.ok(args.tolerance):
+        os.remove(npy_path + ".build")
+        print(f"error: table differs from model.predict by more than {args.tolerance}", file=sys.stderr)
+        return 1
+
+    publish_lookup_table(table, npy_path + ".build", model_path)
+    print(npy_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
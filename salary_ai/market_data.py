@@ -0,0 +1,143 @@
+# market_data.py - TTL-cached market index with a background refresher
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import requests
+
+from salary_ai.config import (
+    ALPHA_VANTAGE_API,
+    ALPHA_VANTAGE_URL,
+    FALLBACK_MARKET_INDEX,
+    MARKET_REFRESH_INTERVAL,
+    MARKET_SYMBOL,
+    MARKET_TIMEOUT,
+    MARKET_TTL,
+)
+
+
+@dataclass(frozen=True)
+class MarketQuote:
+    """Snapshot of the market index served to the render path."""
+    value: float
+    fetched_at: Optional[datetime]
+    is_stale: bool
+    is_fallback: bool
+
+    @property
+    def success(self) -> bool:
+        return not self.is_fallback
+
+
+class MarketDataService:
+    """Process-wide market index cache.
+
+    ``get()`` never touches the network: it returns the last good value
+    (or the fallback) together with its timestamp and staleness. Fetching
+    happens in ``refresh()``, which the background thread started by
+    ``start()`` calls every ``refresh_interval`` seconds.
+    """
+
+    def __init__(self, url: str = ALPHA_VANTAGE_URL, api_key: str = ALPHA_VANTAGE_API,
+                 symbol: str = MARKET_SYMBOL, ttl: float = MARKET_TTL,
+                 refresh_interval: float = MARKET_REFRESH_INTERVAL,
+                 timeout: float = MARKET_TIMEOUT,
+                 fallback: float = FALLBACK_MARKET_INDEX):
+        self.url = url
+        self.api_key = api_key
+        self.symbol = symbol
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self.timeout = timeout
+        self.fallback = fallback
+
+        self._lock = threading.Lock()
+        self._value = None
+        self._fetched_at = None
+        self._fetched_mono = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_error = None
+
+    # -------------------------------
+    # READ PATH (non-blocking)
+    # -------------------------------
+    def get(self) -> MarketQuote:
+        with self._lock:
+            value, fetched_at, fetched_mono = self._value, self._fetched_at, self._fetched_mono
+        if value is None:
+            return MarketQuote(self.fallback, None, True, True)
+        is_stale = (time.monotonic() - fetched_mono) > self.ttl
+        return MarketQuote(value, fetched_at, is_stale, False)
+
+    # -------------------------------
+    # FETCH PATH
+    # -------------------------------
+    def _parse(self, data: dict) -> float:
+        series = data.get("Time Series (5min)")
+        if not series:
+            # Rate-limit and error responses come back as "Note"/"Information"
+            raise ValueError(data.get("Note") or data.get("Information") or "No time series in response")
+        last_ref = max(series)
+        return float(series[last_ref]["4. close"])
+
+    def refresh(self) -> bool:
+        """Fetch once and update the cache; keeps the last good value on failure."""
+        try:
+            response = requests.get(
+                self.url,
+                params={
+                    "function": "TIME_SERIES_INTRADAY",
+                    "symbol": self.symbol,
+                    "interval": "5min",
+                    "apikey": self.api_key
+                },
+                timeout=self.timeout
+            )
+            value = self._parse(response.json())
+        except Exception as e:
+            self.last_error = str(e)
+            return False
+
+        with self._lock:
+            self._value = value
+            self._fetched_at = datetime.now()
+            self._fetched_mono = time.monotonic()
+        self.last_error = None
+        return True
+
+    # -------------------------------
+    # BACKGROUND REFRESHER
+    # -------------------------------
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.refresh_interval)
+
+    def start(self) -> "MarketDataService":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="market-data-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_market_service() -> MarketDataService:
+    """Return the process-wide service, starting its refresher on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = MarketDataService().start()
+    return _service
@@ -0,0 +1,48 @@
+# model_store.py - locating and loading the trained pipeline
+import hashlib
+import os
+from typing import Optional
+
+import joblib
+
+from salary_ai.compiled_model import compile_pipeline
+from salary_ai.config import MODEL_PATHS
+from salary_ai.errors import ModelCompileError, SalarySystemError
+from salary_ai.features import FeatureBuilder, FeaturePredictor
+
+
+def find_model_path(path: Optional[str] = None) -> str:
+    """Return ``path`` if given, else the first existing entry of MODEL_PATHS."""
+    candidates = [path] if path else MODEL_PATHS
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    raise SalarySystemError(f"Model file not found (tried {candidates})")
+
+
+def model_version(path: Optional[str] = None) -> str:
+    """Short content hash of the model pickle, used to key cached predictions."""
+    digest = hashlib.sha256()
+    with open(find_model_path(path), "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+def load_pipeline(path: Optional[str] = None):
+    return joblib.load(find_model_path(path))
+
+
+def load_predictor(path: Optional[str] = None, use_compiled: bool = True) -> FeaturePredictor:
+    """Load the pipeline and return its predict function, compiled when possible.
+
+    The function takes raw records and assembles the model's features itself.
+    """
+    model = load_pipeline(path)
+    builder = FeatureBuilder.from_model(model)
+    if use_compiled:
+        try:
+            return FeaturePredictor(compile_pipeline(model).predict, builder, columnar=True)
+        except ModelCompileError:
+            pass
+    return FeaturePredictor(model.predict, builder)
@@ -0,0 +1,114 @@
+# parallel.py - process-pool batch scorer
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.model_store import find_model_path, load_predictor
+
+# Shards per worker; a few per worker keeps the pool busy when shards differ in cost
+_SHARDS_PER_WORKER = 2
+_MIN_SHARD_ROWS = 1_000
+
+
+# -------------------------------
+# WORKER SIDE
+# -------------------------------
+_worker_predict = None
+
+
+def _init_worker(model_path: str, use_compiled: bool):
+    # Runs once per worker process, so the model is loaded once per worker
+    global _worker_predict
+    _worker_predict = load_predictor(model_path, use_compiled)
+
+
+def _score_shard(shard: pd.DataFrame) -> np.ndarray:
+    return np.asarray(_worker_predict(shard))
+
+
+def _ping(_) -> int:
+    return os.getpid()
+
+
+# -------------------------------
+# PARENT SIDE
+# -------------------------------
+class ParallelBatchScorer:
+    """Shards a frame across worker processes and merges predictions in order.
+
+    Each worker scores its rows with exactly the same predictor as the
+    serial path, so results are byte-identical to scoring in-process.
+    """
+
+    def __init__(self, model_path: Optional[str] = None, workers: Optional[int] = None,
+                 use_compiled: bool = True):
+        self.model_path = os.path.abspath(find_model_path(model_path))
+        self.workers = workers or os.cpu_count() or 1
+        self.use_compiled = use_compiled
+        # spawn: the app process runs background threads that must not be forked
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model_path, use_compiled)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def warm_up(self):
+        """Start every worker (and load its model) ahead of the first batch."""
+        list(self._pool.map(_ping, range(self.workers)))
+
+    def predict(self, frame: pd.DataFrame, shard_rows: Optional[int] = None) -> np.ndarray:
+        n = len(frame)
+        if n == 0:
+            return np.empty(0)
+        if shard_rows is None:
+            shard_rows = max(_MIN_SHARD_ROWS, math.ceil(n / (self.workers * _SHARDS_PER_WORKER)))
+        shards = (frame.iloc[start:start + shard_rows] for start in range(0, n, shard_rows))
+        # Executor.map yields results in submission order
+        return np.concatenate(list(self._pool.map(_score_shard, shards)))
+
+
+def benchmark_workers(frame: pd.DataFrame, worker_counts: Iterable[int] = (1, 2, 4),
+                      model_path: Optional[str] = None, use_compiled: bool = True) -> pd.DataFrame:
+    """Throughput per worker count, checked against the serial predictions."""
+    serial_predict = load_predictor(find_model_path(model_path), use_compiled)
+    start = time.perf_counter()
+    serial = np.asarray(serial_predict(frame))
+    serial_seconds = time.perf_counter() - start
+
+    results = [{
+        "workers": 0,
+        "rows": len(frame),
+        "seconds": serial_seconds,
+        "rows_per_sec": len(frame) / serial_seconds,
+        "identical": True
+    }]
+    for workers in worker_counts:
+        with ParallelBatchScorer(model_path, workers, use_compiled) as scorer:
+            scorer.warm_up()
+            start = time.perf_counter()
+            predictions = scorer.predict(frame)
+            seconds = time.perf_counter() - start
+        results.append({
+            "workers": workers,
+            "rows": len(frame),
+            "seconds": seconds,
+            "rows_per_sec": len(frame) / seconds,
+            "identical": predictions.tobytes() == serial.tobytes()
+        })
+    return pd.DataFrame(results)
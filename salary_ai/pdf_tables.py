@@ -0,0 +1,176 @@
+# pdf_tables.py - page-parallel PDF table extraction (no Java)
+"""Employee tables from PDF uploads, extracted with pdfplumber.
+
+Pages are split into runs of PDF_PAGES_PER_TASK and extracted by a spawn
+process pool; each worker receives the PDF bytes once, at start-up.
+Small files are extracted in-process, since starting workers would cost
+more than the pages. Tables come back in page order. A table whose first
+row names a required column starts a new header. Other tables continue
+the previous header, which is how multi-page payroll tables usually
+break. Cells are parsed to numbers where a whole column is numeric.
+"""
+import io
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+from salary_ai.config import PDF_PAGES_PER_TASK, PDF_PARALLEL_MIN_PAGES, REQUIRED_COLUMNS
+from salary_ai.errors import BatchValidationError, SalarySystemError
+
+# Fallback for tables drawn without ruling lines
+_TEXT_STRATEGY = {"vertical_strategy": "text", "horizontal_strategy": "text"}
+
+
+def _require_pdfplumber():
+    try:
+        import pdfplumber
+    except ImportError:
+        raise SalarySystemError("PDF processing requires pdfplumber. Please install: `pip install pdfplumber`")
+    return pdfplumber
+
+
+def _read_bytes(source) -> bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    source.seek(0)
+    data = source.read()
+    source.seek(0)
+    return data
+
+
+# -------------------------------
+# PAGE EXTRACTION (runs in workers)
+# -------------------------------
+_worker_pdf = None
+
+
+def _open(data: bytes):
+    return _require_pdfplumber().open(io.BytesIO(data))
+
+
+def _init_worker(data: bytes):
+    # Runs once per worker process, so the PDF is parsed once per worker
+    global _worker_pdf
+    _worker_pdf = _open(data)
+
+
+def _page_tables(page) -> List[List[list]]:
+    tables = page.extract_tables() or page.extract_tables(_TEXT_STRATEGY)
+    return [[row for row in table if any(cell not in (None, "") for cell in row)] for table in tables]
+
+
+def _extract_pages(pages: range, pdf=None) -> List[List[list]]:
+    pdf = pdf or _worker_pdf
+    tables = []
+    for number in pages:
+        page = pdf.pages[number]
+        tables.extend(_page_tables(page))
+        page.flush_cache()
+    return tables
+
+
+# -------------------------------
+# TABLES -> FRAMES
+# -------------------------------
+def _clean(cell):
+    if cell is None:
+        return None
+    cell = " ".join(str(cell).split())
+    return cell or None
+
+
+def _is_header(row: list) -> bool:
+    return any(_clean(cell) in REQUIRED_COLUMNS for cell in row)
+
+
+def _unformat(cell):
+    return cell.replace(",", "") if isinstance(cell, str) else cell
+
+
+def _typed(frame: pd.DataFrame) -> pd.DataFrame:
+    for col in frame.columns:
+        values = frame[col]
+        if values.dtype != object:
+            continue
+        numbers = pd.to_numeric(values.map(_unformat), errors="coerce")
+        if numbers.notna().sum() == values.notna().sum():
+            frame[col] = numbers
+    return frame
+
+
+class _TableAssembler:
+    """Turns raw page tables into frames, carrying the header across pages."""
+
+    def __init__(self):
+        self.header = None
+
+    def frames(self, tables: List[List[list]]) -> Iterator[pd.DataFrame]:
+        for table in tables:
+            if not table:
+                continue
+            if _is_header(table[0]):
+                self.header = [_clean(c) or f"column_{i}" for i, c in enumerate(table[0])]
+                table = table[1:]
+            if self.header is None or not table:
+                continue
+            width = len(self.header)
+            rows = [[_clean(c) for c in row[:width]] + [None] * (width - len(row)) for row in table]
+            yield _typed(pd.DataFrame(rows, columns=self.header, dtype=object))
+
+
+# -------------------------------
+# PUBLIC API
+# -------------------------------
+def iter_pdf_tables(source, workers: Optional[int] = None,
+                    pages_per_task: int = PDF_PAGES_PER_TASK) -> Iterator[pd.DataFrame]:
+    """Yield the PDF's employee tables as frames, in page order, as pages finish."""
+    data = _read_bytes(source)
+    pdf = _open(data)
+    n_pages = len(pdf.pages)
+    runs = [range(start, min(start + pages_per_task, n_pages)) for start in range(0, n_pages, pages_per_task)]
+    workers = min(workers or os.cpu_count() or 1, math.ceil(n_pages / pages_per_task))
+    assembler = _TableAssembler()
+
+    if workers <= 1 or n_pages < PDF_PARALLEL_MIN_PAGES:
+        with pdf:
+            for run in runs:
+                yield from assembler.frames(_extract_pages(run, pdf))
+        return
+
+    pdf.close()
+    # spawn: the app process runs background threads that must not be forked
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(data,)) as pool:
+        # Executor.map yields results in submission order
+        for tables in pool.map(_extract_pages, runs):
+            yield from assembler.frames(tables)
+
+
+def read_pdf_tables(source, workers: Optional[int] = None) -> pd.DataFrame:
+    """All of the PDF's employee tables as one frame."""
+    frames = list(iter_pdf_tables(source, workers))
+    if not frames:
+        raise BatchValidationError("No tables with the required columns found in PDF")
+    return _typed(pd.concat(frames, ignore_index=True))
+
+
+class PdfChunkReader:
+    """Chunk reader (see ``salary_ai.batch``) over a PDF's tables, for ``score_stream``."""
+
+    def __init__(self, source, workers: Optional[int] = None):
+        self.source = source
+        self.workers = workers
+        self.chunk_size = None
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter_pdf_tables(self.source, self.workers)
+
+    def fraction(self) -> Optional[float]:
+        return None
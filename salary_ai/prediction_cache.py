@@ -0,0 +1,205 @@
+# prediction_cache.py - process-wide LRU cache of predictions
+"""Bounded LRU cache keyed on the canonical feature row.
+
+A key is the model version, then the model's input features in a fixed
+column order. Numbers are normalised to float and missing values to None.
+The same keys are built for single rows and for small batch frames, so
+both paths hit each other's entries.
+
+The market index is snapped to a bucket (MARKET_INDEX_BUCKET) before the
+row is keyed and before it is scored, so quotes a few cents apart share
+an entry and a hit returns exactly what scoring the row would. Batches
+larger than PREDICTION_CACHE_MAX_ROWS (streaming and parallel chunks) are
+scored directly: keying every row in Python would cost more than the
+vectorised scoring it saves, and their rows would only evict the
+interactive entries.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.config import MARKET_INDEX_BUCKET, PREDICTION_CACHE_MAX_ROWS, PREDICTION_CACHE_SIZE
+from salary_ai.features import MARKET_COLUMNS
+
+
+def _normalise(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (bool, int, float)):
+        return None if value != value else float(value)
+    return value
+
+
+def _column_values(column: pd.Series) -> list:
+    if pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype):
+        values = column.to_numpy(dtype=np.float64)
+        missing = np.isnan(values)
+        values = values.tolist()
+        if missing.any():
+            for i in np.flatnonzero(missing):
+                values[i] = None
+        return values
+    return [_normalise(v) for v in column.astype(object).where(column.notna(), None).tolist()]
+
+
+def snap_market_index(market_index, bucket: float = MARKET_INDEX_BUCKET):
+    """Snap a market index (a scalar or an array) to its bucket; the value rows are scored at."""
+    if market_index is None or not bucket:
+        return market_index
+    if np.ndim(market_index):
+        return np.round(np.asarray(market_index, dtype=np.float64) / bucket) * bucket
+    return round(float(market_index) / bucket) * bucket
+
+
+class PredictionCache:
+    """Thread-safe LRU map from canonical feature keys to predictions."""
+
+    def __init__(self, max_entries: int = PREDICTION_CACHE_SIZE,
+                 market_bucket: float = MARKET_INDEX_BUCKET):
+        self.max_entries = max_entries
+        self.market_bucket = market_bucket
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def bucket(self, market_index):
+        """Snap a market index (a scalar or an array) to its bucket."""
+        return snap_market_index(market_index, self.market_bucket)
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get_many(self, keys: Sequence) -> list:
+        with self._lock:
+            entries = self._entries
+            values = [entries.get(key) for key in keys]
+            for key, value in zip(keys, values):
+                if value is not None:
+                    entries.move_to_end(key)
+            found = sum(value is not None for value in values)
+            self.hits += found
+            self.misses += len(values) - found
+            return values
+
+    def put_many(self, items):
+        with self._lock:
+            entries = self._entries
+            for key, value in items:
+                entries[key] = value
+                entries.move_to_end(key)
+            overflow = len(entries) - self.max_entries
+            for _ in range(max(0, overflow)):
+                entries.popitem(last=False)
+            self.evictions += max(0, overflow)
+
+    def put(self, key, value: float):
+        self.put_many([(key, value)])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+class CachedPredictor:
+    """Puts a ``PredictionCache`` in front of a predict function.
+
+    ``predict`` takes a DataFrame. ``predict_row`` (optional) scores a
+    single mapping without building one. Both score the row with its
+    market index snapped to the cache bucket.
+    """
+
+    def __init__(self, predict: Callable[[pd.DataFrame], np.ndarray], feature_columns: Sequence[str],
+                 version: str, cache: PredictionCache,
+                 predict_row: Optional[Callable[[Mapping], float]] = None,
+                 max_rows: int = PREDICTION_CACHE_MAX_ROWS):
+        self.predict_fn = predict
+        self.predict_row = predict_row
+        self.columns = list(feature_columns)
+        self.version = version
+        self.cache = cache
+        self.max_rows = max_rows
+        self._market_column = next((c for c in self.columns if c in MARKET_COLUMNS), None)
+
+    def snap_row(self, row: Mapping) -> Mapping:
+        column = self._market_column
+        if column is None or _normalise(row.get(column)) is None:
+            return row
+        return {**row, column: self.cache.bucket(row[column])}
+
+    def snap_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        column = self._market_column
+        if column is None or column not in frame or not self.cache.market_bucket:
+            return frame
+        return frame.assign(**{column: self.cache.bucket(pd.to_numeric(frame[column]).to_numpy())})
+
+    def row_key(self, row: Mapping) -> tuple:
+        """Key of a row whose market index is already snapped (see ``snap_row``)."""
+        return (self.version, *(_normalise(row.get(c)) for c in self.columns))
+
+    def frame_keys(self, frame: pd.DataFrame) -> list:
+        """Keys of a frame whose market index is already snapped (see ``snap_frame``)."""
+        columns = [_column_values(frame[c]) for c in self.columns]
+        return [(self.version, *values) for values in zip(*columns)]
+
+    def predict_one(self, row: Mapping) -> float:
+        row = self.snap_row(row)
+        key = self.row_key(row)
+        value = self.cache.get(key)
+        if value is None:
+            if self.predict_row is not None:
+                value = float(self.predict_row(row))
+            else:
+                value = float(self.predict_fn(pd.DataFrame([row]))[0])
+            self.cache.put(key, value)
+        return value
+
+    def predict(self, frame: pd.DataFrame) -> np.ndarray:
+        """Score only rows not cached yet; duplicates within ``frame`` are scored once.
+
+        Frames of more than ``max_rows`` rows skip the cache and are scored whole.
+        """
+        frame = self.snap_frame(frame)
+        if len(frame) > self.max_rows:
+            return np.asarray(self.predict_fn(frame), dtype=np.float64)
+
+        keys = self.frame_keys(frame)
+        cached = self.cache.get_many(keys)
+        missing = [i for i, value in enumerate(cached) if value is None]
+        result = np.array([0.0 if v is None else v for v in cached], dtype=np.float64)
+        if not missing:
+            return result
+
+        first_seen = {}
+        for i in missing:
+            first_seen.setdefault(keys[i], i)
+        positions = np.fromiter(first_seen.values(), dtype=np.intp, count=len(first_seen))
+        scored = np.asarray(self.predict_fn(frame.iloc[positions]), dtype=np.float64).tolist()
+        self.cache.put_many(zip(first_seen.keys(), scored))
+        by_key = dict(zip(first_seen.keys(), scored))
+        result[missing] = [by_key[keys[i]] for i in missing]
+        return result
@@ -0,0 +1,172 @@
+# schema.py - typed input schema for batch uploads
+"""Declarative schema of the model's input columns.
+
+``csv_dtypes`` turns the schema into a ``read_csv(dtype=...)`` mapping, so
+text columns are parsed straight into ``category`` instead of object
+arrays. Numeric columns are left to the C parser, which already produces
+int64/float64 for clean columns; declaring them would make one malformed
+cell abort the whole upload instead of rejecting its row.
+
+``apply_schema`` then brings every declared column to its compact dtype
+(``category`` for text, ``int8``/``float32`` for numbers) and checks
+ranges with whole-column comparisons. Rows that fail any check are split
+off with a ``Reject_Reason`` instead of reaching ``model.predict``.
+Columns the schema does not declare pass through unchanged. Missing
+optional columns get their default; missing required columns raise
+BatchValidationError before any row is looked at.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.config import OPTIONAL_SKILLS
+from salary_ai.errors import BatchValidationError
+
+REJECT_REASON = "Reject_Reason"
+
+
+@dataclass(frozen=True)
+class Field:
+    name: str
+    dtype: str
+    required: bool = True
+    min: Optional[float] = None
+    max: Optional[float] = None
+    default: Optional[float] = None
+
+
+INPUT_SCHEMA: List[Field] = [
+    Field("Age", "int8", min=14, max=100),
+    Field("Gender", "category"),
+    Field("Education Level", "category"),
+    Field("Job Title", "category"),
+    Field("Years of Experience", "float32", min=0, max=60),
+    Field("Industry", "category"),
+    Field("Location", "category"),
+    Field("Company Size", "category"),
+    *[Field(skill, "int8", required=False, min=0, max=1, default=0) for skill in OPTIONAL_SKILLS],
+    # Normally set by prepare_batch from the live quote; float64 so batch rows
+    # key and score exactly like single predictions
+    Field("Market_Index", "float64", required=False, min=0)
+]
+
+
+@dataclass
+class IngestStats:
+    """Row and memory counts for one upload (or the sum over its chunks)."""
+    rows: int = 0
+    rejected: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    def __add__(self, other: "IngestStats") -> "IngestStats":
+        return IngestStats(self.rows + other.rows, self.rejected + other.rejected,
+                           self.bytes_before + other.bytes_before, self.bytes_after + other.bytes_after)
+
+    @property
+    def saved_fraction(self) -> float:
+        return 1 - self.bytes_after / self.bytes_before if self.bytes_before else 0.0
+
+    def describe(self) -> str:
+        mb = 1024 * 1024
+        return (f"{self.rows - self.rejected:,} of {self.rows:,} rows accepted; "
+                f"{self.bytes_before / mb:,.1f} MB -> {self.bytes_after / mb:,.1f} MB "
+                f"({self.saved_fraction:.0%} smaller)")
+
+
+@dataclass
+class IngestResult:
+    frame: pd.DataFrame
+    rejects: pd.DataFrame
+    stats: IngestStats
+
+
+def _frame_bytes(frame: pd.DataFrame) -> int:
+    return int(frame.memory_usage(deep=True, index=False).sum())
+
+
+def csv_dtypes(schema: Sequence[Field] = INPUT_SCHEMA) -> dict:
+    """``read_csv`` dtypes for the schema's text columns (see module docstring)."""
+    return {f.name: "category" for f in schema if f.dtype == "category"}
+
+
+def _as_text(column: pd.Series) -> pd.Series:
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Strip and blank-check the categories, not the rows; " Male" and "Male" merge into one code
+        labels = column.cat.categories.astype(str).str.strip()
+        categories = labels.unique().drop("", errors="ignore")
+        remap = np.append(categories.get_indexer(labels), -1)
+        return pd.Series(pd.Categorical.from_codes(remap[column.cat.codes.to_numpy()], categories),
+                         index=column.index)
+    text = column.where(column.isna(), column.astype(str).str.strip())
+    return text.where(text != "", None)
+
+
+def apply_schema(frame: pd.DataFrame, schema: Sequence[Field] = INPUT_SCHEMA) -> IngestResult:
+    """Typed valid rows, rejected rows (as uploaded, plus a reason) and the memory report."""
+    missing = [f.name for f in schema if f.required and f.name not in frame.columns]
+    if missing:
+        raise BatchValidationError(f"Missing required columns: {missing}")
+
+    bytes_before = _frame_bytes(frame)
+    typed = {}
+    reasons = np.full(len(frame), "", dtype=object)
+
+    def reject(mask, reason):
+        mask = np.asarray(mask)
+        if mask.any():
+            reasons[mask] = reasons[mask] + reason + "; "
+
+    for field in schema:
+        if field.name not in frame.columns:
+            if field.default is not None:
+                typed[field.name] = field.default
+            continue
+        column = frame[field.name]
+
+        if field.dtype == "category":
+            values = _as_text(column)
+            reject(values.isna(), f"{field.name} is missing")
+            typed[field.name] = values
+            continue
+
+        if column.dtype == np.float64:
+            values = column
+        elif pd.api.types.is_numeric_dtype(column.dtype):
+            values = column.astype(np.float64)
+        else:
+            values = pd.to_numeric(column, errors="coerce").astype(np.float64)
+        if field.default is not None:
+            values = values.fillna(field.default)
+        blank = values.isna()
+        reject(blank & column.notna(), f"{field.name} is not a number")
+        reject(blank & column.isna(), f"{field.name} is missing")
+        if field.min is not None:
+            reject(values < field.min, f"{field.name} below {field.min:g}")
+        if field.max is not None:
+            reject(values > field.max, f"{field.name} above {field.max:g}")
+        if field.dtype.startswith("int"):
+            reject(values.notna() & (values % 1 != 0), f"{field.name} is not a whole number")
+        typed[field.name] = values
+
+    bad = reasons != ""
+    rejects = frame[bad].assign(**{REJECT_REASON: [r.rstrip("; ") for r in reasons[bad]]})
+
+    good = ~bad
+    result = frame[good] if bad.any() else frame
+    columns = {}
+    for field in schema:
+        if field.name not in typed:
+            continue
+        values = typed[field.name]
+        if isinstance(values, pd.Series) and bad.any():
+            values = values[good]
+        values = pd.Series(values, index=result.index)
+        columns[field.name] = values if values.dtype == field.dtype else values.astype(field.dtype)
+    # assign builds a new frame, so ``frame`` (e.g. a cached upload) is never modified
+    result = result.assign(**columns)
+
+    stats = IngestStats(len(frame), int(bad.sum()), bytes_before, _frame_bytes(result))
+    return IngestResult(result, rejects, stats)
@@ -0,0 +1,159 @@
+# score.py - headless batch scoring, outside Streamlit
+"""Score a CSV, Parquet or PDF file with the trained pipeline.
+
+    python -m salary_ai.score employees.csv -o predictions.parquet \\
+        --chunk-size 100000 --workers 4 --market-index 412.5
+
+Input columns are validated and prepared exactly as on the Batch
+Prediction page (INPUT_SCHEMA, market index), and rows are scored at the
+same bucketed market index as the app's prediction cache (see
+``snap_market_index``), so a file scores the same here and in the app.
+Rows that fail the schema are skipped, and written to --rejects when it is
+given. ``--explain K``
+adds each row's top K SHAP factors (Top_<i>_Factor / Top_<i>_Impact).
+"""
+import argparse
+import os
+import sys
+from contextlib import ExitStack
+from typing import List, Optional
+
+from salary_ai.batch import CsvChunkReader, CsvSink, ParquetChunkReader, score_stream
+from salary_ai.config import BATCH_MEMORY_BUDGET, EXPLAIN_BLOCK_ROWS
+from salary_ai.errors import BatchValidationError, SalarySystemError
+from salary_ai.explain import ParallelExplainer, load_batch_explainer
+from salary_ai.export import ROW_FORMATS
+from salary_ai.market_data import MarketDataService
+from salary_ai.model_store import find_model_path, load_predictor
+from salary_ai.parallel import ParallelBatchScorer
+from salary_ai.pdf_tables import PdfChunkReader
+from salary_ai.prediction_cache import snap_market_index
+
+_EXTENSIONS = {
+    ".parquet": "parquet", ".pq": "parquet", ".pdf": "pdf",
+    ".csv.gz": "csv.gz", ".gz": "csv.gz",
+    ".arrow": "arrow", ".ipc": "arrow", ".feather": "arrow"
+}
+
+
+def _format_for(path: str, explicit: Optional[str]) -> str:
+    if explicit:
+        return explicit
+    return next((fmt for ext, fmt in _EXTENSIONS.items() if path.lower().endswith(ext)), "csv")
+
+
+def resolve_market_index(frozen: Optional[float], offline: bool):
+    """Frozen value if given, else one synchronous fetch with the usual fallback."""
+    if frozen is not None:
+        return frozen, "frozen"
+    service = MarketDataService()
+    if not offline:
+        service.refresh()
+    quote = service.get()
+    return quote.value, "live" if quote.success else "fallback"
+
+
+def at_market_bucket(predict):
+    """``predict`` on chunks whose market index is snapped to its bucket, as the app scores them.
+
+    The written Market_Index column keeps the quote itself, as in the app's results.
+    """
+    def bucketed(frame):
+        return predict(frame.assign(Market_Index=snap_market_index(frame["Market_Index"].to_numpy())))
+    return bucketed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m salary_ai.score",
+        description="Score employee records with the trained salary pipeline."
+    )
+    parser.add_argument("input", help="CSV, Parquet or PDF file with employee records")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Where to write predictions (.csv, .csv.gz, .parquet or .arrow)")
+    parser.add_argument("--input-format", choices=["csv", "parquet", "pdf"], help="Override format detection")
+    parser.add_argument("--output-format", choices=list(ROW_FORMATS), help="Override format detection")
+    parser.add_argument("--rejects", help="Write rows that fail schema validation here (CSV, with a Reject_Reason)")
+    parser.add_argument("--model", help="Path to the pipeline pickle (default: MODEL_PATHS lookup)")
+    parser.add_argument("--chunk-size", type=int, help="Rows per chunk (default: sized from --memory-budget)")
+    parser.add_argument("--memory-budget", type=int, default=BATCH_MEMORY_BUDGET // (1024 * 1024),
+                        help="Working-set budget per chunk in MB")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes per chunk (and for PDF page extraction)")
+    parser.add_argument("--market-index", type=float, help="Freeze the market index instead of fetching it")
+    parser.add_argument("--offline", action="store_true", help="Never call the market API; use the fallback")
+    parser.add_argument("--explain", type=int, default=0, metavar="K",
+                        help="Add each row's top K SHAP factors (slower; uses --workers processes)")
+    parser.add_argument("--explain-block-rows", type=int, default=EXPLAIN_BLOCK_ROWS,
+                        help="Rows per SHAP call when explaining")
+    parser.add_argument("--no-compile", action="store_true", help="Score with model.predict instead of the compiled engine")
+    parser.add_argument("-q", "--quiet", action="store_true", help="No progress output")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    input_format = _format_for(args.input, args.input_format)
+    output_format = _format_for(args.output, args.output_format)
+
+    def report(rows, fraction):
+        if not args.quiet:
+            done = f" ({fraction:.0%})" if fraction is not None else ""
+            print(f"\rScored {rows:,} records{done}", end="", file=sys.stderr, flush=True)
+
+    # Write next to the target and rename, so only a fully scored file replaces it
+    tmp_output = args.output + ".part"
+    try:
+        model_path = find_model_path(args.model)
+        market_index, market_source = resolve_market_index(args.market_index, args.offline)
+
+        with ExitStack() as stack:
+            if input_format == "parquet":
+                reader = ParquetChunkReader(args.input, args.chunk_size)
+            elif input_format == "pdf":
+                reader = PdfChunkReader(args.input, args.workers)
+            else:
+                source = stack.enter_context(open(args.input, "rb"))
+                reader = CsvChunkReader(source, args.chunk_size, args.memory_budget * 1024 * 1024)
+
+            sink = ROW_FORMATS[output_format].sink(stack.enter_context(open(tmp_output, "wb")))
+            rejects = CsvSink(stack.enter_context(open(args.rejects, "wb"))) if args.rejects else None
+
+            if args.workers > 1:
+                scorer = stack.enter_context(ParallelBatchScorer(model_path, args.workers, not args.no_compile))
+                predict = scorer.predict
+            else:
+                predict = load_predictor(model_path, not args.no_compile)
+
+            explain = None
+            if args.explain > 0 and args.workers > 1:
+                explain = stack.enter_context(
+                    ParallelExplainer(model_path, args.workers, args.explain, args.explain_block_rows))
+            elif args.explain > 0:
+                explain = load_batch_explainer(model_path, args.explain, args.explain_block_rows)
+
+            result = score_stream(reader, at_market_bucket(predict), market_index, sink, report, rejects=rejects,
+                                  explain=explain)
+        os.replace(tmp_output, args.output)
+    except BatchValidationError as e:
+        print(f"\nerror: {e}", file=sys.stderr)
+        return 2
+    except (SalarySystemError, OSError, ValueError) as e:
+        print(f"\nerror: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if os.path.exists(tmp_output):
+            os.remove(tmp_output)
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(
+        f"{result.rows:,} records in {result.chunks} chunks, {result.elapsed:.2f}s "
+        f"({result.rows_per_sec:,.0f} rows/sec), market index {market_index:.2f} ({market_source})",
+        file=sys.stderr
+    )
+    print(result.ingest.describe(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+# serve.py - asyncio HTTP scoring service with dynamic micro-batching
+"""Serve the trained pipeline over HTTP.
+
+    python -m salary_ai.serve --port 8000 --max-batch-size 64 --max-wait-ms 5
+
+Endpoints:
+    POST /predict   one record as a JSON object, or {"records": [...]}
+    GET  /metrics   latency percentiles and the batch-size histogram
+    GET  /health
+
+Concurrent requests are queued and scored together: the batcher takes
+whatever is waiting, tops the batch up until it holds ``max_batch_size``
+records or ``max_wait_ms`` has passed, and calls ``predict`` once.
+
+Each batch is checked against the batch upload schema (``apply_schema``,
+once per batch rather than per request) before it is scored. A record that
+fails gets a 400 of its own and the rest of the batch is still scored. If
+``predict`` raises anyway, the batch is rescored one record at a time, so
+one bad client never fails the requests batched with it.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.batch import missing_columns
+from salary_ai.config import (
+    MAX_BATCH_SIZE,
+    MAX_BATCH_WAIT_MS,
+    MAX_REQUEST_BYTES,
+    SERVE_HOST,
+    SERVE_PORT,
+)
+from salary_ai.features import FeaturePredictor
+from salary_ai.market_data import get_market_service
+from salary_ai.model_store import load_predictor
+from salary_ai.schema import REJECT_REASON, apply_schema
+
+# Latencies kept for the percentile window
+LATENCY_WINDOW = 10_000
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# -------------------------------
+# METRICS
+# -------------------------------
+class ServiceMetrics:
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.batch_sizes = Counter()
+        self.requests = 0
+        self.records = 0
+        self.errors = 0
+        self.started = time.time()
+
+    def record_request(self, seconds: float, records: int):
+        self.latencies.append(seconds)
+        self.requests += 1
+        self.records += records
+
+    def record_batch(self, size: int):
+        # Power-of-two buckets: 1, 2, 4, 8, ... (upper bound, inclusive)
+        self.batch_sizes[1 << max(0, size - 1).bit_length()] += 1
+
+    def snapshot(self) -> dict:
+        latencies = np.asarray(self.latencies) * 1000
+        percentiles = {}
+        if len(latencies):
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            percentiles = {"p50": round(p50, 3), "p90": round(p90, 3), "p99": round(p99, 3),
+                           "mean": round(latencies.mean(), 3), "max": round(latencies.max(), 3)}
+        batches = sum(self.batch_sizes.values())
+        return {
+            "uptime_sec": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "records": self.records,
+            "errors": self.errors,
+            "latency_ms": percentiles,
+            "batches": batches,
+            "mean_batch_size": round(self.records / batches, 2) if batches else 0.0,
+            "batch_size_histogram": {f"<={k}": v for k, v in sorted(self.batch_sizes.items())}
+        }
+
+
+# -------------------------------
+# MICRO-BATCHER
+# -------------------------------
+class MicroBatcher:
+    """Collects concurrent records and scores them in one ``predict`` call."""
+
+    def __init__(self, predict: FeaturePredictor, market_index: Callable[[], float],
+                 max_batch_size: int = MAX_BATCH_SIZE, max_wait_ms: float = MAX_BATCH_WAIT_MS,
+                 metrics: Optional[ServiceMetrics] = None):
+        self.predict = predict
+        self.market_index = market_index
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.metrics = metrics or ServiceMetrics()
+        self._queue = asyncio.Queue()
+        # One scoring thread: batches run back to back while the loop keeps accepting
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scorer")
+
+    async def submit(self, record: dict) -> float:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((record, future))
+        return await future
+
+    def _score(self, records: List[dict]) -> list:
+        """One result per record: its prediction, or the exception for that record alone."""
+        results = [None] * len(records)
+        ingest = apply_schema(pd.DataFrame.from_records(records))
+        for i, reason in ingest.rejects[REJECT_REASON].items():
+            results[i] = RequestError(400, reason)
+        valid = ingest.frame
+        if len(valid):
+            # The FeaturePredictor fills skills and the market index
+            market_index = self.market_index()
+            try:
+                predictions = np.asarray(self.predict(valid, market_index), dtype=np.float64).tolist()
+            except Exception:
+                predictions = [self._score_one(valid.iloc[i:i + 1], market_index) for i in range(len(valid))]
+            for i, value in zip(valid.index, predictions):
+                results[i] = value
+        return results
+
+    def _score_one(self, row: pd.DataFrame, market_index: float):
+        try:
+            return float(self.predict(row, market_index)[0])
+        except Exception as e:
+            return e
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            records = [record for record, _ in batch]
+            self.metrics.record_batch(len(batch))
+            try:
+                results = await loop.run_in_executor(self._executor, self._score, records)
+            except Exception as e:  # validation itself failed; nothing was scored
+                results = [e] * len(batch)
+            for (_, future), value in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(value, Exception):
+                    future.set_exception(value)
+                else:
+                    future.set_result(float(value))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+# -------------------------------
+# HTTP SERVER
+# -------------------------------
+def _parse_records(body: bytes):
+    """Return the records in a /predict body and whether it was a single object."""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise RequestError(400, "Body must be JSON")
+    single = not (isinstance(payload, dict) and "records" in payload)
+    records = [payload] if single else payload["records"]
+    if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+        raise RequestError(400, "Expected a JSON object or {\"records\": [objects]}")
+    for i, record in enumerate(records):
+        missing = missing_columns(record.keys())
+        if missing:
+            raise RequestError(400, f"Record {i} is missing required columns: {missing}")
+    return records, single
+
+
+class ScoringServer:
+    def __init__(self, batcher: MicroBatcher, host: str = SERVE_HOST, port: int = SERVE_PORT):
+        self.batcher = batcher
+        self.metrics = batcher.metrics
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def _route(self, method: str, path: str, body: bytes):
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            return 200, self.metrics.snapshot()
+        if path != "/predict":
+            raise RequestError(404, f"No route for {path}")
+        if method != "POST":
+            raise RequestError(405, "Use POST")
+
+        start = time.perf_counter()
+        records, single = _parse_records(body)
+        predictions = await asyncio.gather(*(self.batcher.submit(r) for r in records), return_exceptions=True)
+        for i, value in enumerate(predictions):
+            if isinstance(value, RequestError):
+                raise RequestError(value.status, f"Record {i}: {value}")
+            if isinstance(value, Exception):
+                raise value
+        self.metrics.record_request(time.perf_counter() - start, len(records))
+        if single:
+            return 200, {"predicted_salary": predictions[0]}
+        return 200, {"predictions": predictions}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                try:
+                    if length > MAX_REQUEST_BYTES:
+                        raise RequestError(413, f"Body larger than {MAX_REQUEST_BYTES} bytes")
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self._route(method, path.split("?", 1)[0], body)
+                except RequestError as e:
+                    self.metrics.errors += 1
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    self.metrics.errors += 1
+                    status, payload = 500, {"error": str(e)}
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                data = json.dumps(payload).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive or status == 413:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self._batch_task = asyncio.create_task(self.batcher.run())
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        self._batch_task.cancel()
+        self.batcher.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m salary_ai.serve",
+                                     description="HTTP scoring service with micro-batching.")
+    parser.add_argument("--host", default=SERVE_HOST)
+    parser.add_argument("--port", type=int, default=SERVE_PORT)
+    parser.add_argument("--model", help="Path to the pipeline pickle (default: MODEL_PATHS lookup)")
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_BATCH_WAIT_MS)
+    parser.add_argument("--market-index", type=float, help="Freeze the market index instead of refreshing it")
+    parser.add_argument("--no-compile", action="store_true", help="Score with model.predict instead of the compiled engine")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    predict = load_predictor(args.model, not args.no_compile)
+    service = None if args.market_index is not None else get_market_service()
+
+    def market_index():
+        return args.market_index if service is None else service.get().value
+
+    batcher = MicroBatcher(predict, market_index, args.max_batch_size, args.max_wait_ms)
+    server = ScoringServer(batcher, args.host, args.port)
+    print(f"Serving on http://{args.host}:{args.port} "
+          f"(max batch {args.max_batch_size}, max wait {args.max_wait_ms}ms)", file=sys.stderr)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# summary.py - single-pass, mergeable statistics of a scored batch
+"""One aggregation pass over a batch's predictions, read by every view of it.
+
+A BatchSummary wraps a SalaryCube over Job Title x Industry x Education
+Level, so the moments, min/max, quantile sketch and per-group statistics
+all come from the same cells. Summaries of chunks merge into the summary
+of the whole batch, which is how streaming scoring builds one. A summary
+of a single frame also keeps its exact quartiles; merged summaries fall
+back to the histogram sketch, accurate to CUBE_BIN_WIDTH.
+"""
+from functools import cached_property
+from typing import Dict, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.cube import SalaryCube
+
+PREDICTION = "Predicted_Salary"
+SUMMARY_DIMENSIONS = ["Job Title", "Industry", "Education Level"]
+EXACT_QUANTILES = (0.25, 0.5, 0.75)
+
+_GROUP_STATS = ["count", "mean", "median", "std", "min", "max"]
+
+
+class BatchSummary:
+    """Mergeable salary statistics of one batch (see module docstring)."""
+
+    def __init__(self, cube: Optional[SalaryCube] = None, exact: Optional[Mapping[float, float]] = None):
+        self.cube = cube
+        self.exact = dict(exact or {})
+        self._groups: Dict[str, pd.DataFrame] = {}
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, value: str = PREDICTION) -> "BatchSummary":
+        # Batches are validated against REQUIRED_COLUMNS, so every dimension is present
+        cube = SalaryCube.from_frame(frame, SUMMARY_DIMENSIONS, value=value, measures=())
+        values = frame[value].to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        exact = dict(zip(EXACT_QUANTILES, np.quantile(values, EXACT_QUANTILES))) if len(values) else {}
+        return cls(cube, exact)
+
+    def merge(self, other: "BatchSummary") -> "BatchSummary":
+        if self.cube is None or self.cube.n_rows == 0:
+            return other
+        if other.cube is None or other.cube.n_rows == 0:
+            return self
+        return BatchSummary(self.cube.merge(other.cube))
+
+    def update(self, chunk: pd.DataFrame, value: str = PREDICTION) -> "BatchSummary":
+        """Summary of everything seen so far plus ``chunk``."""
+        return self.merge(BatchSummary.from_frame(chunk, value))
+
+    # -------------------------------
+    # OVERALL
+    # -------------------------------
+    @cached_property
+    def overall(self) -> pd.Series:
+        if self.cube is None or self.cube.n_rows == 0:
+            return pd.Series({"count": 0} | {s: np.nan for s in _GROUP_STATS[1:]})
+        stats = self.cube.rollup().iloc[0]
+        if 0.5 in self.exact:
+            stats["median"] = self.exact[0.5]
+        return stats
+
+    @property
+    def rows(self) -> int:
+        return int(self.overall["count"])
+
+    @property
+    def mean(self) -> float:
+        return float(self.overall["mean"])
+
+    @property
+    def median(self) -> float:
+        return float(self.overall["median"])
+
+    @property
+    def std(self) -> float:
+        return float(self.overall["std"])
+
+    @property
+    def min(self) -> float:
+        return float(self.overall["min"])
+
+    @property
+    def max(self) -> float:
+        return float(self.overall["max"])
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Exact where this summary kept them, otherwise from the sketch."""
+        if self.rows == 0:
+            return np.full(len(qs), np.nan)
+        missing = [q for q in qs if q not in self.exact]
+        sketch = dict(zip(missing, self.cube.rollup(quantiles=missing).iloc[0, -len(missing):])) if missing else {}
+        return np.array([self.exact[q] if q in self.exact else sketch[q] for q in qs], dtype=np.float64)
+
+    # -------------------------------
+    # GROUPS
+    # -------------------------------
+    def by(self, column: str) -> pd.DataFrame:
+        """count/mean/median/std/min/max per member of ``column``, medians from the sketch."""
+        if column not in self._groups:
+            if self.cube is None or column not in self.cube.dimensions:
+                self._groups[column] = pd.DataFrame(columns=_GROUP_STATS)
+            else:
+                self._groups[column] = self.cube.rollup([column])[_GROUP_STATS]
+        return self._groups[column]
+
+    def top(self, column: str = "Job Title", k: int = 5) -> pd.Series:
+        """The ``k`` members of ``column`` with the highest average prediction."""
+        return self.by(column)["mean"].nlargest(k)
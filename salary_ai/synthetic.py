@@ -0,0 +1,80 @@
+# synthetic.py - vectorised sample data for the Data Analytics page
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+industries_list = ["Technology", "Finance", "Healthcare", "Education", "Manufacturing", "Retail", "Consulting"]
+locations_list = ["Lagos", "Abuja", "Port Harcourt", "Enugu", "Kano", "Ibadan", "Kaduna"]
+job_titles_list = [
+    "Data Scientist", "Software Engineer", "Product Manager", "HR Manager",
+    "Marketing Manager", "Sales Executive", "Financial Analyst", "DevOps Engineer"
+]
+education_list = ["High School", "Bachelor's", "Master's", "PhD"]
+company_sizes_list = ["Small", "Medium", "Large"]
+genders_list = ["Male", "Female"]
+
+# Calculate realistic salaries with market factors
+industry_multiplier = {
+    "Technology": 1.3, "Finance": 1.4, "Healthcare": 1.2,
+    "Education": 1.0, "Manufacturing": 1.1, "Retail": 0.9, "Consulting": 1.3
+}
+
+location_multiplier = {
+    "Lagos": 1.4, "Abuja": 1.3, "Port Harcourt": 1.2,
+    "Enugu": 1.0, "Kano": 0.9, "Ibadan": 1.0, "Kaduna": 0.95
+}
+
+education_bonus = {"High School": 30000, "Bachelor's": 50000, "Master's": 70000, "PhD": 90000}
+
+base_salary = 50000
+
+
+def _draw(rng: np.random.RandomState, values, size):
+    # Same draws as rng.choice(values, size), kept as category codes instead of strings
+    codes = rng.randint(0, len(values), size)
+    return codes, pd.Categorical.from_codes(codes, categories=values)
+
+
+@lru_cache(maxsize=8)
+def generate_sample_data(sample_size: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic salary population, memoised on ``(sample_size, seed)``.
+
+    The legacy RandomState draws happen in the same order as the original
+    per-row loop, so the values are unchanged; text columns are
+    categoricals. Callers share the cached frame and must not modify it
+    in place.
+    """
+    rng = np.random.RandomState(seed)
+
+    _, job_titles = _draw(rng, job_titles_list, sample_size)
+    industry_codes, industries = _draw(rng, industries_list, sample_size)
+    location_codes, locations = _draw(rng, locations_list, sample_size)
+    education_codes, education = _draw(rng, education_list, sample_size)
+    experience = rng.exponential(scale=8, size=sample_size).astype(int) + 1
+    age = rng.randint(22, 65, sample_size)
+    _, company_sizes = _draw(rng, company_sizes_list, sample_size)
+    _, genders = _draw(rng, genders_list, sample_size)
+
+    # Apply multipliers via array lookups, with one draw for all the noise
+    industry_factor = np.array([industry_multiplier[i] for i in industries_list])
+    location_factor = np.array([location_multiplier[loc] for loc in locations_list])
+    education_amount = np.array([education_bonus[e] for e in education_list], dtype=np.float64)
+
+    salary = base_salary * industry_factor[industry_codes]
+    salary *= location_factor[location_codes]
+    salary += education_amount[education_codes]
+    salary += experience * 2500  # Experience bonus
+    salary += rng.normal(0, 8000, sample_size)  # Random variation
+
+    return pd.DataFrame({
+        'Job_Title': job_titles,
+        'Industry': industries,
+        'Location': locations,
+        'Education': education,
+        'Experience': experience,
+        'Age': age,
+        'Company_Size': company_sizes,
+        'Gender': genders,
+        'Salary': np.clip(salary, 30000, 250000)
+    })
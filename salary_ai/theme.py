@@ -0,0 +1,111 @@
+# theme.py - precompiled theme stylesheets and the locally served background
+"""Light/Dark stylesheets, compiled once per (theme, page), and the background image.
+
+The CSS lives in ``salary_ai/themes/<theme>.css`` as ``string.Template``
+text. The only per-page difference is which selectors get the homepage
+background or the overlay. The background is not fetched from a CDN.
+The ``blockchain-bg.jpg.webp`` shipped with the app is written into
+Streamlit's ``static/`` folder as one variant per width, with the content
+hash in the file name. Its URL carries ``?v=<hash>``, so Tornado's static
+handler answers with a long-lived Cache-Control header. The stylesheet
+points the ``--app-background`` variable at the smallest variant that
+still covers the viewport.
+"""
+import hashlib
+import os
+import shutil
+from functools import lru_cache
+from string import Template
+from typing import Dict, Tuple
+
+from salary_ai.config import (
+    BACKGROUND_IMAGE,
+    BACKGROUND_WIDTHS,
+    HOME_PAGE,
+    STATIC_DIR,
+    STATIC_URL,
+    THEMES,
+)
+
+_THEME_DIR = os.path.join(os.path.dirname(__file__), "themes")
+_HOME_SELECTOR = 'div[data-testid="stAppViewContainer"]'
+_OVERLAY_SELECTOR = 'div[data-testid="stAppViewContainer"]:not(:has(+ div[data-testid="stAppViewContainer"]))'
+
+
+# -------------------------------
+# BACKGROUND ASSET
+# -------------------------------
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:10]
+
+
+def publish_background(source: str = BACKGROUND_IMAGE, static_dir: str = STATIC_DIR,
+                       widths: Tuple[int, ...] = BACKGROUND_WIDTHS) -> Dict[int, str]:
+    """Write the background's width variants into ``static_dir``; ``{width: url}``, narrowest first.
+
+    Variants already written for this content hash are reused. Widths above
+    the source's own are skipped; without Pillow only the original is served.
+    """
+    digest = _file_hash(source)
+    stem, ext = os.path.basename(source).split(".", 1)
+    os.makedirs(static_dir, exist_ok=True)
+
+    def publish(width, write):
+        name = f"{stem}-{digest}-{width}.{ext}"
+        path = os.path.join(static_dir, name)
+        if not os.path.exists(path):
+            write(path)
+        return f"{STATIC_URL}/{name}?v={digest}"
+
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+
+    if Image is None:
+        return {0: publish("full", lambda path: shutil.copyfile(source, path))}
+
+    with Image.open(source) as image:
+        full_width, full_height = image.size
+        urls = {}
+        for width in sorted(w for w in widths if w < full_width):
+            size = (width, round(full_height * width / full_width))
+            urls[width] = publish(width, lambda path: image.resize(size, Image.LANCZOS).save(path, quality=80))
+        urls[full_width] = publish(full_width, lambda path: shutil.copyfile(source, path))
+    return urls
+
+
+def _background_rules(urls: Dict[int, str]) -> str:
+    widths = sorted(urls)
+    rules = [f":root {{ --app-background: url('{urls[widths[-1]]}'); }}"]
+    # Larger max-width first, so the narrowest matching query wins
+    for width in reversed(widths[:-1]):
+        rules.append(f"@media (max-width: {width}px) {{ :root {{ --app-background: url('{urls[width]}'); }} }}")
+    return "\n".join(rules)
+
+
+# -------------------------------
+# STYLESHEETS
+# -------------------------------
+@lru_cache(maxsize=None)
+def _template(theme: str) -> Template:
+    with open(os.path.join(_THEME_DIR, f"{theme.lower()}.css"), encoding="utf-8") as f:
+        return Template(f.read())
+
+
+def compile_stylesheet(theme: str, page: str, background_urls: Dict[int, str]) -> str:
+    """The ``<style>`` block for ``theme`` on ``page``."""
+    home = page == HOME_PAGE
+    css = _template(theme).substitute(
+        home_selector=_HOME_SELECTOR if home else "",
+        overlay_selector=_OVERLAY_SELECTOR if not home else "",
+        overlay_before_selector=f"{_OVERLAY_SELECTOR}::before" if not home else ""
+    )
+    return f"<style>\n{_background_rules(background_urls)}\n\n{css}</style>"
+
+
+def compile_stylesheets(pages, background_urls: Dict[int, str]) -> Dict[Tuple[str, str], str]:
+    """Every (theme, page) stylesheet, for building once at startup."""
+    return {(theme, page): compile_stylesheet(theme, page, background_urls)
+            for theme in THEMES for page in pages}
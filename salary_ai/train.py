@@ -0,0 +1,221 @@
+# train.py - reproducible training entry point (replaces re-running the notebook)
+"""Select and train the salary model from the command line.
+
+    python -m salary_ai.train --data Salary_Data.csv -o best_salary_model.pkl --cv 5 --n-jobs 4
+
+This is the same training path as training.py, with a search on top.
+``prepare_split`` holds back a test split (TEST_SIZE, RANDOM_STATE) and
+fits the preprocessor once on the training rows. Its matrices are cached
+under TRAINING_CACHE_DIR, so a nightly run over unchanged data does not
+refit it. ``train_zoo`` then fits every candidate from ``get_models`` on
+those matrices, each one wrapped in a successive-halving search
+(HalvingGridSearchCV) over the same precomputed K folds. Early rounds
+score every parameter set on a small row sample; only the best third goes
+on to the next round, with three times the rows.
+
+Because the folds are taken from the already preprocessed training rows,
+each fold's validation rows have seen the preprocessor fit (imputation
+values, scaling, category vocabulary). The reported ``cv_rmse`` is
+therefore slightly optimistic. It is used to rank the candidates, which
+share the same bias; the holdout metrics are unaffected, since the test
+split is never seen by the preprocessor. The manifest records this under
+``settings.cv_preprocessing``.
+
+Each search runs ``--n-jobs`` fits at a time and the estimator inside it
+gets one thread, so the two never multiply. Alternatively ``--workers``
+searches run side by side in separate processes, one fit at a time each;
+joblib's process pool does not nest inside those workers, so the two
+options cannot both be above 1. The candidate with the best
+cross-validated RMSE is published with the split's preprocessor, written
+atomically to ``--output``, and described in a JSON manifest with its
+metrics and timings.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import joblib
+import sklearn
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (registers HalvingGridSearchCV)
+from sklearn.metrics import mean_absolute_error
+from sklearn.model_selection import HalvingGridSearchCV, KFold
+from sklearn.pipeline import Pipeline
+
+from salary_ai.config import DATA_PATH, MODEL_PATHS, RANDOM_STATE, TEST_SIZE, TRAINING_CACHE_DIR
+from salary_ai.errors import SalarySystemError
+from salary_ai.model_store import model_version
+from salary_ai.training import _with_cores, get_models, load_training_data, prepare_split, train_zoo
+from salary_ai.upload_cache import content_hash
+
+# Hyperparameter grids per candidate (estimator parameter names)
+SEARCH_SPACES: Dict[str, Dict[str, list]] = {
+    "Linear": {},
+    "Ridge": {"alpha": [0.1, 1.0, 10.0, 100.0]},
+    "RandomForest": {"n_estimators": [100, 300], "max_depth": [None, 12, 24], "min_samples_leaf": [1, 3]},
+    "GradientBoost": {"n_estimators": [100, 300], "learning_rate": [0.05, 0.1], "max_depth": [3, 5]},
+    "XGBoost": {"n_estimators": [200, 500], "learning_rate": [0.05, 0.1], "max_depth": [4, 6],
+                "subsample": [0.8, 1.0]},
+    "SVR": {"C": [1e3, 1e4, 1e5], "epsilon": [0.1, 1.0]}
+}
+
+
+# Recorded in the manifest: cv_rmse comes from folds of rows the preprocessor was fitted on
+CV_PREPROCESSING = "fitted once on the whole training split; cv_rmse is slightly optimistic, holdout metrics are not"
+
+
+def build_search(name: str, estimator, folds, factor: int = 3,
+                 random_state: int = RANDOM_STATE) -> HalvingGridSearchCV:
+    """Successive-halving search for one candidate, fitted on preprocessed matrices.
+
+    ``train_zoo`` sets the search's ``n_jobs`` to its cores per model; the
+    estimator itself is pinned to one thread so parallel fits do not
+    oversubscribe the cores.
+    """
+    return HalvingGridSearchCV(
+        _with_cores(clone(estimator), 1), SEARCH_SPACES.get(name, {}), factor=factor, cv=folds,
+        scoring="neg_root_mean_squared_error", refit=True, random_state=random_state
+    )
+
+
+def _search_summary(result) -> dict:
+    search = result.estimator
+    return {
+        "cv_rmse": float(-search.best_score_),
+        "holdout_rmse": result.rmse,
+        "best_params": search.best_params_,
+        "candidates": int(search.n_candidates_[0]) if len(search.n_candidates_) else 1,
+        "iterations": int(search.n_iterations_),
+        "wall_seconds": result.wall_seconds,
+        "cpu_seconds": result.cpu_seconds,
+        "peak_rss_mb": result.peak_rss_mb
+    }
+
+
+def _write_atomic(path: str, write):
+    tmp = path + ".part"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def run_training(data_path: str = DATA_PATH, output: str = MODEL_PATHS[0], manifest: Optional[str] = None,
+                 models: Optional[List[str]] = None, cv: int = 5, factor: int = 3, n_jobs: int = 1,
+                 workers: Optional[int] = None, random_state: int = RANDOM_STATE,
+                 cache_dir: Optional[str] = TRAINING_CACHE_DIR, log=None) -> dict:
+    """Search, select, refit and publish the best pipeline; returns the manifest.
+
+    ``cache_dir=None`` keeps the preprocessed split in a temporary folder for this run only.
+    """
+    started = time.perf_counter()
+    log = log or (lambda message: None)
+
+    if n_jobs > 1:
+        if workers:
+            raise SalarySystemError("Use either --workers or --n-jobs above 1, not both")
+        workers = 0  # the searches run one after another here, each with its own process pool
+
+    X, y = load_training_data(data_path)
+    zoo = get_models(random_state)
+    names = models or list(zoo)
+    unknown = [n for n in names if n not in zoo]
+    if unknown:
+        raise SalarySystemError(f"Unknown models {unknown}; choose from {list(zoo)}")
+
+    with ExitStack() as stack:
+        split_dir = cache_dir or stack.enter_context(tempfile.TemporaryDirectory())
+        split = prepare_split(X, y, TEST_SIZE, random_state, cache_dir=split_dir)
+        # Fixed fold indices: every candidate and every halving round sees the same folds
+        folds = list(KFold(n_splits=cv, shuffle=True, random_state=random_state).split(split.X_train))
+        searches = {name: build_search(name, zoo[name], folds, factor, random_state) for name in names}
+        log(f"Searching {', '.join(names)} ...")
+        result = train_zoo(X, y, searches, cores_per_model=n_jobs, workers=workers, test_size=TEST_SIZE,
+                           random_state=random_state, cache_dir=split_dir)
+
+    candidates = {c.name: _search_summary(c) for c in result.candidates}
+    for name, summary in candidates.items():
+        log(f"  {name}: CV RMSE {summary['cv_rmse']:,.0f} in {summary['wall_seconds']:.1f}s")
+
+    # Selected on cross-validated RMSE; the holdout split only reports the winner
+    best = max(result.candidates, key=lambda c: c.estimator.best_score_)
+    estimator = best.estimator.best_estimator_
+    pipeline = Pipeline([("prep", result.split.prep), ("model", estimator)])
+    predictions = estimator.predict(result.split.X_test)
+
+    _write_atomic(output, lambda path: joblib.dump(pipeline, path))
+    with open(data_path, "rb") as f:
+        data_hash = content_hash(f)
+    report = {
+        "model": best.name,
+        "model_path": output,
+        "model_version": model_version(output),
+        "trained_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "data": {"path": data_path, "hash": data_hash, "rows": int(len(X)),
+                 "train_rows": int(result.split.X_train.shape[0]), "test_rows": int(result.split.X_test.shape[0])},
+        "settings": {"cv": cv, "factor": factor, "random_state": random_state, "test_size": TEST_SIZE,
+                     "n_jobs": n_jobs, "workers": workers, "split_cache": bool(cache_dir),
+                     # The folds reuse the split's preprocessor (see the module docstring)
+                     "cv_preprocessing": CV_PREPROCESSING},
+        "holdout": {"RMSE": best.rmse, "MAE": float(mean_absolute_error(result.split.y_test, predictions)),
+                    "R2": best.r2},
+        "candidates": candidates,
+        "wall_seconds": time.perf_counter() - started,
+        "versions": {"python": platform.python_version(), "scikit-learn": sklearn.__version__}
+    }
+    manifest = manifest or os.path.splitext(output)[0] + ".manifest.json"
+    _write_atomic(manifest, lambda path: _dump_json(report, path))
+    return report
+
+
+def _dump_json(report: dict, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m salary_ai.train",
+                                     description="Tune, select and save the salary prediction pipeline.")
+    parser.add_argument("--data", default=DATA_PATH, help="Labelled CSV (default: %(default)s)")
+    parser.add_argument("-o", "--output", default=MODEL_PATHS[0], help="Where to write the pipeline pickle")
+    parser.add_argument("--manifest", help="Metrics/timing JSON (default: <output>.manifest.json)")
+    parser.add_argument("--models", nargs="+", help=f"Candidates to search (default: all of {list(SEARCH_SPACES)})")
+    parser.add_argument("--cv", type=int, default=5, help="Cross-validation folds")
+    parser.add_argument("--factor", type=int, default=3, help="Successive-halving elimination factor")
+    parser.add_argument("--n-jobs", type=int, default=1, help="Parallel fits per search (default: %(default)s)")
+    parser.add_argument("--workers", type=int,
+                        help="Searches run side by side (default: one per core, or 0 = one after another "
+                             "here when --n-jobs is above 1)")
+    parser.add_argument("--seed", type=int, default=RANDOM_STATE)
+    parser.add_argument("--cache-dir", default=TRAINING_CACHE_DIR, help="Preprocessed split cache")
+    parser.add_argument("--no-cache", action="store_true", help="Refit the preprocessor instead of reusing the cache")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print the manifest path")
+    args = parser.parse_args(argv)
+
+    log = None if args.quiet else (lambda message: print(message, file=sys.stderr))
+    try:
+        report = run_training(args.data, args.output, args.manifest, args.models, args.cv, args.factor,
+                              args.n_jobs, args.workers, args.seed, None if args.no_cache else args.cache_dir, log)
+    except SalarySystemError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        holdout = report["holdout"]
+        print(f"Best: {report['model']} (holdout RMSE {holdout['RMSE']:,.0f}, R2 {holdout['R2']:.3f}) "
+              f"-> {report['model_path']} in {report['wall_seconds']:.1f}s", file=sys.stderr)
+    print(args.manifest or os.path.splitext(args.output)[0] + ".manifest.json")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
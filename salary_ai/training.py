@@ -0,0 +1,333 @@
+# training.py - model-zoo training on a shared, fit-once preprocessed matrix
+"""Train the notebook's candidate models side by side.
+
+Port of the notebook's PreprocessorFactory, ModelFactory and
+ModelTrainer. The ColumnTransformer is fitted once per train/test split.
+The transformed sparse matrices are cached under TRAINING_CACHE_DIR,
+keyed by a hash of the data, the split and the preprocessor, and every
+candidate trains on them. The matrices keep the preprocessor's own output
+type (CSR or dense), so each candidate sees exactly what the published
+pipeline hands it at predict time; for XGBoost that decides whether zeros
+are read as missing values. No candidate refits the preprocessor in a
+Pipeline of its own.
+
+Candidates train concurrently in a spawn process pool. Each one gets
+``cores_per_model`` threads (threadpoolctl for BLAS/OpenMP, plus
+``n_jobs`` where the estimator has it). Each runs in a fresh worker
+process, so the peak RSS reported is its own. The winner comes back as
+the usual ``Pipeline([("prep", ...), ("model", ...)])``.
+"""
+import hashlib
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.svm import SVR
+from threadpoolctl import threadpool_limits
+
+from salary_ai.config import CORES_PER_MODEL, DATA_PATH, RANDOM_STATE, TARGET, TEST_SIZE, TRAINING_CACHE_DIR
+from salary_ai.data import load_clean_data
+from salary_ai.errors import SalarySystemError
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# -------------------------------
+# FEATURES, PREPROCESSOR & MODELS (from the notebook)
+# -------------------------------
+def split_features(df: pd.DataFrame, target: str = TARGET) -> Tuple[pd.DataFrame, pd.Series]:
+    return df.drop(columns=[target]), df[target]
+
+
+def load_training_data(path: str = DATA_PATH) -> Tuple[pd.DataFrame, pd.Series]:
+    return split_features(load_clean_data(path))
+
+
+def build_preprocessor(X: pd.DataFrame) -> ColumnTransformer:
+    num_cols = X.select_dtypes(include=np.number).columns.tolist()
+    cat_cols = X.select_dtypes(include="object").columns.tolist()
+
+    num_pipe = Pipeline([
+        ("imputer", SimpleImputer(strategy="median")),
+        ("scaler", StandardScaler())
+    ])
+    cat_pipe = Pipeline([
+        ("imputer", SimpleImputer(strategy="most_frequent")),
+        ("onehot", OneHotEncoder(handle_unknown="ignore"))
+    ])
+    return ColumnTransformer([
+        ("num", num_pipe, num_cols),
+        ("cat", cat_pipe, cat_cols)
+    ])
+
+
+def _require_xgboost():
+    try:
+        import xgboost
+    except ImportError:
+        raise SalarySystemError("The XGBoost candidate requires xgboost. Please install: `pip install xgboost`")
+    return xgboost
+
+
+def get_models(random_state: int = RANDOM_STATE) -> Dict[str, object]:
+    xgboost = _require_xgboost()
+    return {
+        "Linear": LinearRegression(),
+        "Ridge": Ridge(),
+        "RandomForest": RandomForestRegressor(random_state=random_state),
+        "GradientBoost": GradientBoostingRegressor(random_state=random_state),
+        "XGBoost": xgboost.XGBRegressor(objective="reg:squarederror", random_state=random_state),
+        "SVR": SVR()
+    }
+
+
+# -------------------------------
+# FIT-ONCE PREPROCESSED SPLIT
+# -------------------------------
+Matrix = Union[sparse.csr_matrix, np.ndarray]
+
+
+@dataclass
+class PreparedSplit:
+    """A fitted preprocessor with its transformed train/test matrices, as cached on disk."""
+    prep: ColumnTransformer
+    X_train: Matrix
+    X_test: Matrix
+    y_train: np.ndarray
+    y_test: np.ndarray
+    path: str
+
+
+_SPLIT_FILES = ("prep.joblib", "X_train.npz", "X_test.npz", "y_train.npy", "y_test.npy")
+# Part of the cache key; bumped when the on-disk layout or its contents change
+_SPLIT_FORMAT = 2
+
+
+def _split_key(X: pd.DataFrame, y: pd.Series, test_size: float, random_state: int,
+               preprocessor: ColumnTransformer) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"format={_SPLIT_FORMAT}".encode("utf-8"))
+    digest.update(",".join(map(str, X.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+    digest.update(pd.util.hash_pandas_object(y, index=False).values.tobytes())
+    digest.update(repr((test_size, random_state, preprocessor.get_params(deep=True))).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _save_matrix(path: str, X: Matrix):
+    if sparse.issparse(X):
+        sparse.save_npz(path, X)
+    else:
+        np.savez(path, dense=X)
+
+
+def _load_matrix(path: str) -> Matrix:
+    with np.load(path) as f:
+        if "dense" in f.files:
+            return f["dense"]
+    return sparse.load_npz(path)
+
+
+def load_split(path: str) -> PreparedSplit:
+    return PreparedSplit(
+        prep=joblib.load(os.path.join(path, "prep.joblib")),
+        X_train=_load_matrix(os.path.join(path, "X_train.npz")),
+        X_test=_load_matrix(os.path.join(path, "X_test.npz")),
+        y_train=np.load(os.path.join(path, "y_train.npy")),
+        y_test=np.load(os.path.join(path, "y_test.npy")),
+        path=path
+    )
+
+
+def _save_split(split: PreparedSplit):
+    # Written to a sibling folder and renamed, so a half-written split is never loaded
+    parent = os.path.dirname(split.path)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent)
+    joblib.dump(split.prep, os.path.join(tmp, "prep.joblib"))
+    _save_matrix(os.path.join(tmp, "X_train.npz"), split.X_train)
+    _save_matrix(os.path.join(tmp, "X_test.npz"), split.X_test)
+    np.save(os.path.join(tmp, "y_train.npy"), split.y_train)
+    np.save(os.path.join(tmp, "y_test.npy"), split.y_test)
+    try:
+        os.replace(tmp, split.path)
+    except OSError:  # another run cached the same split first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def prepare_split(X: pd.DataFrame, y: pd.Series, test_size: float = TEST_SIZE,
+                  random_state: int = RANDOM_STATE, preprocessor: Optional[ColumnTransformer] = None,
+                  cache_dir: str = TRAINING_CACHE_DIR) -> PreparedSplit:
+    """Split, fit the preprocessor on the training rows and transform both sides; cached on disk."""
+    preprocessor = preprocessor if preprocessor is not None else build_preprocessor(X)
+    path = os.path.abspath(os.path.join(cache_dir, _split_key(X, y, test_size, random_state, preprocessor)))
+    if all(os.path.exists(os.path.join(path, f)) for f in _SPLIT_FILES):
+        return load_split(path)
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+    prep = clone(preprocessor).fit(X_train, y_train)
+    split = PreparedSplit(
+        prep=prep,
+        X_train=prep.transform(X_train),
+        X_test=prep.transform(X_test),
+        y_train=np.asarray(y_train, dtype=np.float64),
+        y_test=np.asarray(y_test, dtype=np.float64),
+        path=path
+    )
+    _save_split(split)
+    return split
+
+
+# -------------------------------
+# CANDIDATE TRAINING
+# -------------------------------
+@dataclass
+class CandidateResult:
+    name: str
+    rmse: float
+    r2: float
+    wall_seconds: float
+    cpu_seconds: float
+    # Peak resident memory of the process that trained the candidate; None where unavailable
+    peak_rss_mb: Optional[float]
+    estimator: object
+
+
+def _peak_rss_mb() -> Optional[float]:
+    # VmHWM belongs to this process's own address space; on Linux ru_maxrss survives the
+    # exec of a spawned worker and would report the parent's peak
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _with_cores(estimator, cores: int):
+    params = estimator.get_params()
+    for name in ("n_jobs", "nthread"):
+        if name in params:
+            estimator.set_params(**{name: cores})
+    return estimator
+
+
+def fit_candidate(split: PreparedSplit, name: str, estimator, cores: int = CORES_PER_MODEL) -> CandidateResult:
+    """Fit one estimator on the split's cached training matrix and score it on the test matrix."""
+    estimator = _with_cores(estimator, cores)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        estimator.fit(split.X_train, split.y_train)
+        predictions = estimator.predict(split.X_test)
+    except Exception as e:
+        raise SalarySystemError(f"Training {name} failed: {e}")
+    return CandidateResult(
+        name=name,
+        rmse=float(np.sqrt(mean_squared_error(split.y_test, predictions))),
+        r2=float(r2_score(split.y_test, predictions)),
+        wall_seconds=time.perf_counter() - wall,
+        cpu_seconds=time.process_time() - cpu,
+        peak_rss_mb=_peak_rss_mb(),
+        estimator=estimator
+    )
+
+
+_worker_split = None
+
+
+def _init_worker(path: str, cores: int):
+    # Each worker loads the cached matrices once and caps its native thread pools
+    global _worker_split
+    threadpool_limits(limits=cores)
+    _worker_split = load_split(path)
+
+
+def _fit_in_worker(name: str, estimator, cores: int) -> CandidateResult:
+    return fit_candidate(_worker_split, name, estimator, cores)
+
+
+@dataclass
+class ZooResult:
+    split: PreparedSplit
+    candidates: List[CandidateResult]
+    wall_seconds: float
+
+    def table(self) -> pd.DataFrame:
+        """One row per candidate, best RMSE first."""
+        rows = [{
+            "model": c.name,
+            "RMSE": c.rmse,
+            "R2": c.r2,
+            "wall_s": c.wall_seconds,
+            "cpu_s": c.cpu_seconds,
+            "peak_rss_mb": c.peak_rss_mb
+        } for c in self.candidates]
+        return pd.DataFrame(rows).sort_values("RMSE").reset_index(drop=True)
+
+    @property
+    def best(self) -> CandidateResult:
+        return min(self.candidates, key=lambda c: c.rmse)
+
+    def best_pipeline(self) -> Pipeline:
+        return Pipeline([("prep", self.split.prep), ("model", self.best.estimator)])
+
+
+def train_zoo(X: pd.DataFrame, y: pd.Series, models: Optional[Dict[str, object]] = None,
+              cores_per_model: int = CORES_PER_MODEL, workers: Optional[int] = None,
+              test_size: float = TEST_SIZE, random_state: int = RANDOM_STATE,
+              cache_dir: str = TRAINING_CACHE_DIR) -> ZooResult:
+    """Fit the preprocessor once, then every candidate on its matrices.
+
+    ``workers`` defaults to the cores available divided by
+    ``cores_per_model``. With ``workers=0`` the candidates train one after
+    another in this process, and peak RSS is then the process-wide peak.
+    """
+    start = time.perf_counter()
+    split = prepare_split(X, y, test_size, random_state, cache_dir=cache_dir)
+    models = models if models is not None else get_models(random_state)
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 1) // cores_per_model)
+
+    if workers == 0:
+        candidates = [fit_candidate(split, name, clone(est), cores_per_model) for name, est in models.items()]
+    else:
+        # One process per candidate (max_tasks_per_child=1): per-model peak RSS, no leftover threads
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(models)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(split.path, cores_per_model),
+            max_tasks_per_child=1
+        ) as pool:
+            futures = [pool.submit(_fit_in_worker, name, clone(est), cores_per_model)
+                       for name, est in models.items()]
+            candidates = [f.result() for f in futures]
+    return ZooResult(split, candidates, time.perf_counter() - start)
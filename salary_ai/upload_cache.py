@@ -0,0 +1,118 @@
+# upload_cache.py - process-wide cache of per-upload batch artifacts
+"""LRU cache of parsed, prepared and scored batch frames under a memory budget.
+
+Keys start with the stage and the content hash of the uploaded bytes, so
+the same file re-uploaded (or the same upload on a rerun) maps to the
+same entries whatever its name. Scored entries also carry the model
+version and market index they were scored with. Entry sizes are measured
+with ``DataFrame.memory_usage(deep=True)``; least recently used entries
+are evicted once the total exceeds the budget. Cached frames are shared
+between reruns and sessions, so callers must copy before mutating them.
+"""
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import numpy as np
+import pandas as pd
+
+from salary_ai.config import UPLOAD_CACHE_BUDGET
+
+_HASH_BLOCK = 1024 * 1024
+
+
+def content_hash(source) -> str:
+    """Short SHA-256 of bytes or of a binary file-like object (read from the start)."""
+    digest = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        digest.update(source)
+    else:
+        source.seek(0)
+        for block in iter(lambda: source.read(_HASH_BLOCK), b""):
+            digest.update(block)
+        source.seek(0)
+    return digest.hexdigest()[:16]
+
+
+def _sizeof(value) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_sizeof(v) for v in value)
+    if dataclasses.is_dataclass(value):  # e.g. IngestResult
+        return sum(_sizeof(getattr(value, f.name)) for f in dataclasses.fields(value))
+    cube = getattr(value, "cube", None)  # BatchSummary
+    if cube is not None:
+        return _sizeof(cube.cells) + _sizeof(cube.hist)
+    return 0
+
+
+class UploadCache:
+    """Thread-safe LRU map from ``(stage, content hash, ...)`` keys to artifacts."""
+
+    def __init__(self, max_bytes: int = UPLOAD_CACHE_BUDGET):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value):
+        """Store ``value``; values larger than the whole budget are not kept."""
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        """Cached value for ``key``, computing and storing it on a miss (None is not stored)."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeRegressor
+
+from salary_ai.training import build_preprocessor, load_training_data
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Small versions of the candidates in training.get_models, so the suite trains in seconds
+ESTIMATORS = {
+    "Linear": lambda: LinearRegression(),
+    "Ridge": lambda: Ridge(),
+    "DecisionTree": lambda: DecisionTreeRegressor(max_depth=8, random_state=0),
+    "RandomForest": lambda: RandomForestRegressor(n_estimators=20, max_depth=10, random_state=0),
+    "GradientBoost": lambda: GradientBoostingRegressor(n_estimators=50, random_state=0),
+    "XGBoost": lambda: pytest.importorskip("xgboost").XGBRegressor(
+        objective="reg:squarederror", n_estimators=50, max_depth=4, random_state=0, n_jobs=1
+    ),
+}
+TREE_ESTIMATORS = ["DecisionTree", "RandomForest", "GradientBoost", "XGBoost"]
+
+
+@pytest.fixture(scope="session")
+def salary_frame():
+    """Salary_Data.csv features (missing values included) with a Market_Index column, and the target."""
+    X, y = load_training_data(os.path.join(ROOT, "Salary_Data.csv"))
+    rows = X.sample(2_000, random_state=0).index
+    X, y = X.loc[rows].reset_index(drop=True), y.loc[rows].reset_index(drop=True)
+    X["Market_Index"] = np.random.default_rng(0).normal(400.0, 25.0, len(X)).round(2)
+    return X, y
+
+
+@pytest.fixture(scope="session")
+def fit_pipeline(salary_frame):
+    """``fit_pipeline(name, sparse=True)``: a fitted prep + model Pipeline, trained once per session.
+
+    ``sparse=False`` forces dense preprocessor output; by default the
+    one-hot job titles make the ColumnTransformer emit CSR.
+    """
+    fitted = {}
+
+    def fit(name: str, sparse: bool = True) -> Pipeline:
+        if (name, sparse) not in fitted:
+            X, y = salary_frame
+            prep = build_preprocessor(X)
+            if not sparse:
+                prep.set_params(sparse_threshold=0.0)
+            fitted[name, sparse] = Pipeline([("prep", prep), ("model", ESTIMATORS[name]())]).fit(X, y)
+        return fitted[name, sparse]
+
+    return fit
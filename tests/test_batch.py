@@ -0,0 +1,103 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai.batch import (ArrowSink, CsvChunkReader, CsvSink, GzipCsvSink, ParquetSink, prepare_batch,
+                             probe_chunk_size, rows_for_budget, score_csv_stream, score_stream)
+from salary_ai.features import FeatureBuilder
+from salary_ai.schema import apply_schema
+
+MARKET = 400.0
+
+
+@pytest.fixture(scope="module")
+def upload(salary_frame):
+    """Salary_Data.csv rows in the batch upload layout, with a few invalid rows."""
+    X, _ = salary_frame
+    frame = X.drop(columns="Market_Index").head(1_000).copy()
+    frame["Industry"] = np.where(frame.index % 2, "Technology", "Finance")
+    frame["Location"] = "Lagos"
+    frame["Company Size"] = "Large"
+    frame["Skill_SQL"] = frame.index % 2
+    frame.loc[[0, 332, 333, 999], "Age"] = [-1, 200, np.nan, 15.5]
+    return frame
+
+
+@pytest.fixture(scope="module")
+def upload_csv(upload):
+    return upload.to_csv(index=False).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def predict(fit_pipeline):
+    pipeline = fit_pipeline("DecisionTree")
+    builder = FeatureBuilder.from_model(pipeline)
+    return lambda frame: pipeline.predict(builder.frame(frame))
+
+
+def test_reader_chunk_boundaries(upload_csv):
+    reader = CsvChunkReader(io.BytesIO(upload_csv), chunk_size=333)
+    chunks = list(reader)
+
+    assert [len(c) for c in chunks] == [333, 333, 333, 1]
+    assert reader.fraction() == 1.0
+    whole = pd.read_csv(io.BytesIO(upload_csv))
+    joined = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(joined.astype(whole.dtypes.to_dict()), whole)
+
+
+def test_reader_sizes_chunks_from_budget(upload, upload_csv):
+    large = pd.concat([upload] * 5).to_csv(index=False).encode("utf-8")
+    reader = CsvChunkReader(io.BytesIO(large), memory_budget=400_000)
+    sizes = [len(c) for c in reader]
+
+    # The first chunk is the probe; the rest are sized from it
+    probe = pd.read_csv(io.BytesIO(upload_csv), nrows=1_000, dtype=reader.dtype)
+    rows = rows_for_budget(probe, 400_000)
+    assert reader.chunk_size == rows > 1_000
+    assert sizes[0] == 1_000 and set(sizes[1:-1]) == {rows} and sum(sizes) == 5_000
+
+    source = io.BytesIO(upload_csv)
+    assert probe_chunk_size(source, 400_000) == reader.chunk_size
+    assert source.tell() == 0
+    assert probe_chunk_size(io.BytesIO(upload_csv), 50 * 2**20) > reader.chunk_size
+
+
+@pytest.mark.parametrize("chunk_size", [1_000, 333, 50])
+def test_stream_matches_single_frame_predict(chunk_size, upload, upload_csv, predict):
+    rejects = CsvSink()
+    result = score_csv_stream(io.BytesIO(upload_csv), predict, MARKET, chunk_size=chunk_size, rejects=rejects)
+
+    # The whole upload typed, prepared and scored in one frame
+    ingest = apply_schema(pd.read_csv(io.BytesIO(upload_csv)))
+    expected = prepare_batch(ingest.frame, MARKET)
+    expected["Predicted_Salary"] = predict(expected)
+
+    scored = pd.read_csv(result.output, float_precision="round_trip")
+    assert result.rows == len(scored) == len(expected)
+    assert result.ingest.rows == 1_000 and result.ingest.rejected == len(ingest.rejects) >= 4
+    np.testing.assert_array_equal(scored["Predicted_Salary"], expected["Predicted_Salary"])
+    np.testing.assert_array_equal(scored["Age"], expected["Age"])
+    assert result.summary.mean == pytest.approx(expected["Predicted_Salary"].mean())
+    assert len(result.preview) == 100
+    rejected = pd.read_csv(rejects.output)
+    assert len(rejected) == len(ingest.rejects)
+    assert {-2, -1, 15.5, 200} <= set(rejected["Age"].fillna(-2))
+
+
+@pytest.mark.parametrize("sink, read", [
+    (GzipCsvSink, lambda f: pd.read_csv(f, compression="gzip", float_precision="round_trip")),
+    (ParquetSink, pd.read_parquet),
+    (ArrowSink, lambda f: pytest.importorskip("pyarrow").ipc.open_file(f).read_pandas()),
+])
+def test_sinks_match_csv(sink, read, upload_csv, predict):
+    pytest.importorskip("pyarrow")
+    csv = score_stream(CsvChunkReader(io.BytesIO(upload_csv), 300), predict, MARKET, CsvSink())
+    other = score_stream(CsvChunkReader(io.BytesIO(upload_csv), 300), predict, MARKET, sink())
+
+    expected, got = pd.read_csv(csv.output, float_precision="round_trip"), read(other.output)
+    assert list(got.columns) == list(expected.columns)
+    np.testing.assert_array_equal(got["Predicted_Salary"], expected["Predicted_Salary"])
+    assert (got["Job Title"].astype(str) == expected["Job Title"].astype(str)).all()
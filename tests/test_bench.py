@@ -0,0 +1,50 @@
+import json
+
+from salary_ai.bench import compare, main, metric
+
+
+def _results(metrics, suites=("load", "predict", "batch")):
+    return {"meta": {"suites": list(suites)}, "metrics": metrics, "skipped": {}}
+
+
+BASELINE = _results({
+    "load_model.cold_ms": metric(100.0, "ms"),
+    "predict.scorer.p50_ms": metric(1.0, "ms"),
+    "batch.rows_per_s[1000]": metric(50_000.0, "rows/s", "higher"),
+    "figure.histogram_ms[1000]": metric(10.0, "ms"),
+})
+
+
+def test_compare_flags_regressions_by_direction():
+    table = compare(_results({
+        "load_model.cold_ms": metric(120.0, "ms"),
+        "predict.scorer.p50_ms": metric(1.3, "ms"),
+        "batch.rows_per_s[1000]": metric(30_000.0, "rows/s", "higher"),
+        "batch.rows_per_s[5000]": metric(1.0, "rows/s", "higher"),  # not in the baseline
+    }), BASELINE, threshold=0.25).set_index("metric")
+
+    assert list(table.index) == ["load_model.cold_ms", "predict.scorer.p50_ms", "batch.rows_per_s[1000]"]
+    assert table["regressed"].to_dict() == {"load_model.cold_ms": False, "predict.scorer.p50_ms": True,
+                                            "batch.rows_per_s[1000]": True}
+    assert not table["missing"].any()
+
+
+def test_compare_fails_on_missing_baseline_metrics():
+    # predict and batch ran but produced nothing; figures did not run, so its metric is not expected
+    table = compare(_results({"load_model.cold_ms": metric(90.0, "ms")}), BASELINE).set_index("metric")
+
+    assert table["missing"].to_dict() == {"load_model.cold_ms": False, "predict.scorer.p50_ms": True,
+                                          "batch.rows_per_s[1000]": True}
+    assert table.loc[["predict.scorer.p50_ms", "batch.rows_per_s[1000]"], "regressed"].all()
+    assert not table.loc["load_model.cold_ms", "regressed"]
+
+
+def test_skipped_suite_fails_against_baseline(tmp_path, monkeypatch):
+    # No model file in the working directory: the predict suite is skipped
+    monkeypatch.chdir(tmp_path)
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(BASELINE))
+
+    assert main(["--only", "predict", "--baseline", str(baseline)]) == 1
+    # Without a baseline there is nothing to fail against
+    assert main(["--only", "predict", "--baseline", str(tmp_path / "none.json")]) == 0
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai.compiled_model import BLOCK_SIZE, compile_pipeline
+
+from conftest import ESTIMATORS
+
+# Largest |compiled - model.predict| allowed, in salary units. The sklearn models are
+# reproduced in float64 up to summation order. XGBoost accumulates its leaf values in
+# float32 internally, while the compiled ensemble sums them in float64.
+TOLERANCE = {"XGBoost": 0.25}
+DEFAULT_TOLERANCE = 1e-6
+
+
+def _odd_rows(X: pd.DataFrame) -> pd.DataFrame:
+    """Rows the form can produce but the training data may not: unseen categories and missing values."""
+    odd = X.head(4).copy()
+    odd.loc[0, "Job Title"] = "Chief Llama Officer"
+    odd.loc[1, ["Gender", "Education Level"]] = np.nan
+    odd.loc[2, ["Age", "Years of Experience"]] = np.nan
+    odd.loc[3, "Market_Index"] = 0.0
+    return odd
+
+
+@pytest.mark.parametrize("sparse", [True, False], ids=["csr-prep", "dense-prep"])
+@pytest.mark.parametrize("name", list(ESTIMATORS))
+def test_compiled_predictor_matches_pipeline(fit_pipeline, salary_frame, name, sparse):
+    model = fit_pipeline(name, sparse)
+    X = pd.concat([salary_frame[0], _odd_rows(salary_frame[0])], ignore_index=True)
+    compiled = compile_pipeline(model)
+
+    np.testing.assert_allclose(compiled.predict(X), model.predict(X), rtol=0,
+                               atol=TOLERANCE.get(name, DEFAULT_TOLERANCE))
+
+
+@pytest.mark.parametrize("name", ["Ridge", "RandomForest", "XGBoost"])
+def test_single_rows_and_large_batches(fit_pipeline, salary_frame, name):
+    model = fit_pipeline(name)
+    compiled = compile_pipeline(model)
+    atol = TOLERANCE.get(name, DEFAULT_TOLERANCE)
+    X = salary_frame[0]
+
+    # One record as a dict of scalars, as the Single Prediction page scores it
+    for record in _odd_rows(X).to_dict("records"):
+        expected = model.predict(pd.DataFrame([record]))[0]
+        assert compiled.predict_one(record) == pytest.approx(expected, abs=atol)
+
+    # More rows than one block, as a mapping of columns
+    big = pd.concat([X] * (BLOCK_SIZE // len(X) + 2), ignore_index=True)
+    columns = {c: big[c].to_numpy() for c in big.columns}
+    np.testing.assert_allclose(compiled.predict(columns), model.predict(big), rtol=0, atol=atol)
+
+
+@pytest.mark.parametrize("name", ["Linear", "DecisionTree", "GradientBoost", "XGBoost"])
+def test_structured_array_matches_pipeline(fit_pipeline, salary_frame, name):
+    model = fit_pipeline(name)
+    X = pd.concat([salary_frame[0], _odd_rows(salary_frame[0])], ignore_index=True)
+    big = pd.concat([X] * (BLOCK_SIZE // len(X) + 2), ignore_index=True)
+    # Numeric fields as float64, text fields as objects (NaN for missing), one record per element
+    dtype = [(c, "f8" if big[c].dtype.kind in "if" else "O") for c in big.columns]
+    records = np.empty(len(big), dtype=dtype)
+    for column in big.columns:
+        records[column] = big[column].to_numpy(dtype=records.dtype[column])
+
+    np.testing.assert_allclose(compile_pipeline(model).predict(records), model.predict(big), rtol=0,
+                               atol=TOLERANCE.get(name, DEFAULT_TOLERANCE))
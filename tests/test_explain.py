@@ -0,0 +1,61 @@
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai.compiled_model import compile_pipeline
+from salary_ai.explain import BatchExplainer, Explainer, benchmark_explain
+from salary_ai.features import FeatureBuilder
+
+from conftest import TREE_ESTIMATORS
+
+pytest.importorskip("shap")
+
+# base_value + sum(contributions) must reproduce model.predict to within this many salary
+# units; shap accumulates in float64, XGBoost in float32 (see test_compiled_model)
+ATOL = 0.5
+
+
+def _rows(X: pd.DataFrame) -> pd.DataFrame:
+    rows = X.head(300).copy()
+    rows.loc[0, "Job Title"] = "Chief Llama Officer"  # unseen: all of its one-hot columns are zero
+    rows.loc[1, ["Age", "Years of Experience"]] = np.nan
+    return rows
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled-transform", "prep-transform"])
+@pytest.mark.parametrize("sparse", [True, False], ids=["csr-prep", "dense-prep"])
+@pytest.mark.parametrize("name", TREE_ESTIMATORS)
+def test_contributions_add_up_to_the_prediction(fit_pipeline, salary_frame, name, sparse, compiled):
+    model = fit_pipeline(name, sparse)
+    explainer = Explainer(model, compiled=compile_pipeline(model) if compiled else None, budget_ms=float("inf"))
+    rows = _rows(salary_frame[0])
+
+    contributions = explainer.field_contributions(rows)
+    np.testing.assert_allclose(explainer.base_value + contributions.sum(axis=1), model.predict(rows),
+                               rtol=0, atol=ATOL)
+
+    single = explainer.explain(rows.iloc[[0]].to_dict("records")[0])
+    assert single.prediction == pytest.approx(model.predict(rows.iloc[[0]])[0], abs=ATOL)
+
+
+@pytest.mark.parametrize("name", ["RandomForest", "XGBoost"])
+def test_batch_contributions_add_up_to_the_prediction(fit_pipeline, salary_frame, name):
+    model = fit_pipeline(name)
+    explainer = Explainer(model, compiled=compile_pipeline(model), budget_ms=float("inf"))
+    batch = BatchExplainer(explainer, FeatureBuilder.from_model(model), block_rows=64)
+    rows = _rows(salary_frame[0])
+
+    contributions = batch.contributions(rows)
+    # float32 storage of the per-field values
+    np.testing.assert_allclose(explainer.base_value + contributions.sum(axis=1, dtype=np.float64),
+                               model.predict(rows), rtol=1e-5, atol=ATOL)
+    top = batch(rows)
+    assert top["Top_1_Impact"].abs().ge(top["Top_2_Impact"].abs()).all()
+
+
+def test_benchmark_checks_additivity(fit_pipeline, salary_frame, tmp_path):
+    path = tmp_path / "model.pkl"
+    joblib.dump(fit_pipeline("XGBoost"), path)
+    results = benchmark_explain(_rows(salary_frame[0]), block_sizes=(128,), worker_counts=(1,), model_path=str(path))
+    assert results["matches"].all() and results["additive"].all()
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai.errors import BatchValidationError
+from salary_ai.features import DEFAULT_FEATURES, FeatureBuilder, model_feature_columns, skill_column
+
+RECORDS = pd.DataFrame({
+    "Company Size": ["Large", "Small", "Medium"],
+    "Job Title": ["Data Scientist", "Software Engineer", "Nurse"],
+    "Age": [30, 41, 25],
+    "Gender": ["Female", "Male", "Female"],
+    "Education Level": ["Master's", "PhD", "Bachelor's"],
+    "Years of Experience": [5.0, 15.0, 1.5],
+    "Industry": ["Technology", "Finance", "Healthcare"],
+    "Location": ["Lagos", "Abuja", "Lagos"],
+    "Skill_SQL": [1, 0, 1],
+    "Notes": ["dropped", "dropped", "dropped"],
+})
+SKILLS = [["SQL", "Python"], [], ["SQL", "Data Visualization"]]
+
+
+def _with_skills(records, skills):
+    records = records.copy()
+    for i, selected in enumerate(skills):
+        for skill in selected:
+            records.loc[records.index[i], skill_column(skill)] = 1
+    return records
+
+
+def test_model_columns_in_model_order(fit_pipeline, salary_frame):
+    X, _ = salary_frame
+    pipeline = fit_pipeline("Ridge")
+    assert model_feature_columns(pipeline) == list(X.columns)
+
+    builder = FeatureBuilder.from_model(pipeline)
+    shuffled = X.head(20)[list(reversed(X.columns))].assign(Extra=1)
+    built = builder.frame(shuffled)
+    assert list(built.columns) == list(X.columns)
+    pd.testing.assert_frame_equal(built, X.head(20))
+
+
+def test_build_fills_skills_and_market_and_drops_extras():
+    builder = FeatureBuilder(DEFAULT_FEATURES)
+    built = builder.frame(RECORDS, market_index=410.0)
+
+    assert list(built.columns) == DEFAULT_FEATURES
+    assert built["Skill_SQL"].tolist() == [1, 0, 1]
+    assert (built["Skill_Python"] == 0).all()
+    assert (built["Market_Index"] == 410.0).all()
+    # Without an explicit quote, either market column name in the records is used
+    alt = builder.frame(RECORDS.assign(**{"Market Index": [1.0, 2.0, 3.0]}))
+    assert alt["Market_Index"].tolist() == [1.0, 2.0, 3.0]
+    with pytest.raises(BatchValidationError, match="No market index"):
+        builder.build(RECORDS)
+    with pytest.raises(BatchValidationError, match="Job Title"):
+        builder.build(RECORDS.drop(columns="Job Title"), 400.0)
+
+
+def test_market_goes_to_the_models_column_name():
+    columns = [c if c != "Market_Index" else "Market Index" for c in DEFAULT_FEATURES]
+    built = FeatureBuilder(columns).frame(RECORDS.assign(Market_Index=[1.0, 2.0, 3.0]))
+    assert list(built.columns) == columns
+    assert built["Market Index"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_form_rows_match_batch_frame():
+    builder = FeatureBuilder(DEFAULT_FEATURES)
+    fields = RECORDS.drop(columns=["Skill_SQL", "Notes"])
+
+    form = pd.DataFrame([builder.form_row(values, skills, market_index=402.5)
+                         for values, skills in zip(fields.to_dict("records"), SKILLS)])
+    batch = builder.frame(_with_skills(fields, SKILLS).fillna(0), market_index=402.5)
+
+    assert list(form.columns) == list(batch.columns) == DEFAULT_FEATURES
+    for column in DEFAULT_FEATURES:
+        np.testing.assert_array_equal(form[column].to_numpy(dtype=object), batch[column].to_numpy(dtype=object))
+
+
+def test_form_and_batch_predictions_agree(fit_pipeline, salary_frame):
+    X, _ = salary_frame
+    pipeline = fit_pipeline("GradientBoost")
+    builder = FeatureBuilder.from_model(pipeline)
+    rows = X.dropna().head(50)
+
+    single = [pipeline.predict(pd.DataFrame([builder.form_row(values)]))[0]
+              for values in rows.to_dict("records")]
+    np.testing.assert_allclose(single, pipeline.predict(builder.frame(rows)), rtol=1e-12)
+
+
+def test_from_model_falls_back_to_defaults():
+    assert FeatureBuilder.from_model(object()).columns == DEFAULT_FEATURES
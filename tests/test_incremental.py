@@ -0,0 +1,97 @@
+import os
+
+import joblib
+import pandas as pd
+import pytest
+
+from salary_ai.config import TARGET
+from salary_ai.errors import SalarySystemError
+from salary_ai.features import FeatureBuilder
+from salary_ai.incremental import TrainingStore, prepare_labelled, update_model
+from salary_ai.model_store import model_version
+
+from conftest import ROOT
+
+DATA = os.path.join(ROOT, "Salary_Data.csv")
+
+
+@pytest.fixture
+def model_path(tmp_path, fit_pipeline):
+    path = str(tmp_path / "model.pkl")
+    joblib.dump(fit_pipeline("GradientBoost"), path)
+    return path
+
+
+def test_salary_data_layout_is_accepted(fit_pipeline):
+    builder = FeatureBuilder.from_model(fit_pipeline("GradientBoost"))
+    upload = pd.read_csv(DATA).head(300)
+    assert not {"Industry", "Location", "Company Size"} & set(upload.columns)
+
+    features, rejected = prepare_labelled(upload, builder, market_index=400.0)
+
+    assert list(features.columns) == builder.columns + [TARGET]
+    assert len(features) + rejected == len(upload.dropna(subset=[TARGET]))
+    assert len(features) > 250
+    assert (features["Market_Index"] == 400.0).all()
+
+
+def test_base_holdout_is_fixed(tmp_path):
+    data = tmp_path / "data.csv"
+    pd.read_csv(DATA).head(500).to_csv(data, index=False)
+    store = TrainingStore(str(tmp_path / "store"))
+
+    first = store.base_holdout(str(data))
+    pd.read_csv(DATA).tail(500).to_csv(data, index=False)
+    again = store.base_holdout(str(data))
+    os.remove(data)
+
+    assert len(first) == 100
+    pd.testing.assert_frame_equal(first, again)
+    pd.testing.assert_frame_equal(first, store.base_holdout(str(data)))
+
+
+def test_base_holdout_regression_blocks_publish(tmp_path, model_path):
+    # An upload whose salaries are all ten times too high: the candidate fits its own
+    # held-back rows better, but gets far worse on the original data
+    upload = pd.read_csv(DATA).dropna().sample(1_000, random_state=1)
+    upload[TARGET] *= 10
+    version = model_version(model_path)
+    store = TrainingStore(str(tmp_path / "store"))
+
+    result = update_model(upload, model_path, store, market_index=400.0, base_data=DATA)
+
+    assert result.candidate["RMSE"] < result.current["RMSE"]
+    assert result.base_candidate["RMSE"] > result.base_current["RMSE"]
+    assert result.base_rows > 1_000
+    assert not result.published and result.reason == "base holdout RMSE regressed"
+    assert model_version(model_path) == version
+    # Nothing stored: the rows cannot reach later windows, and a good upload after them publishes
+    assert store._parts("train") == store._parts("holdout") == []
+    good = pd.read_csv(DATA).dropna().sample(1_000, random_state=2)
+    result = update_model(good, model_path, store, market_index=400.0, base_data=DATA)
+    assert result.published and result.window_rows == result.holdout_rows
+    assert store._parts("train") == store._parts("holdout") == [result.part]
+
+
+def test_failed_update_can_be_retried(tmp_path, fit_pipeline):
+    path = str(tmp_path / "model.pkl")
+    joblib.dump(fit_pipeline("Ridge"), path)
+    store = TrainingStore(str(tmp_path / "store"))
+    upload = pd.read_csv(DATA).dropna().sample(1_000, random_state=2)
+
+    with pytest.raises(SalarySystemError, match="cannot be updated incrementally"):
+        update_model(upload, path, store, market_index=400.0, base_data=DATA)
+    assert store._parts("train") == []
+
+    joblib.dump(fit_pipeline("GradientBoost"), path)
+    result = update_model(upload, path, store, market_index=400.0, base_data=DATA)
+    assert result.published and result.reason == "published"
+    again = update_model(upload, path, store, market_index=400.0, base_data=DATA)
+    assert not again.published and again.reason == "upload already in the training store"
+
+
+def test_update_without_base_data_fails(tmp_path, model_path):
+    upload = pd.read_csv(DATA).dropna().head(100)
+    with pytest.raises(Exception, match="No base holdout"):
+        update_model(upload, model_path, TrainingStore(str(tmp_path / "store")), market_index=400.0,
+                     base_data=str(tmp_path / "missing.csv"))
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from salary_ai.config import LOOKUP_TOLERANCE
+from salary_ai.lookup_table import build_lookup_table, sample_form_rows, verify_lookup_table
+
+from conftest import TREE_ESTIMATORS
+
+# Keeps the XGBoost tables small; quotes outside it fall back to the model
+MARKET_RANGE = (395.0, 405.0)
+
+
+@pytest.fixture(scope="module")
+def tables(fit_pipeline):
+    built = {}
+
+    def table(name, sparse=True):
+        if (name, sparse) not in built:
+            built[name, sparse] = build_lookup_table(fit_pipeline(name, sparse), "test", market_range=MARKET_RANGE)
+        return built[name, sparse]
+
+    return table
+
+
+@pytest.mark.parametrize("sparse", [True, False], ids=["csr", "dense"])
+@pytest.mark.parametrize("name", [n for n in TREE_ESTIMATORS if n != "RandomForest"])
+def test_table_matches_model_predict(name, sparse, fit_pipeline, tables):
+    pipeline, table = fit_pipeline(name, sparse), tables(name, sparse)
+    # Every form value on the integer axes and every category, plus unseen titles and random quotes
+    frame = sample_form_rows(pipeline, 3_000, seed=1, market_range=MARKET_RANGE)
+
+    looked_up = [table.lookup(row) for row in frame.to_dict("records")]
+    found = np.array([v is not None for v in looked_up])
+    expected = pipeline.predict(frame)
+
+    assert found.mean() > 0.9
+    got = np.array([v for v in looked_up if v is not None])
+    np.testing.assert_allclose(got, expected[found], rtol=0, atol=LOOKUP_TOLERANCE)
+    # Only the 5% zero quotes, outside MARKET_RANGE, fall back
+    assert (frame.loc[~found, "Market_Index"] == 0).all()
+    assert verify_lookup_table(table, pipeline, samples=500, seed=2).ok()
+
+
+@pytest.mark.parametrize("column, value", [
+    ("Years of Experience", np.inf), ("Years of Experience", -np.inf), ("Years of Experience", np.nan),
+    ("Years of Experience", 10 ** 400), ("Age", np.inf), ("Age", 1e300),
+    ("Market_Index", np.inf), ("Market_Index", -np.inf), ("Market_Index", 1e300), ("Market_Index", np.nan),
+])
+def test_non_finite_inputs_fall_back(column, value, fit_pipeline, tables):
+    pipeline, table = fit_pipeline("DecisionTree"), tables("DecisionTree")
+    row = sample_form_rows(pipeline, 1, seed=3, market_range=MARKET_RANGE).iloc[0].to_dict()
+    assert table.lookup(row) is not None
+
+    row[column] = value
+    assert table.lookup(row) is None
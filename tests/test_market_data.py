@@ -0,0 +1,119 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from salary_ai.market_data import MarketDataService
+
+
+class _StubAlphaVantage(BaseHTTPRequestHandler):
+    # Class-level knobs the tests flip between requests
+    payload = {"Time Series (5min)": {"2026-01-02 15:55:00": {"4. close": "123.45"},
+                                       "2026-01-02 16:00:00": {"4. close": "130.5"}}}
+    status = 200
+    delay = 0.0
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        time.sleep(self.delay)
+        body = json.dumps(self.payload).encode()
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    handler = type("Handler", (_StubAlphaVantage,), {})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}/query"
+    server.shutdown()
+    server.server_close()
+
+
+def _service(url, **kwargs):
+    return MarketDataService(url=url, api_key="test", timeout=2, fallback=100.0, **kwargs)
+
+
+def test_get_never_touches_the_network(stub):
+    handler, url = stub
+    handler.delay = 1.0
+    service = _service(url)
+
+    start = time.perf_counter()
+    quote = service.get()
+    assert time.perf_counter() - start < 0.05
+    assert handler.requests == 0
+    assert quote.value == 100.0 and quote.is_fallback and quote.is_stale and not quote.success
+
+
+def test_refresh_serves_latest_close(stub):
+    handler, url = stub
+    service = _service(url, ttl=60)
+
+    assert service.refresh()
+    quote = service.get()
+    assert quote.value == 130.5
+    assert quote.success and not quote.is_stale and quote.fetched_at is not None
+    assert service.last_error is None
+
+
+def test_quote_goes_stale_after_ttl(stub):
+    _, url = stub
+    service = _service(url, ttl=0.05)
+
+    assert service.refresh()
+    time.sleep(0.1)
+    quote = service.get()
+    assert quote.value == 130.5 and quote.is_stale and not quote.is_fallback
+
+
+@pytest.mark.parametrize("status, payload", [
+    (200, {"Note": "API call frequency exceeded"}),
+    (500, {"error": "boom"}),
+])
+def test_failed_fetch_keeps_fallback_then_last_good_value(stub, status, payload):
+    handler, url = stub
+    service = _service(url)
+
+    good = handler.payload
+    handler.status, handler.payload = status, payload
+    assert not service.refresh()
+    assert service.last_error
+    assert service.get().is_fallback and service.get().value == 100.0
+
+    handler.status, handler.payload = 200, good
+    assert service.refresh()
+    handler.status, handler.payload = status, payload
+    assert not service.refresh()
+    quote = service.get()
+    assert quote.value == 130.5 and not quote.is_fallback
+
+
+def test_unreachable_endpoint_falls_back():
+    service = MarketDataService(url="http://127.0.0.1:9/query", api_key="test", timeout=0.5, fallback=100.0)
+    assert not service.refresh()
+    assert service.get().value == 100.0 and service.get().is_fallback
+
+
+def test_background_refresher_fills_the_cache(stub):
+    handler, url = stub
+    service = _service(url, refresh_interval=60).start()
+    try:
+        deadline = time.monotonic() + 5
+        while service.get().is_fallback and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert service.get().value == 130.5
+    finally:
+        service.stop(timeout=5)
+    assert handler.requests == 1
@@ -0,0 +1,38 @@
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai.model_store import load_predictor
+from salary_ai.parallel import ParallelBatchScorer
+
+
+@pytest.fixture(scope="module", params=["RandomForest", "XGBoost"])
+def model_path(request, fit_pipeline, tmp_path_factory):
+    path = tmp_path_factory.mktemp(request.param) / "best_salary_model.pkl"
+    joblib.dump(fit_pipeline(request.param), path)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def frame(salary_frame):
+    # 6,000 raw batch rows, enough for several shards per worker
+    X = salary_frame[0]
+    return pd.concat([X] * 3, ignore_index=True)
+
+
+@pytest.mark.parametrize("use_compiled", [True, False], ids=["compiled", "pipeline"])
+def test_parallel_matches_serial(model_path, frame, use_compiled):
+    serial = np.asarray(load_predictor(model_path, use_compiled)(frame))
+
+    with ParallelBatchScorer(model_path, workers=2, use_compiled=use_compiled) as scorer:
+        # Uneven shards, so the merge order is exercised across more shards than workers
+        parallel = scorer.predict(frame, shard_rows=1_234)
+
+    assert parallel.shape == serial.shape
+    assert parallel.tobytes() == serial.tobytes()
+
+
+def test_empty_frame(model_path, frame):
+    with ParallelBatchScorer(model_path, workers=1) as scorer:
+        assert scorer.predict(frame.iloc[:0]).size == 0
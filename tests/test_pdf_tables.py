@@ -0,0 +1,111 @@
+import io
+
+import pandas as pd
+import pytest
+
+from salary_ai import pdf_tables
+from salary_ai.batch import CsvSink, score_stream
+from salary_ai.config import REQUIRED_COLUMNS
+from salary_ai.errors import BatchValidationError
+from salary_ai.pdf_tables import PdfChunkReader, iter_pdf_tables, read_pdf_tables
+
+pytest.importorskip("pdfplumber")
+
+PAGES = 6
+ROWS_PER_PAGE = 5
+
+
+def _employee(i):
+    return [str(20 + i), "Female" if i % 2 else "Male", "Master's", "Data Scientist", f"{i % 10}.5",
+            "Technology", "Lagos", "Large", f"{100_000 + i * 1_000:,}"]
+
+
+def _payroll_pdf(pages=PAGES):
+    """A ruled payroll table split across pages; only the first page repeats the header."""
+    reportlab = pytest.importorskip("reportlab")
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.platypus import PageBreak, SimpleDocTemplate, Table, TableStyle
+
+    style = TableStyle([("GRID", (0, 0), (-1, -1), 0.5, reportlab.lib.colors.black),
+                        ("FONTSIZE", (0, 0), (-1, -1), 7)])
+    story = []
+    for page in range(pages):
+        rows = [_employee(page * ROWS_PER_PAGE + i) for i in range(ROWS_PER_PAGE)]
+        if page == 0:
+            rows.insert(0, REQUIRED_COLUMNS + ["Salary"])
+        story += [Table(rows, style=style), PageBreak()]
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, pagesize=landscape(A4)).build(story[:-1])
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def payroll_pdf():
+    return _payroll_pdf()
+
+
+def _check(frame, rows=PAGES * ROWS_PER_PAGE):
+    assert list(frame.columns) == REQUIRED_COLUMNS + ["Salary"]
+    # Page order is kept: Age counts up from the first page to the last
+    assert frame["Age"].tolist() == list(range(20, 20 + rows))
+    assert frame["Salary"].tolist() == [100_000 + i * 1_000 for i in range(rows)]
+    assert frame["Years of Experience"].dtype.kind == "f"
+    assert (frame["Job Title"] == "Data Scientist").all()
+
+
+def test_header_carried_across_pages(payroll_pdf):
+    frames = list(iter_pdf_tables(payroll_pdf, workers=1))
+    assert [len(f) for f in frames] == [ROWS_PER_PAGE] * PAGES
+    _check(read_pdf_tables(io.BytesIO(payroll_pdf), workers=1))
+
+
+def test_spawn_pool_keeps_page_order(payroll_pdf, monkeypatch):
+    monkeypatch.setattr(pdf_tables, "PDF_PARALLEL_MIN_PAGES", 1)
+    submitted = []
+    monkeypatch.setattr(pdf_tables, "ProcessPoolExecutor", _recording_pool(submitted))
+
+    frames = list(iter_pdf_tables(payroll_pdf, workers=2, pages_per_task=2))
+    assert submitted == [range(0, 2), range(2, 4), range(4, 6)]
+    _check(pd.concat(frames, ignore_index=True))
+
+
+def _recording_pool(submitted):
+    """The module's process pool, recording the page runs in submission order."""
+    real_pool = pdf_tables.ProcessPoolExecutor
+
+    class RecordingPool(real_pool):
+        def map(self, fn, *iterables, **kwargs):
+            runs = list(iterables[0])
+            submitted.extend(runs)
+            return super().map(fn, runs, **kwargs)
+
+    return RecordingPool
+
+
+def test_chunk_reader_streams_tables(payroll_pdf, tmp_path):
+    path = tmp_path / "payroll.pdf"
+    path.write_bytes(payroll_pdf)
+    reader = PdfChunkReader(str(path), workers=1)
+    assert reader.fraction() is None
+    _check(pd.concat(list(reader), ignore_index=True))
+
+    result = score_stream(PdfChunkReader(str(path), workers=1), lambda f: f["Age"] * 1_000.0, 400.0, CsvSink())
+    scored = pd.read_csv(result.output)
+    assert result.rows == len(scored) == PAGES * ROWS_PER_PAGE
+    assert scored["Predicted_Salary"].tolist() == [a * 1_000.0 for a in range(20, 20 + PAGES * ROWS_PER_PAGE)]
+
+
+def test_no_employee_table():
+    with pytest.raises(BatchValidationError, match="No tables"):
+        read_pdf_tables(_text_only_pdf(), workers=1)
+
+
+def _text_only_pdf():
+    pytest.importorskip("reportlab")
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer)
+    c.drawString(72, 720, "Quarterly summary: no employee table on this page.")
+    c.save()
+    return buffer.getvalue()
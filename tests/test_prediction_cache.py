@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai.compiled_model import compile_pipeline
+from salary_ai.features import FeatureBuilder
+from salary_ai.prediction_cache import CachedPredictor, PredictionCache
+
+
+@pytest.fixture
+def scoring(fit_pipeline, salary_frame):
+    model = fit_pipeline("RandomForest")
+    builder = FeatureBuilder.from_model(model)
+    compiled = compile_pipeline(model)
+    calls = []
+
+    def predict(frame):
+        calls.append(len(frame))
+        return compiled.predict(builder.build(frame))
+
+    cached = CachedPredictor(predict, builder.columns, "v1", PredictionCache(max_entries=500), compiled.predict_one,
+                             max_rows=100)
+    return cached, builder.frame(salary_frame[0]), compiled, calls
+
+
+def test_hits_equal_scoring_at_the_bucketed_index(scoring):
+    cached, frame, compiled, _ = scoring
+    row = frame.iloc[0].to_dict()
+    first = cached.predict_one({**row, "Market_Index": 412.37})
+    # A quote in the same bucket is a hit, and the hit is exactly the bucketed row's prediction
+    hit = cached.predict_one({**row, "Market_Index": 411.8})
+    assert cached.cache.hits == 1
+    assert first == hit == compiled.predict_one({**row, "Market_Index": 412.0})
+
+
+def test_single_and_small_batch_share_entries(scoring):
+    cached, frame, compiled, calls = scoring
+    small = frame.head(50)
+    expected = compiled.predict(cached.snap_frame(small))
+
+    np.testing.assert_array_equal(cached.predict(small), expected)
+    assert calls == [len(small.drop_duplicates())]
+    # Every row is now cached for both paths
+    np.testing.assert_array_equal(cached.predict(small), expected)
+    assert cached.predict_one(small.iloc[7].to_dict()) == expected[7]
+    assert calls == [len(small.drop_duplicates())]
+
+
+def test_large_batches_bypass_the_cache(scoring):
+    cached, frame, compiled, calls = scoring
+    big = frame.head(1_000)
+
+    result = cached.predict(big)
+    np.testing.assert_array_equal(result, compiled.predict(cached.snap_frame(big)))
+    assert calls == [len(big)]
+    assert cached.cache.stats()["size"] == 0 and cached.cache.misses == 0
+
+
+def test_missing_market_index_is_not_snapped(scoring):
+    cached, frame, _, _ = scoring
+    row = {**frame.iloc[0].to_dict(), "Market_Index": np.nan}
+    assert cached.snap_row(row) is row
+    assert pd.isna(cached.snap_frame(frame.head(3).assign(Market_Index=np.nan))["Market_Index"]).all()
@@ -0,0 +1,53 @@
+import io
+
+import pandas as pd
+import pytest
+
+from salary_ai.batch import CsvChunkReader
+from salary_ai.schema import REJECT_REASON, apply_schema, csv_dtypes
+
+CSV = """Age,Gender,Education Level,Job Title,Years of Experience,Industry,Location,Company Size,Skill_Python
+32,Male,Bachelor's,Software Engineer,5,Technology,Urban,Large,1
+28, Female ,Master's,Data Analyst,3,Finance,Suburban,Medium,
+abc,Male,PhD,Data Scientist,8,Technology,Urban,Small,0
+45,Female,PhD,  ,20,Healthcare,Rural,Large,1
+30.5,Male,Master's,Software Engineer,70,Technology,Urban,Large,1
+,Female,Bachelor's,Data Analyst,2,Finance,Urban,Medium,0
+"""
+
+
+def test_text_columns_are_parsed_as_categories():
+    frame = pd.read_csv(io.StringIO(CSV), dtype=csv_dtypes())
+    assert all(isinstance(frame[c].dtype, pd.CategoricalDtype) for c in csv_dtypes())
+    assert pd.api.types.is_numeric_dtype(frame["Years of Experience"].dtype)
+
+
+def test_typed_and_untyped_parses_validate_the_same():
+    typed = apply_schema(pd.read_csv(io.StringIO(CSV), dtype=csv_dtypes()))
+    plain = apply_schema(pd.read_csv(io.StringIO(CSV)))
+
+    pd.testing.assert_frame_equal(typed.frame, plain.frame, check_categorical=False)
+    assert typed.rejects[REJECT_REASON].tolist() == plain.rejects[REJECT_REASON].tolist() == [
+        "Age is not a number",
+        "Job Title is missing",
+        "Age is not a whole number; Years of Experience above 60",
+        "Age is missing",
+    ]
+    # Whitespace variants of a category collapse into one
+    assert list(typed.frame["Gender"].cat.categories) == ["Female", "Male"]
+    assert typed.frame["Skill_Python"].tolist() == [1, 0]
+
+
+def test_apply_schema_leaves_the_input_unmodified():
+    frame = pd.read_csv(io.StringIO(CSV), dtype=csv_dtypes()).head(2)
+    before = frame.copy()
+    result = apply_schema(frame)
+    assert len(result.rejects) == 0 and result.frame["Age"].dtype == "int8"
+    pd.testing.assert_frame_equal(frame, before)
+
+
+@pytest.mark.parametrize("chunk_size", [2, None])
+def test_chunk_reader_parses_typed_chunks(chunk_size):
+    chunks = list(CsvChunkReader(io.BytesIO(CSV.encode()), chunk_size))
+    assert sum(len(c) for c in chunks) == 6
+    assert all(isinstance(c["Job Title"].dtype, pd.CategoricalDtype) for c in chunks)
@@ -0,0 +1,70 @@
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai import score
+from salary_ai.config import MODEL_PATHS
+
+# Not on a bucket edge: the app scores it at 412.0
+MARKET = 412.37
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch, fit_pipeline, salary_frame):
+    """A working directory with the app's default model file and a batch upload."""
+    monkeypatch.chdir(tmp_path)
+    # Linear, so any change in the market index changes the predictions
+    joblib.dump(fit_pipeline("Ridge"), MODEL_PATHS[0])
+    X, _ = salary_frame
+    upload = X.drop(columns="Market_Index").head(500).assign(Industry="Technology", Location="Lagos")
+    upload["Company Size"] = "Large"
+    upload.to_csv("upload.csv", index=False)
+    return tmp_path
+
+
+def _app_predictions(path):
+    # The Batch Prediction page's path: parse, prepare_upload, then the Scorer's cached predict_batch
+    from app_pages import common
+    from app_pages.batch import prepare_upload
+    from salary_ai.schema import csv_dtypes
+
+    try:
+        scorer = common.Scorer(common.load_model()[0])
+        prepared = prepare_upload(pd.read_csv(path, dtype=csv_dtypes()), MARKET).frame
+        return prepared, scorer.predict_batch(prepared)
+    finally:
+        for cached in (common.load_model, common.load_model_version, common.get_prediction_cache):
+            cached.clear()
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled", "pipeline"])
+def test_cli_matches_app_batch(workdir, compiled):
+    argv = ["upload.csv", "-o", "out.csv", "--market-index", str(MARKET), "-q"]
+    assert score.main(argv + ([] if compiled else ["--no-compile"])) == 0
+
+    out = pd.read_csv("out.csv", float_precision="round_trip")
+    prepared, expected = _app_predictions("upload.csv")
+    assert len(out) == len(prepared) > 0
+    np.testing.assert_allclose(out["Predicted_Salary"], expected, rtol=1e-9)
+    # The quote itself is written, as in the app's results
+    assert (out["Market_Index"] == MARKET).all()
+    assert not os.path.exists("out.csv.part")
+
+
+def test_output_is_replaced_only_when_complete(workdir, monkeypatch):
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(score.os, "replace", lambda src, dst: replaced.append((src, dst)) or real_replace(src, dst))
+
+    assert score.main(["upload.csv", "-o", "out.parquet", "--market-index", str(MARKET), "-q"]) == 0
+    assert replaced == [("out.parquet.part", "out.parquet")]
+    first = pd.read_parquet("out.parquet")
+
+    # A failed run leaves the previous output alone and removes its partial file
+    pd.read_csv("upload.csv").drop(columns="Job Title").to_csv("bad.csv", index=False)
+    assert score.main(["bad.csv", "-o", "out.parquet", "--market-index", str(MARKET), "-q"]) == 2
+    assert len(replaced) == 1 and not os.path.exists("out.parquet.part")
+    pd.testing.assert_frame_equal(pd.read_parquet("out.parquet"), first)
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary_ai.features import FeatureBuilder, FeaturePredictor
+from salary_ai.serve import MicroBatcher, RequestError, ScoringServer
+
+MARKET = 400.0
+RECORD = {"Age": 32, "Gender": "Male", "Education Level": "Bachelor's", "Job Title": "Software Engineer",
+          "Years of Experience": 5, "Industry": "Technology", "Location": "Lagos", "Company Size": "Large"}
+
+
+@pytest.fixture
+def pipeline(fit_pipeline):
+    return fit_pipeline("DecisionTree")
+
+
+def _batcher(predict, **kwargs):
+    return MicroBatcher(predict, lambda: MARKET, **kwargs)
+
+
+def _predictor(pipeline):
+    return FeaturePredictor(pipeline.predict, FeatureBuilder.from_model(pipeline))
+
+
+async def _submit_all(batcher, records):
+    task = asyncio.create_task(batcher.run())
+    try:
+        return await asyncio.gather(*(batcher.submit(r) for r in records), return_exceptions=True)
+    finally:
+        task.cancel()
+        batcher.close()
+
+
+def _expected(pipeline, records):
+    builder = FeatureBuilder.from_model(pipeline)
+    return pipeline.predict(builder.frame(pd.DataFrame(records), MARKET))
+
+
+def test_invalid_record_fails_alone(pipeline):
+    good = [RECORD, dict(RECORD, Age=45, **{"Years of Experience": 20})]
+    records = [good[0], dict(RECORD, Age="abc"), good[1]]
+    batcher = _batcher(_predictor(pipeline), max_batch_size=8, max_wait_ms=50)
+
+    results = asyncio.run(_submit_all(batcher, records))
+
+    assert isinstance(results[1], RequestError) and results[1].status == 400
+    assert "Age is not a number" in str(results[1])
+    np.testing.assert_allclose([results[0], results[2]], _expected(pipeline, good))
+    assert batcher.metrics.batch_sizes == {4: 1}
+
+
+def test_predict_error_is_rescored_per_record(pipeline):
+    model = _predictor(pipeline)
+
+    def predict(records, market_index):
+        if (np.asarray(records["Job Title"], dtype=object) == "Boom").any():
+            raise ValueError("boom")
+        return model(records, market_index)
+
+    records = [RECORD, dict(RECORD, **{"Job Title": "Boom"}), RECORD]
+    results = asyncio.run(_submit_all(_batcher(predict, max_batch_size=8, max_wait_ms=50), records))
+
+    assert isinstance(results[1], ValueError)
+    np.testing.assert_allclose([results[0], results[2]], _expected(pipeline, [RECORD, RECORD]))
+
+
+def test_flushes_when_full(pipeline):
+    # A wait far longer than the test: only a full batch can flush this quickly
+    batcher = _batcher(_predictor(pipeline), max_batch_size=4, max_wait_ms=10_000)
+    start = time.perf_counter()
+    results = asyncio.run(_submit_all(batcher, [RECORD] * 8))
+
+    assert time.perf_counter() - start < 5
+    assert all(isinstance(r, float) for r in results)
+    assert batcher.metrics.batch_sizes == {4: 2}
+
+
+def test_flushes_on_timeout(pipeline):
+    batcher = _batcher(_predictor(pipeline), max_batch_size=64, max_wait_ms=100)
+    start = time.perf_counter()
+    results = asyncio.run(_submit_all(batcher, [RECORD] * 3))
+
+    assert time.perf_counter() - start >= 0.1
+    assert all(isinstance(r, float) for r in results)
+    assert batcher.metrics.batch_sizes == {4: 1}
+
+
+def test_bad_request_does_not_fail_batched_requests(pipeline):
+    async def post(server, payload):
+        try:
+            return await server._route("POST", "/predict", json.dumps(payload).encode())
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+
+    async def run():
+        server = ScoringServer(_batcher(_predictor(pipeline), max_batch_size=8, max_wait_ms=50))
+        task = asyncio.create_task(server.batcher.run())
+        try:
+            return await asyncio.gather(post(server, RECORD), post(server, dict(RECORD, Age="abc")),
+                                        post(server, {"records": [RECORD, dict(RECORD, Gender=" ")]}))
+        finally:
+            task.cancel()
+            server.batcher.close()
+
+    ok, bad, mixed = asyncio.run(run())
+
+    assert ok[0] == 200 and ok[1]["predicted_salary"] == pytest.approx(_expected(pipeline, [RECORD])[0])
+    assert bad == (400, {"error": "Record 0: Age is not a number"})
+    assert mixed == (400, {"error": "Record 1: Gender is missing"})
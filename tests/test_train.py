@@ -0,0 +1,45 @@
+import json
+
+import joblib
+import pandas as pd
+import pytest
+
+from salary_ai.errors import SalarySystemError
+from salary_ai.train import CV_PREPROCESSING, build_search, run_training
+from salary_ai.training import _with_cores, get_models
+
+from conftest import ROOT
+
+
+def test_search_runs_fits_in_parallel_with_single_threaded_estimators():
+    search = build_search("XGBoost", get_models()["XGBoost"], folds=3)
+    # train_zoo gives the search its cores; the estimator inside keeps one thread
+    search = _with_cores(search, 4)
+    assert search.n_jobs == 4
+    assert search.estimator.n_jobs == 1
+
+
+def test_run_training_publishes_the_zoo_split(tmp_path):
+    data = tmp_path / "data.csv"
+    pd.read_csv(f"{ROOT}/Salary_Data.csv").head(1_500).to_csv(data, index=False)
+    output = tmp_path / "model.pkl"
+
+    report = run_training(str(data), str(output), models=["Linear", "Ridge"], cv=3, workers=0,
+                          cache_dir=str(tmp_path / "cache"))
+
+    model = joblib.load(output)
+    assert report["model"] in ("Linear", "Ridge")
+    assert type(model.named_steps["model"]).__name__ == ("LinearRegression" if report["model"] == "Linear" else "Ridge")
+    assert set(report["candidates"]) == {"Linear", "Ridge"}
+    best = report["candidates"][report["model"]]
+    assert best["cv_rmse"] == min(c["cv_rmse"] for c in report["candidates"].values())
+    assert best["holdout_rmse"] == report["holdout"]["RMSE"]
+    # The shared preprocessor fit behind the CV scores is disclosed
+    assert report["settings"]["cv_preprocessing"] == CV_PREPROCESSING
+    with open(tmp_path / "model.manifest.json") as f:
+        assert json.load(f)["model_version"] == report["model_version"]
+
+
+def test_parallel_searches_and_parallel_fits_do_not_nest(tmp_path):
+    with pytest.raises(SalarySystemError, match="not both"):
+        run_training(f"{ROOT}/Salary_Data.csv", str(tmp_path / "model.pkl"), n_jobs=2, workers=2)
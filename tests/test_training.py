@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.model_selection import train_test_split
+
+from salary_ai.config import RANDOM_STATE, TEST_SIZE
+from salary_ai.training import build_preprocessor, load_split, prepare_split, train_zoo
+
+from conftest import ESTIMATORS
+
+
+@pytest.mark.parametrize("dense", [False, True], ids=["csr-prep", "dense-prep"])
+def test_split_keeps_the_preprocessor_output_type(salary_frame, tmp_path, dense):
+    X, y = salary_frame
+    prep = build_preprocessor(X).set_params(sparse_threshold=0.0) if dense else build_preprocessor(X)
+    split = prepare_split(X, y, preprocessor=prep, cache_dir=str(tmp_path))
+
+    assert isinstance(split.X_train, np.ndarray) == dense
+    assert sparse.issparse(split.X_train) != dense
+    _, X_test, _, _ = train_test_split(X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE)
+    expected = split.prep.transform(X_test)
+    cached = load_split(split.path)
+    assert type(cached.X_test) is type(expected)
+    np.testing.assert_array_equal(sparse.csr_matrix(cached.X_test).toarray(), sparse.csr_matrix(expected).toarray())
+
+
+@pytest.mark.parametrize("dense", [False, True], ids=["csr-prep", "dense-prep"])
+def test_zoo_winner_scores_like_its_training_matrix(salary_frame, tmp_path, dense, monkeypatch):
+    # XGBoost reads CSR zeros as missing: the published pipeline must feed it what it trained on
+    X, y = salary_frame
+    if dense:
+        import salary_ai.training as training
+
+        build = training.build_preprocessor
+        monkeypatch.setattr(training, "build_preprocessor", lambda X: build(X).set_params(sparse_threshold=0.0))
+    zoo = train_zoo(X, y, {"XGBoost": ESTIMATORS["XGBoost"]()}, workers=0, cache_dir=str(tmp_path))
+
+    _, X_test, _, _ = train_test_split(X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE)
+    np.testing.assert_array_equal(zoo.best_pipeline().predict(X_test), zoo.best.estimator.predict(zoo.split.X_test))